@@ -0,0 +1,154 @@
+"""
+Benchmark das idas ao banco no ciclo de vida de um job (upload -> claim ->
+conclusão), comparando o caminho atual com o antigo (SELECT + UPDATE de
+todas as colunas + refresh a cada atualização).
+
+Usa o DATABASE_URL do ambiente (ou de apps/api/.env).
+
+Uso (a partir de apps/api):
+    PYTHONPATH=src python benchmarks/bench_job_round_trips.py --jobs 200
+"""
+
+import argparse
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from app.config import config
+from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.conversion_type import ConversionType
+from app.infra.db.db import Base, SessionLocal, get_engine
+from app.infra.models.document_job_model import DocumentJobModel
+from app.infra.models.client_storage_model import ClientStorageModel
+from app.repositories.client_storage_repository import ClientStorageRepository
+from app.repositories.document_repository import DocumentRepository
+
+
+class RoundTripCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+def _new_job() -> DocumentJob:
+    job_id = uuid4()
+    return DocumentJob(
+        id=job_id,
+        conversion_type=ConversionType.CSV_TO_JSON,
+        input_filename="input.csv",
+        input_path=f"/tmp/bench/{job_id}_input.csv",
+        output_path=f"/tmp/bench/{job_id}.json",
+    )
+
+
+def _current(db, client_id) -> None:
+    job_repo = DocumentRepository(db)
+    storage_repo = ClientStorageRepository(db)
+
+    job = _new_job()
+    job_repo.save(job)
+
+    job = job_repo.claim(job.id, config.JOB_LEASE_SECONDS)
+    job.mark_completed(job.output_path)
+    job_repo.update_status(job)
+    storage_repo.update_size(client_id, 1024)
+
+
+def _legacy_update(db, job: DocumentJob) -> None:
+    model = db.query(DocumentJobModel).filter(DocumentJobModel.id == job.id).first()
+    for column in (
+        "conversion_type",
+        "input_filename",
+        "input_path",
+        "output_path",
+        "status",
+        "error_message",
+        "created_at",
+        "updated_at",
+        "expires_at",
+    ):
+        setattr(model, column, getattr(job, column))
+    db.commit()
+    db.refresh(model)
+
+
+def _legacy(db, client_id) -> None:
+    job_repo = DocumentRepository(db)
+
+    job = _new_job()
+    model = job_repo._to_model(job)
+    db.add(model)
+    db.commit()
+    db.refresh(model)
+    _legacy_update(db, job)
+
+    job = job_repo.get_by_id(job.id)
+    job.mark_processing()
+    _legacy_update(db, job)
+    job.mark_completed(job.output_path)
+    _legacy_update(db, job)
+
+    storage = db.query(ClientStorageModel).filter_by(client_id=client_id).first()
+    storage.size_bytes = 1024
+    storage.last_calculated_at = datetime.utcnow()
+    db.commit()
+    db.refresh(storage)
+
+
+def _measure(name: str, lifecycle, jobs: int, client_id) -> None:
+    engine = get_engine()
+    counter = RoundTripCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    event.listen(engine, "commit", counter)
+    event.listen(engine, "rollback", counter)
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        for _ in range(jobs):
+            lifecycle(db, client_id)
+        elapsed = time.perf_counter() - started
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", counter)
+        event.remove(engine, "commit", counter)
+        event.remove(engine, "rollback", counter)
+
+    print(
+        f"{name:>8} {counter.count / jobs:>14.1f} "
+        f"{elapsed / jobs * 1000:>14.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=200)
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=get_engine())
+    client_id = uuid4()
+
+    db = SessionLocal()
+    ClientStorageRepository(db).get_or_create(client_id)
+    db.close()
+
+    print(f"{'caminho':>8} {'idas/job':>14} {'ms/job':>14}")
+    try:
+        _measure("antigo", _legacy, args.jobs, client_id)
+        _measure("atual", _current, args.jobs, client_id)
+    finally:
+        db = SessionLocal()
+        db.query(DocumentJobModel).filter(
+            DocumentJobModel.input_path.like("/tmp/bench/%")
+        ).delete(synchronize_session=False)
+        db.query(ClientStorageModel).filter_by(client_id=client_id).delete()
+        db.commit()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark do conversor TXT -> PDF: páginas/segundo e pico de RSS.
+
+Uso (a partir de apps/api):
+    PYTHONPATH=src python benchmarks/bench_txt_to_pdf.py --sizes 1 10 100
+"""
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+
+import pdfplumber
+
+
+LINE = "2024-01-01 12:00:00 INFO [worker] processando requisição com acentuação\n"
+
+
+def _generate(path: Path, size_mb: int) -> None:
+    block = LINE * 1000
+    target = size_mb * 1024 * 1024
+    with path.open("w", encoding="utf-8") as f:
+        written = 0
+        while written < target:
+            f.write(block)
+            written += len(block.encode("utf-8"))
+
+
+def _run(input_path: str, output_path: str, result_queue) -> None:
+    from app.workers.converters.txt_to_pdf import convert
+
+    started = time.perf_counter()
+    convert(input_path, output_path)
+    elapsed = time.perf_counter() - started
+
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result_queue.put((elapsed, peak_rss_kb))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10])
+    args = parser.parse_args()
+
+    print(
+        f"{'entrada':>10} {'páginas':>8} {'tempo (s)':>10} "
+        f"{'pág/s':>8} {'pico RSS':>10}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size_mb in args.sizes:
+            input_path = Path(tmp_dir) / f"input_{size_mb}mb.txt"
+            output_path = Path(tmp_dir) / f"output_{size_mb}mb.pdf"
+            _generate(input_path, size_mb)
+
+            # Cada medição roda em um processo novo para isolar o pico de RSS.
+            result_queue = multiprocessing.Queue()
+            process = multiprocessing.Process(
+                target=_run, args=(str(input_path), str(output_path), result_queue)
+            )
+            process.start()
+            elapsed, peak_rss_kb = result_queue.get()
+            process.join()
+
+            with pdfplumber.open(output_path) as pdf:
+                pages = len(pdf.pages)
+
+            print(
+                f"{size_mb:>8} MB {pages:>8} {elapsed:>10.2f} "
+                f"{pages / elapsed:>8.1f} {peak_rss_kb / 1024:>7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,81 @@ class Config:
     FLASK_PORT = int(os.getenv("FLASK_PORT", 4000))
     FLASK_DEBUG = os.getenv("FLASK_DEBUG", "True").lower() in ("true", "1", "yes")
     FLASK_ENV = os.getenv("FLASK_ENV", "development")
+    JSON_INDENT = int(os.getenv("JSON_INDENT", 4))
+    CSV_TO_XLSX_AS_TEXT = os.getenv("CSV_TO_XLSX_AS_TEXT", "False").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    XLSX_READER_ENGINE = os.getenv("XLSX_READER_ENGINE", "openpyxl")
+    CONVERTER_MAX_WORKERS = int(os.getenv("CONVERTER_MAX_WORKERS", os.cpu_count() or 1))
+    UNOSERVER_CMD = os.getenv("UNOSERVER_CMD", "unoserver")
+    LIBREOFFICE_POOL_SIZE = int(os.getenv("LIBREOFFICE_POOL_SIZE", 0))
+    LIBREOFFICE_MAX_CONVERSIONS = int(os.getenv("LIBREOFFICE_MAX_CONVERSIONS", 200))
+    LIBREOFFICE_TIMEOUT = int(os.getenv("LIBREOFFICE_TIMEOUT", 120))
+    LIBREOFFICE_STARTUP_TIMEOUT = int(os.getenv("LIBREOFFICE_STARTUP_TIMEOUT", 60))
+    LIBREOFFICE_QUEUE_TIMEOUT = int(os.getenv("LIBREOFFICE_QUEUE_TIMEOUT", 300))
+    RESULT_CACHE_ENABLED = os.getenv("RESULT_CACHE_ENABLED", "True").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    RESULT_CACHE_MAX_BYTES = int(os.getenv("RESULT_CACHE_MAX_BYTES", 2 * 1024**3))
+    RESULT_CACHE_INFLIGHT_TTL = int(os.getenv("RESULT_CACHE_INFLIGHT_TTL", 3600))
+    BATCH_MAX_FILES = int(os.getenv("BATCH_MAX_FILES", 100))
+    BATCH_POLL_INTERVAL = int(os.getenv("BATCH_POLL_INTERVAL", 5))
+    PROGRESS_MAX_EVENTS_PER_SECOND = float(
+        os.getenv("PROGRESS_MAX_EVENTS_PER_SECOND", 2)
+    )
+    CONVERTER_ISOLATION = os.getenv("CONVERTER_ISOLATION", "True").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    CONVERTER_TIMEOUT = int(os.getenv("CONVERTER_TIMEOUT", 900))
+    CONVERTER_CPU_LIMIT = int(os.getenv("CONVERTER_CPU_LIMIT", 1800))
+    CONVERTER_MIN_MEMORY_MB = int(os.getenv("CONVERTER_MIN_MEMORY_MB", 512))
+    CONVERTER_MAX_MEMORY_MB = int(os.getenv("CONVERTER_MAX_MEMORY_MB", 4096))
+    CONVERTER_MEMORY_HEADROOM = float(os.getenv("CONVERTER_MEMORY_HEADROOM", 2))
+    CONVERTER_POOL_WORKER_MEMORY_MB = int(
+        os.getenv("CONVERTER_POOL_WORKER_MEMORY_MB", 256)
+    )
+    WORKER_POOL = os.getenv("WORKER_POOL", "prefork")
+    WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", 0))
+    WORKER_AUTOSCALE = os.getenv("WORKER_AUTOSCALE", "")
+    WORKER_QUEUES = os.getenv("WORKER_QUEUES", "")
+    WORKER_PREFETCH_MULTIPLIER = int(os.getenv("WORKER_PREFETCH_MULTIPLIER", 1))
+    FAIR_SHARE_ENABLED = os.getenv("FAIR_SHARE_ENABLED", "True").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    FAST_LANE_MAX_SECONDS = float(os.getenv("FAST_LANE_MAX_SECONDS", 2))
+    FAIR_SHARE_BACKLOG_STEP_SECONDS = float(
+        os.getenv("FAIR_SHARE_BACKLOG_STEP_SECONDS", 60)
+    )
+    FAIR_SHARE_MAX_INFLIGHT_PER_CLIENT = int(
+        os.getenv("FAIR_SHARE_MAX_INFLIGHT_PER_CLIENT", 0)
+    )
+    FAIR_SHARE_RETRY_DELAY = int(os.getenv("FAIR_SHARE_RETRY_DELAY", 5))
+    JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", 120))
+    JOB_MAX_RECOVERIES = int(os.getenv("JOB_MAX_RECOVERIES", 2))
+    STORAGE_RECONCILE_MINUTES = int(os.getenv("STORAGE_RECONCILE_MINUTES", 15))
+    STORAGE_RECONCILE_WORKERS = int(os.getenv("STORAGE_RECONCILE_WORKERS", 8))
+    WORKER_WARM_UP = os.getenv("WORKER_WARM_UP", "True").lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+    WORKER_WARM_UP_TYPES = os.getenv("WORKER_WARM_UP_TYPES", "")
+    WORKER_READY_FILE = os.getenv("WORKER_READY_FILE", "/tmp/doc-flow-worker-ready")
+    JOB_STATUS_TTL = int(os.getenv("JOB_STATUS_TTL", 86400))
+    JOB_STATUS_MAX_WAIT = int(os.getenv("JOB_STATUS_MAX_WAIT", 30))
+    JOB_STATUS_MAX_IDS = int(os.getenv("JOB_STATUS_MAX_IDS", 100))
+    SSE_HEARTBEAT_SECONDS = int(os.getenv("SSE_HEARTBEAT_SECONDS", 15))
+    SSE_RETRY_MS = int(os.getenv("SSE_RETRY_MS", 3000))
+    SSE_REPLAY_MAX_EVENTS = int(os.getenv("SSE_REPLAY_MAX_EVENTS", 500))
+    SSE_REPLAY_TTL = int(os.getenv("SSE_REPLAY_TTL", 3600))
 
 
 config = Config()
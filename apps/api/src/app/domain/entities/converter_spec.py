@@ -0,0 +1,185 @@
+from dataclasses import dataclass
+from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.converter_resource import ConverterResource
+
+
+@dataclass(frozen=True)
+class ConverterSpec:
+    conversion_type: ConversionType
+    handler: str | None
+    output_extension: str
+    streaming: bool
+    memory_mb_per_input_mb: float
+    resource: ConverterResource
+    version: int = 1
+    # Custo estimado em segundos (fixo + por MB de entrada), usado na
+    # priorização entre clientes.
+    base_seconds: float = 0.1
+    seconds_per_input_mb: float = 0.2
+    stages: tuple[ConversionType, ...] = ()
+    options: tuple[str, ...] = ()
+
+    @property
+    def is_pipeline(self) -> bool:
+        return bool(self.stages)
+
+    @property
+    def module_name(self) -> str:
+        return self.handler.rsplit(".", 1)[0]
+
+    @property
+    def func_name(self) -> str:
+        return self.handler.rsplit(".", 1)[1]
+
+    def estimate_memory_mb(self, input_size_bytes: int) -> float:
+        return self.memory_mb_per_input_mb * input_size_bytes / (1024 * 1024)
+
+    def estimate_seconds(self, input_size_bytes: int) -> float:
+        if self.is_pipeline:
+            return sum(
+                CONVERTER_SPECS[stage].estimate_seconds(input_size_bytes)
+                for stage in self.stages
+            )
+        input_mb = input_size_bytes / (1024 * 1024)
+        return self.base_seconds + self.seconds_per_input_mb * input_mb
+
+
+CONVERTER_SPECS: dict[ConversionType, ConverterSpec] = {
+    spec.conversion_type: spec
+    for spec in (
+        ConverterSpec(
+            conversion_type=ConversionType.CSV_TO_JSON,
+            handler="csv_to_json.convert",
+            output_extension="json",
+            streaming=True,
+            memory_mb_per_input_mb=0.5,
+            resource=ConverterResource.LIGHT,
+            seconds_per_input_mb=0.05,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.CSV_TO_NDJSON,
+            handler="csv_to_json.convert_ndjson",
+            output_extension="ndjson",
+            streaming=True,
+            memory_mb_per_input_mb=0.5,
+            resource=ConverterResource.LIGHT,
+            seconds_per_input_mb=0.05,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.CSV_TO_XLSX,
+            handler="csv_to_xlsx.convert",
+            output_extension="xlsx",
+            streaming=True,
+            memory_mb_per_input_mb=0.5,
+            resource=ConverterResource.CPU_BOUND,
+            seconds_per_input_mb=0.5,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.CSV_TO_PARQUET,
+            handler="csv_to_columnar.convert_parquet",
+            output_extension="parquet",
+            streaming=True,
+            memory_mb_per_input_mb=0.5,
+            resource=ConverterResource.LIGHT,
+            seconds_per_input_mb=0.05,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.CSV_TO_ARROW,
+            handler="csv_to_columnar.convert_arrow",
+            output_extension="arrow",
+            streaming=True,
+            memory_mb_per_input_mb=0.5,
+            resource=ConverterResource.LIGHT,
+            seconds_per_input_mb=0.05,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.XLSX_TO_CSV,
+            handler="xlsx_to_csv.convert",
+            output_extension="csv",
+            streaming=True,
+            memory_mb_per_input_mb=4.0,
+            resource=ConverterResource.CPU_BOUND,
+            seconds_per_input_mb=0.5,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.TXT_TO_PDF,
+            handler="txt_to_pdf.convert",
+            output_extension="pdf",
+            streaming=False,
+            memory_mb_per_input_mb=7.0,
+            resource=ConverterResource.CPU_BOUND,
+            seconds_per_input_mb=0.5,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.PDF_TO_TEXT,
+            handler="pdf_to_text.convert",
+            output_extension="txt",
+            streaming=True,
+            memory_mb_per_input_mb=2.0,
+            resource=ConverterResource.CPU_BOUND,
+            seconds_per_input_mb=1.0,
+            options=("pages", "max_pages"),
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.DOCX_TO_PDF,
+            handler="docx_to_pdf.convert",
+            output_extension="pdf",
+            streaming=False,
+            memory_mb_per_input_mb=1.0,
+            resource=ConverterResource.SUBPROCESS_BOUND,
+            base_seconds=3.0,
+            seconds_per_input_mb=1.0,
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.DOCX_TO_MARKDOWN,
+            handler="docx_to_markdown.convert",
+            output_extension="md",
+            streaming=False,
+            memory_mb_per_input_mb=4.0,
+            resource=ConverterResource.CPU_BOUND,
+            seconds_per_input_mb=0.3,
+        ),
+        # Pipelines: encadeiam conversores existentes numa única execução.
+        ConverterSpec(
+            conversion_type=ConversionType.DOCX_TO_TEXT,
+            handler=None,
+            output_extension="txt",
+            streaming=False,
+            memory_mb_per_input_mb=2.0,
+            resource=ConverterResource.SUBPROCESS_BOUND,
+            stages=(ConversionType.DOCX_TO_PDF, ConversionType.PDF_TO_TEXT),
+            options=("pages", "max_pages"),
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.XLSX_TO_JSON,
+            handler=None,
+            output_extension="json",
+            streaming=True,
+            memory_mb_per_input_mb=4.0,
+            resource=ConverterResource.CPU_BOUND,
+            stages=(ConversionType.XLSX_TO_CSV, ConversionType.CSV_TO_JSON),
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.XLSX_TO_PARQUET,
+            handler=None,
+            output_extension="parquet",
+            streaming=True,
+            memory_mb_per_input_mb=4.0,
+            resource=ConverterResource.CPU_BOUND,
+            stages=(ConversionType.XLSX_TO_CSV, ConversionType.CSV_TO_PARQUET),
+        ),
+        ConverterSpec(
+            conversion_type=ConversionType.XLSX_TO_ARROW,
+            handler=None,
+            output_extension="arrow",
+            streaming=True,
+            memory_mb_per_input_mb=4.0,
+            resource=ConverterResource.CPU_BOUND,
+            stages=(ConversionType.XLSX_TO_CSV, ConversionType.CSV_TO_ARROW),
+        ),
+    )
+}
+
+
+def get_converter_spec(conversion_type: ConversionType | str) -> ConverterSpec | None:
+    return CONVERTER_SPECS.get(conversion_type)
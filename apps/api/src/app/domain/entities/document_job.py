@@ -14,6 +14,9 @@ class DocumentJob:
     output_path: str | None = None
     status: JobStatus = JobStatus.PENDING
     error_message: str | None = None
+    # Opções do conversor (ex.: páginas), guardadas para reenfileirar o job.
+    options: dict = field(default_factory=dict)
+    recoveries: int = 0
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     expires_at: datetime = field(
@@ -0,0 +1,57 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PageSelection:
+    """
+    Páginas pedidas para a extração. `ranges` usa numeração a partir de 1,
+    com fim inclusivo; fim None vai até a última página ("10-").
+    """
+
+    ranges: tuple[tuple[int, int | None], ...] = ()
+    max_pages: int | None = None
+
+    @classmethod
+    def parse(
+        cls, pages: str | None = None, max_pages: int | None = None
+    ) -> "PageSelection":
+        ranges = []
+        for part in (pages or "").split(","):
+            part = part.strip()
+            if not part:
+                continue
+
+            start, sep, end = part.partition("-")
+            try:
+                first = int(start)
+                last = (int(end) if end.strip() else None) if sep else first
+            except ValueError:
+                raise ValueError(f"Intervalo de páginas inválido: {part}") from None
+
+            if first < 1 or (last is not None and last < first):
+                raise ValueError(f"Intervalo de páginas inválido: {part}")
+            ranges.append((first, last))
+
+        if max_pages is not None and max_pages < 1:
+            raise ValueError("max_pages deve ser maior que zero")
+
+        return cls(ranges=tuple(ranges), max_pages=max_pages)
+
+    @property
+    def is_all(self) -> bool:
+        return not self.ranges and self.max_pages is None
+
+    def resolve(self, page_count: int) -> list[int]:
+        """Índices (base 0) das páginas selecionadas, em ordem e sem repetição"""
+        if not self.ranges:
+            indexes = list(range(page_count))
+        else:
+            selected = set()
+            for first, last in self.ranges:
+                end = page_count if last is None else min(last, page_count)
+                selected.update(range(first - 1, end))
+            indexes = sorted(selected)
+
+        if self.max_pages is not None:
+            indexes = indexes[: self.max_pages]
+        return indexes
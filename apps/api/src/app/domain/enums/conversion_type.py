@@ -3,9 +3,16 @@ from enum import Enum
 
 class ConversionType(str, Enum):
     CSV_TO_JSON = "csv_to_json"
+    CSV_TO_NDJSON = "csv_to_ndjson"
     CSV_TO_XLSX = "csv_to_xlsx"
+    CSV_TO_PARQUET = "csv_to_parquet"
+    CSV_TO_ARROW = "csv_to_arrow"
     XLSX_TO_CSV = "xlsx_to_csv"
     TXT_TO_PDF = "txt_to_pdf"
     PDF_TO_TEXT = "pdf_to_text"
     DOCX_TO_PDF = "docx_to_pdf"
     DOCX_TO_MARKDOWN = "docx_to_markdown"
+    DOCX_TO_TEXT = "docx_to_text"
+    XLSX_TO_JSON = "xlsx_to_json"
+    XLSX_TO_PARQUET = "xlsx_to_parquet"
+    XLSX_TO_ARROW = "xlsx_to_arrow"
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ConverterResource(str, Enum):
+    LIGHT = "light"
+    CPU_BOUND = "cpu_bound"
+    SUBPROCESS_BOUND = "subprocess_bound"
@@ -1,13 +1,11 @@
 from app.factory import create_app
-from app.realtime.server import socketio, init_socketio
+from app.realtime.server import socketio
 from app.config import config
 
 
 def main():
     app = create_app()
 
-    init_socketio(app)
-
     print(f"[API + Socket.IO] Iniciando em {config.FLASK_HOST}:{config.FLASK_PORT}")
     print(f"[Ambiente] {config.FLASK_ENV} | Debug: {config.FLASK_DEBUG}")
 
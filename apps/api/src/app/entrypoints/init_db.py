@@ -0,0 +1,79 @@
+from sqlalchemy import Enum, inspect, text
+from sqlalchemy.schema import CreateColumn
+from app.infra.db.db import Base, get_engine, wait_for_database
+
+# Registra as tabelas no metadata antes do create_all.
+from app.infra.models import client_storage_model, document_job_model  # noqa: F401
+
+
+def main():
+    """
+    Cria as tabelas que faltam. Roda uma vez antes da API e dos workers,
+    em vez de a cada boot do processo que atende requisições.
+    """
+    wait_for_database()
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    _add_missing_columns(engine)
+    _add_missing_enum_values(engine)
+    print("[Database] Schema criado/verificado")
+
+
+def _add_missing_columns(engine) -> None:
+    """O create_all não altera tabelas existentes: acrescenta colunas novas"""
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = CreateColumn(column).compile(dialect=engine.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+                print(f"[Database] Coluna {table.name}.{column.name} adicionada")
+
+
+
+def _add_missing_enum_values(engine) -> None:
+    """
+    Tipos ENUM do Postgres também não acompanham o create_all: membros novos
+    de um enum do domínio entram como valores novos do tipo. Fora de uma
+    transação, para o valor já poder ser usado por quem vier depois.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    existing = {enum["name"]: enum["labels"] for enum in inspect(engine).get_enums()}
+    missing = _missing_enum_values(existing)
+    if not missing:
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for type_name, label in missing:
+            conn.execute(
+                text(f"ALTER TYPE {type_name} ADD VALUE IF NOT EXISTS '{label}'")
+            )
+            print(f"[Database] Valor {label} adicionado ao tipo {type_name}")
+
+
+def _missing_enum_values(existing: dict[str, list[str]]) -> list[tuple[str, str]]:
+    """(tipo, valor) dos enums mapeados que o banco já tem, sem algum valor"""
+    missing = []
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            column_type = column.type
+            if not isinstance(column_type, Enum) or not column_type.native_enum:
+                continue
+            labels = existing.get(column_type.name)
+            if labels is None:
+                continue
+            missing.extend(
+                (column_type.name, label)
+                for label in column_type.enums
+                if label not in labels and (column_type.name, label) not in missing
+            )
+    return missing
+
+
+if __name__ == "__main__":
+    main()
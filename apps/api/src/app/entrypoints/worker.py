@@ -1,5 +1,32 @@
 import sys
+from app.config import config
 from app.workers.celery_app import celery
+from app.workers.routing import ALL_QUEUES
+
+
+def build_worker_args() -> list[str]:
+    """
+    Monta os argumentos do worker a partir da configuração: tipo de pool,
+    concorrência fixa ou escala automática e filas consumidas.
+    """
+    queues = [q.strip() for q in config.WORKER_QUEUES.split(",") if q.strip()]
+    args = [
+        "worker",
+        "--loglevel=info",
+        f"--pool={config.WORKER_POOL}",
+        f"--queues={','.join(queues or ALL_QUEUES)}",
+    ]
+
+    if config.WORKER_AUTOSCALE:
+        if config.WORKER_POOL != "prefork":
+            raise ValueError(
+                "WORKER_AUTOSCALE só é suportado com WORKER_POOL=prefork"
+            )
+        args.append(f"--autoscale={config.WORKER_AUTOSCALE}")
+    elif config.WORKER_CONCURRENCY > 0 and config.WORKER_POOL != "solo":
+        args.append(f"--concurrency={config.WORKER_CONCURRENCY}")
+
+    return args
 
 
 def main():
@@ -7,10 +34,10 @@ def main():
     Ponto de entrada para rodar o Celery Worker
     """
     sys.argv[0] = "celery worker"
-    worker_args = ["worker", "--loglevel=info", "--pool=solo"]
 
     try:
-        print("[Worker] Iniciando Celery Worker...")
+        worker_args = build_worker_args()
+        print(f"[Worker] Iniciando Celery Worker: {' '.join(worker_args[1:])}")
         celery.worker_main(worker_args)
     except KeyboardInterrupt:
         print("[Worker] Encerrado pelo usuário (Ctrl+C)")
@@ -7,20 +7,19 @@ from marshmallow import ValidationError
 
 from app.config import config
 from app.realtime.server import socketio, init_socketio
-from app.infra.db.db import SessionLocal, engine, Base
+from app.infra.db.db import SessionLocal
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.client_storage_repository import ClientStorageRepository
 from app.services.document_service import DocumentService
 from app.http.documents.routes import documents_bp
 from app.http.auth.routes import auth_bp
+from app.http.health.routes import health_bp
 from app.workers.celery_app import celery
 
 
 def create_app() -> Flask:
     app = Flask(__name__)
 
-    Base.metadata.create_all(bind=engine)
-
     app.config["API_TITLE"] = "Doc flow API"
     app.config["API_VERSION"] = "v1"
     app.config["OPENAPI_VERSION"] = "3.0.3"
@@ -106,5 +105,8 @@ def create_app() -> Flask:
 
     api.register_blueprint(documents_bp)
     api.register_blueprint(auth_bp)
+    api.register_blueprint(health_bp)
+    # Probes não dependem do Redis do rate limit.
+    limiter.exempt(health_bp)
 
     return app
@@ -1,5 +1,6 @@
 from flask import (
     Blueprint,
+    Response,
     request,
     jsonify,
     send_from_directory,
@@ -10,12 +11,40 @@ from flask_smorest import Blueprint as ApiBlueprint, abort
 from werkzeug.utils import secure_filename
 from werkzeug.datastructures import FileStorage
 from pathlib import Path
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime, timezone
-from .schemas import UploadFormSchema, JobCreatedSchema, FileListSchema, FileItemSchema
-from app.infra.utils import get_client_output_dir, get_client_input_dir
+import time
+import zipfile
+from .schemas import (
+    UploadFormSchema,
+    JobCreatedSchema,
+    BatchCreatedSchema,
+    FileListSchema,
+    FileItemSchema,
+    ConversionListSchema,
+    CacheStatsSchema,
+    JobStatusQuerySchema,
+    JobStatusListQuerySchema,
+    JobStatusSchema,
+    JobStatusListSchema,
+    conversion_options,
+)
+from app.infra.utils import (
+    get_client_output_dir,
+    get_client_input_dir,
+    save_stream_with_hash,
+)
 from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.job_status import JobStatus
+from app.infra.cache.job_status_cache import (
+    get_job_status_cache,
+    job_client_id,
+    job_snapshot,
+    snapshot_etag,
+)
+from app.domain.entities.converter_spec import CONVERTER_SPECS
 from app.services.document_service import DocumentService
+from app.config import config
 
 
 documents_bp = ApiBlueprint(
@@ -28,6 +57,10 @@ documents_bp = ApiBlueprint(
 
 ALLOWED_EXTENSIONS = {"csv", "xlsx", "xls", "txt", "pdf", "docx", "doc"}
 
+# Durante um long-poll o estado é relido pelo menos neste intervalo, mesmo
+# sem notificação (inscrição do Redis caída ou evento perdido).
+JOB_STATUS_RECHECK_SECONDS = 5
+
 
 def allowed_file(filename: str) -> bool:
     return "." in filename and filename.rsplit(".", 1)[1].lower() in ALLOWED_EXTENSIONS
@@ -69,19 +102,29 @@ def upload_and_convert(conversion_data):
         abort(403, messages={"upload": reason})
 
     service: DocumentService = g.document_service
+    options = conversion_options(conversion_data)
 
     job = service.create_job(
         client_id=client_id,
         conversion_type=conversion_type,
         input_filename=secure_filename(file.filename),
+        options=options,
     )
 
-    file.save(job.input_path)
-    service.job_repo.update(job)
+    input_hash = save_stream_with_hash(file.stream, job.input_path)
+    input_size = Path(job.input_path).stat().st_size
+    storage_repo.update_size(client_id, input_size)
 
-    from app.workers.tasks.conversion_worker import process_conversion
+    from app.workers.tasks.conversion_worker import enqueue_conversion
 
-    process_conversion.delay(str(job.id), str(client_id))
+    enqueue_conversion(
+        str(job.id),
+        str(client_id),
+        conversion_type,
+        input_hash,
+        options,
+        input_size_bytes=input_size,
+    )
 
     return {
         "job_id": str(job.id),
@@ -90,6 +133,288 @@ def upload_and_convert(conversion_data):
     }, 202
 
 
+@documents_bp.route("/upload/batch", methods=["POST"])
+@documents_bp.arguments(UploadFormSchema, location="form")
+@documents_bp.response(202, BatchCreatedSchema)
+def upload_batch(conversion_data):
+    conversion_type = ConversionType(conversion_data["conversion_type"])
+
+    client_id_str = request.cookies.get("client_id")
+    if not client_id_str or not client_id_str.strip():
+        abort(400, messages={"cookie": "client_id cookie is required"})
+
+    try:
+        client_id = UUID(client_id_str)
+    except ValueError:
+        abort(400, messages={"cookie": "client_id inválido"})
+
+    files: list[FileStorage] = request.files.getlist("files")
+    if not files:
+        abort(400, messages={"files": "Nenhum arquivo enviado"})
+
+    archives = []
+    try:
+        inputs, total_size = _collect_batch_inputs(files, archives)
+
+        if not inputs:
+            abort(400, messages={"files": "Nenhum arquivo com formato suportado"})
+        if len(inputs) > config.BATCH_MAX_FILES:
+            abort(
+                400,
+                messages={"files": f"Máximo de {config.BATCH_MAX_FILES} arquivos"},
+            )
+
+        storage = g.storage_repository.get_or_create(client_id)
+        can_upload, reason = storage.can_upload(total_size)
+        if not can_upload:
+            abort(403, messages={"upload": reason})
+
+        service: DocumentService = g.document_service
+        options = conversion_options(conversion_data)
+        jobs = service.create_batch(client_id, conversion_type, inputs, options)
+    finally:
+        for archive in archives:
+            archive.close()
+
+    from app.workers.tasks.conversion_worker import dispatch_batch
+
+    batch_id = str(uuid4())
+    dispatch_batch(batch_id, str(client_id), jobs, options)
+
+    return {
+        "batch_id": batch_id,
+        "count": len(jobs),
+        "jobs": [
+            {"job_id": str(job.id), "filename": job.input_filename}
+            for job, _ in jobs
+        ],
+        "message": "Lote recebido. Processamento enfileirado.",
+    }, 202
+
+
+def _collect_batch_inputs(files: list[FileStorage], archives: list):
+    """
+    Lista (nome, abertura do stream) de cada arquivo do lote, expandindo
+    arquivos .zip, e soma o tamanho total para a verificação de cota.
+    """
+    inputs = []
+    total_size = 0
+
+    for file in files:
+        if not file or not file.filename:
+            continue
+
+        if file.filename.lower().endswith(".zip"):
+            try:
+                archive = zipfile.ZipFile(file.stream)
+            except zipfile.BadZipFile:
+                abort(400, messages={"files": f"Zip inválido: {file.filename}"})
+            archives.append(archive)
+
+            for info in archive.infolist():
+                name = secure_filename(Path(info.filename).name)
+                if info.is_dir() or not allowed_file(name):
+                    continue
+                inputs.append((name, lambda a=archive, i=info: a.open(i)))
+                total_size += info.file_size
+            continue
+
+        if not allowed_file(file.filename):
+            continue
+
+        file.stream.seek(0, 2)
+        total_size += file.stream.tell()
+        file.stream.seek(0)
+        inputs.append((secure_filename(file.filename), lambda f=file: f.stream))
+
+    return inputs, total_size
+
+
+@documents_bp.route("/conversions", methods=["GET"])
+@documents_bp.response(200, ConversionListSchema)
+def list_conversions():
+    conversions = list(CONVERTER_SPECS.values())
+    return {"count": len(conversions), "conversions": conversions}, 200
+
+
+@documents_bp.route("/cache/stats", methods=["GET"])
+@documents_bp.response(200, CacheStatsSchema)
+def conversion_cache_stats():
+    if not config.RESULT_CACHE_ENABLED:
+        return {"enabled": False}, 200
+
+    from app.infra.cache.result_cache import get_result_cache
+
+    return {"enabled": True, **get_result_cache().stats()}, 200
+
+
+@documents_bp.route("/jobs/<uuid:job_id>", methods=["GET"])
+@documents_bp.arguments(JobStatusQuerySchema, location="query")
+@documents_bp.response(200, JobStatusSchema)
+@documents_bp.alt_response(304, description="Estado igual ao do If-None-Match")
+def get_job_status(query, job_id: UUID):
+    client_id = _client_id_from_cookie()
+
+    def build(snapshots):
+        if str(job_id) not in snapshots:
+            abort(404, messages={"job": "Job não encontrado"})
+        return _with_download_url(snapshots[str(job_id)], client_id)
+
+    return _job_status_response([str(job_id)], client_id, query["wait"], build)
+
+
+@documents_bp.route("/jobs", methods=["GET"])
+@documents_bp.arguments(JobStatusListQuerySchema, location="query")
+@documents_bp.response(200, JobStatusListSchema)
+@documents_bp.alt_response(304, description="Estado igual ao do If-None-Match")
+def list_job_statuses(query):
+    client_id = _client_id_from_cookie()
+
+    try:
+        ids = [UUID(value) for value in query["ids"].split(",") if value.strip()]
+    except ValueError:
+        abort(400, messages={"ids": "ID de job inválido"})
+    job_ids = list(dict.fromkeys(str(job_id) for job_id in ids))
+    if not job_ids or len(job_ids) > config.JOB_STATUS_MAX_IDS:
+        abort(
+            400,
+            messages={"ids": f"Informe de 1 a {config.JOB_STATUS_MAX_IDS} IDs"},
+        )
+
+    def build(snapshots):
+        jobs = [
+            _with_download_url(snapshots[job_id], client_id)
+            for job_id in job_ids
+            if job_id in snapshots
+        ]
+        missing = [job_id for job_id in job_ids if job_id not in snapshots]
+        return {"count": len(jobs), "jobs": jobs, "missing": missing}
+
+    return _job_status_response(job_ids, client_id, query["wait"], build)
+
+
+def _client_id_from_cookie() -> str:
+    client_id_str = request.cookies.get("client_id")
+    if not client_id_str or not client_id_str.strip():
+        abort(400, messages={"cookie": "client_id cookie is required"})
+
+    try:
+        return str(UUID(client_id_str))
+    except ValueError:
+        abort(400, messages={"cookie": "client_id inválido"})
+
+
+def _job_status_response(job_ids: list[str], client_id: str, wait: float, build):
+    """
+    Responde com o estado dos jobs e um ETag. Se o cliente já tem esse
+    estado (If-None-Match) e pediu `wait`, segura a requisição até um dos
+    jobs mudar ou o tempo acabar; jobs já encerrados respondem na hora.
+    """
+    deadline = time.monotonic() + min(wait, config.JOB_STATUS_MAX_WAIT)
+    watcher = token = None
+    if wait > 0 and request.if_none_match:
+        from app.realtime.job_watch import get_job_status_watcher
+
+        watcher = get_job_status_watcher()
+        # Observa antes de ler para não perder uma mudança entre os dois.
+        token = watcher.watch(job_ids)
+
+    try:
+        while True:
+            snapshots = _job_statuses(job_ids, client_id)
+            body = build(snapshots)
+            etag = snapshot_etag([snapshots.get(job_id) for job_id in job_ids])
+
+            if not request.if_none_match.contains(etag):
+                return body, 200, {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+
+            remaining = deadline - time.monotonic()
+            finished = all(
+                s["status"] in (JobStatus.COMPLETED.value, JobStatus.FAILED.value)
+                for s in snapshots.values()
+            )
+            if watcher is None or remaining <= 0 or finished:
+                return Response(status=304, headers={"ETag": f'"{etag}"'})
+
+            # Não segura uma conexão do pool enquanto espera.
+            g.db.close()
+            watcher.wait(token, min(remaining, JOB_STATUS_RECHECK_SECONDS))
+    finally:
+        if watcher is not None:
+            watcher.unwatch(token)
+
+
+def _job_statuses(job_ids: list[str], client_id: str) -> dict[str, dict]:
+    """
+    Estado dos jobs do cliente: do Redis quando presente, senão do Postgres
+    (e o Redis é preenchido para as próximas leituras). Jobs de outro
+    cliente ficam de fora, como se não existissem.
+    """
+    try:
+        cache = get_job_status_cache()
+        cached = cache.get_many(job_ids)
+    except Exception as e:
+        # Um aviso por requisição, não a cada volta do long-poll.
+        if not g.get("job_status_cache_down"):
+            g.job_status_cache_down = True
+            print(f"[JobStatus] Redis indisponível, lendo do banco: {e}")
+        cache, cached = None, {}
+
+    snapshots = {
+        job_id: entry["snapshot"]
+        for job_id, entry in cached.items()
+        if entry["client_id"] == client_id
+    }
+
+    missing = [job_id for job_id in job_ids if job_id not in cached]
+    if not missing:
+        return snapshots
+
+    for job in g.document_repository.get_many(missing):
+        if job_client_id(job) != client_id:
+            continue
+        snapshots[str(job.id)] = job_snapshot(job)
+        if cache is not None:
+            try:
+                cache.backfill(job, client_id)
+            except Exception as e:
+                print(f"[JobStatus] Falha ao preencher o cache do job {job.id}: {e}")
+    return snapshots
+
+
+def _with_download_url(snapshot: dict, client_id: str) -> dict:
+    filename = snapshot.get("output_filename")
+    download_url = None
+    if filename:
+        base_url = request.host_url.rstrip("/")
+        download_url = f"{base_url}/documents/download/output/{client_id}/{filename}"
+    return {**snapshot, "download_url": download_url}
+
+
+@documents_bp.route("/events", methods=["GET"])
+@documents_bp.doc(
+    summary="Eventos dos jobs via Server-Sent Events",
+    description=(
+        "Stream de job_completed, job_failed e job_progress do cliente. "
+        "Reconexões com Last-Event-ID recebem os eventos finais perdidos; "
+        "toda conexão recebe o progresso atual dos jobs em andamento."
+    ),
+)
+def stream_job_events():
+    client_id = _client_id_from_cookie()
+
+    from app.realtime.sse import event_stream, get_event_broker
+
+    stream = event_stream(
+        get_event_broker(), client_id, request.headers.get("Last-Event-ID")
+    )
+    return Response(
+        stream,
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @documents_bp.route("/files", methods=["GET"])
 @documents_bp.route("/history", methods=["GET"])
 @documents_bp.response(200, FileListSchema)
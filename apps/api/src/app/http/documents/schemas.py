@@ -1,4 +1,6 @@
-from marshmallow import Schema, fields, validate
+from marshmallow import Schema, ValidationError, fields, validate, validates_schema
+from app.domain.entities.converter_spec import get_converter_spec
+from app.domain.entities.page_selection import PageSelection
 from app.domain.enums.conversion_type import ConversionType
 
 
@@ -13,6 +15,41 @@ class UploadFormSchema(Schema):
         validate=validate.OneOf([e.value for e in ConversionType]),
         metadata={"description": "Tipo de conversão desejada"},
     )
+    pages = fields.Str(
+        load_default=None,
+        metadata={"description": "Páginas a extrair, ex.: 1-5,8,10- (PDF → texto)"},
+    )
+    max_pages = fields.Int(
+        load_default=None,
+        validate=validate.Range(min=1),
+        metadata={"description": "Número máximo de páginas a extrair"},
+    )
+
+    @validates_schema
+    def validate_options(self, data, **kwargs):
+        options = conversion_options(data)
+        if not options:
+            return
+
+        spec = get_converter_spec(data.get("conversion_type"))
+        unsupported = [name for name in options if name not in spec.options]
+        if unsupported:
+            message = "Não suportado por este tipo de conversão"
+            raise ValidationError({name: [message] for name in unsupported})
+
+        try:
+            PageSelection.parse(options.get("pages"), options.get("max_pages"))
+        except ValueError as e:
+            raise ValidationError({"pages": [str(e)]})
+
+
+def conversion_options(data: dict) -> dict:
+    """Opções do conversor informadas no formulário (sem os campos vazios)"""
+    return {
+        name: data[name]
+        for name in ("pages", "max_pages")
+        if data.get(name) not in (None, "")
+    }
 
 
 class JobCreatedSchema(Schema):
@@ -21,6 +58,18 @@ class JobCreatedSchema(Schema):
     message = fields.Str(required=True)
 
 
+class BatchJobSchema(Schema):
+    job_id = fields.Str(required=True)
+    filename = fields.Str(required=True)
+
+
+class BatchCreatedSchema(Schema):
+    batch_id = fields.Str(required=True)
+    count = fields.Int(required=True)
+    jobs = fields.List(fields.Nested(BatchJobSchema))
+    message = fields.Str(required=True)
+
+
 class FileItemSchema(Schema):
     filename = fields.Str()
     size_bytes = fields.Int()
@@ -35,3 +84,67 @@ class FileListSchema(Schema):
     count = fields.Int()
     files = fields.List(fields.Nested(FileItemSchema))
     has_more = fields.Bool()
+
+
+class ConversionSpecSchema(Schema):
+    conversion_type = ConversionTypeField()
+    output_extension = fields.Str()
+    streaming = fields.Bool()
+    memory_mb_per_input_mb = fields.Float()
+    resource = ConversionTypeField()
+    version = fields.Int()
+    stages = fields.List(ConversionTypeField())
+    options = fields.List(fields.Str())
+
+
+class ConversionListSchema(Schema):
+    count = fields.Int()
+    conversions = fields.List(fields.Nested(ConversionSpecSchema))
+
+
+class CacheStatsSchema(Schema):
+    enabled = fields.Bool()
+    hits = fields.Int()
+    misses = fields.Int()
+    coalesced = fields.Int()
+    evictions = fields.Int()
+    hit_rate = fields.Float()
+    entries = fields.Int()
+    size_bytes = fields.Int()
+    max_bytes = fields.Int()
+
+
+class JobStatusQuerySchema(Schema):
+    wait = fields.Float(
+        load_default=0,
+        validate=validate.Range(min=0),
+        metadata={
+            "description": (
+                "Long-poll: com If-None-Match, espera até N segundos por uma "
+                "mudança de estado antes de responder 304"
+            )
+        },
+    )
+
+
+class JobStatusListQuerySchema(JobStatusQuerySchema):
+    ids = fields.Str(
+        required=True,
+        metadata={"description": "IDs dos jobs separados por vírgula"},
+    )
+
+
+class JobStatusSchema(Schema):
+    job_id = fields.Str(required=True)
+    status = fields.Str(required=True)
+    conversion_type = fields.Str()
+    filename = fields.Str()
+    output_filename = fields.Str(allow_none=True)
+    error = fields.Str(allow_none=True)
+    download_url = fields.Str(allow_none=True)
+
+
+class JobStatusListSchema(Schema):
+    count = fields.Int()
+    jobs = fields.List(fields.Nested(JobStatusSchema))
+    missing = fields.List(fields.Str())
@@ -0,0 +1,27 @@
+from flask_smorest import Blueprint as ApiBlueprint
+from app.infra.db.db import check_database
+from .schemas import HealthResponseSchema
+
+
+health_bp = ApiBlueprint(
+    "health",
+    __name__,
+    url_prefix="/health",
+    description="Verificações de vida e prontidão da API",
+)
+
+
+@health_bp.route("/live", methods=["GET"])
+@health_bp.response(200, HealthResponseSchema)
+def liveness():
+    # Não toca no banco: o processo responde assim que sobe.
+    return {"status": "ok"}
+
+
+@health_bp.route("/ready", methods=["GET"])
+@health_bp.response(200, HealthResponseSchema)
+@health_bp.alt_response(503, schema=HealthResponseSchema)
+def readiness():
+    if check_database():
+        return {"status": "ok", "database": "ok"}
+    return {"status": "indisponível", "database": "indisponível"}, 503
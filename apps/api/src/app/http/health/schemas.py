@@ -0,0 +1,6 @@
+from marshmallow import Schema, fields
+
+
+class HealthResponseSchema(Schema):
+    status = fields.Str(required=True)
+    database = fields.Str()
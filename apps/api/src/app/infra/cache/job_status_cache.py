@@ -0,0 +1,126 @@
+import hashlib
+import json
+from pathlib import Path
+import redis
+from app.config import config
+from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.job_status import JobStatus
+from app.infra.redis.client import get_redis_client
+
+
+JOB_STATUS_PREFIX = "job_status"
+
+SNAPSHOT_FIELDS = (
+    "job_id",
+    "status",
+    "conversion_type",
+    "filename",
+    "output_filename",
+    "error",
+)
+
+# Preenche a partir do Postgres só se o worker não escreveu antes: uma leitura
+# atrasada não pode sobrescrever um estado mais novo.
+_BACKFILL_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('HSET', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+def job_snapshot(job: DocumentJob) -> dict:
+    """Estado público do job, igual venha do Redis ou do Postgres"""
+    completed = job.status == JobStatus.COMPLETED and job.output_path
+    return {
+        "job_id": str(job.id),
+        "status": JobStatus(job.status).value,
+        "conversion_type": getattr(job.conversion_type, "value", job.conversion_type),
+        "filename": job.input_filename,
+        "output_filename": Path(job.output_path).name if completed else None,
+        "error": job.error_message,
+    }
+
+
+def job_client_id(job: DocumentJob) -> str:
+    # O diretório de entrada do job é nomeado pelo client_id.
+    return Path(job.input_path).parent.name
+
+
+def snapshot_etag(snapshots: list[dict]) -> str:
+    encoded = json.dumps(snapshots, sort_keys=True).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+class JobStatusCache:
+    """
+    Último estado de cada job num hash do Redis, escrito pelo worker a cada
+    transição. A API lê daqui e só cai no Postgres quando a chave não existe.
+    """
+
+    def __init__(self, client: redis.Redis, ttl: int = config.JOB_STATUS_TTL):
+        self.client = client
+        self.ttl = ttl
+        self._backfill = client.register_script(_BACKFILL_SCRIPT)
+
+    def set(self, job: DocumentJob, client_id: str) -> None:
+        key = self._key(job.id)
+        pipe = self.client.pipeline()
+        pipe.hset(key, mapping=self._encode(job_snapshot(job), client_id))
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def backfill(self, job: DocumentJob, client_id: str) -> None:
+        fields = self._encode(job_snapshot(job), client_id)
+        args = [self.ttl]
+        for name, value in fields.items():
+            args.extend((name, value))
+        self._backfill(keys=[self._key(job.id)], args=args)
+
+    def get_many(self, job_ids: list[str]) -> dict[str, dict]:
+        """{job_id: {"client_id", "snapshot"}} dos jobs presentes no cache"""
+        pipe = self.client.pipeline()
+        for job_id in job_ids:
+            pipe.hgetall(self._key(job_id))
+
+        found = {}
+        for job_id, entry in zip(job_ids, pipe.execute()):
+            if entry:
+                found[job_id] = {
+                    "client_id": entry.get("client_id"),
+                    "snapshot": {
+                        name: entry.get(name) or None for name in SNAPSHOT_FIELDS
+                    },
+                }
+        return found
+
+    @staticmethod
+    def _encode(snapshot: dict, client_id: str) -> dict:
+        # Hash do Redis não guarda None: campo vazio volta como None.
+        fields = {name: value or "" for name, value in snapshot.items()}
+        fields["client_id"] = str(client_id)
+        return fields
+
+    @staticmethod
+    def _key(job_id) -> str:
+        return f"{JOB_STATUS_PREFIX}:{job_id}"
+
+
+_cache: JobStatusCache | None = None
+
+
+def get_job_status_cache() -> JobStatusCache:
+    global _cache
+    if _cache is None:
+        _cache = JobStatusCache(get_redis_client())
+    return _cache
+
+
+def record_job_status(job: DocumentJob, client_id: str) -> None:
+    """Grava o estado do job; falha no Redis não interrompe a conversão"""
+    try:
+        get_job_status_cache().set(job, client_id)
+    except Exception as e:
+        print(f"[JobStatus] Falha ao gravar estado do job {job.id}: {e}")
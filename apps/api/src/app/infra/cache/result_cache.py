@@ -0,0 +1,234 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from uuid import uuid4
+import redis
+from app.config import config
+from app.infra.redis.client import get_redis_client
+from app.infra.utils import PROJECT_ROOT
+
+
+CACHE_PREFIX = "conversion_cache"
+CACHE_DIR = PROJECT_ROOT / "src" / "app" / "infra" / "storage" / "cache"
+LRU_KEY = f"{CACHE_PREFIX}:lru"
+TOTAL_BYTES_KEY = f"{CACHE_PREFIX}:total_bytes"
+STATS_KEY = f"{CACHE_PREFIX}:stats"
+
+# Marca a conversão como em voo. Reentrante: o mesmo job, reentregue depois
+# de um worker morrer, continua dono da conversão (e renova o TTL) em vez de
+# entrar na fila de espera de si mesmo. Quem assume a conversão assume também
+# a lista de espera deixada por um dono anterior cujo claim expirou.
+_CLAIM_SCRIPT = """
+local owned = redis.call('SET', KEYS[1], ARGV[1], 'NX', 'EX', ARGV[2])
+if not owned then
+    if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+        return 0
+    end
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+end
+return 1
+"""
+
+# Anexa o job à lista de espera somente se ainda houver conversão em voo. A
+# lista dura mais que o claim, para sobreviver até alguém assumir a conversão.
+_ATTACH_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('RPUSH', KEYS[2], ARGV[1])
+    redis.call('EXPIRE', KEYS[2], ARGV[2])
+    return 1
+end
+return 0
+"""
+
+# Encerra a conversão em voo e devolve (e limpa) a lista de espera, desde que
+# quem libera seja o job que fez o claim.
+_RELEASE_SCRIPT = """
+if redis.call('GET', KEYS[1]) ~= ARGV[1] then
+    return {}
+end
+local waiters = redis.call('LRANGE', KEYS[2], 0, -1)
+redis.call('DEL', KEYS[1], KEYS[2])
+return waiters
+"""
+
+
+class ConversionResultCache:
+    """
+    Cache de resultados endereçado por conteúdo: (hash do input, tipo de
+    conversão, versão do conversor) -> arquivo convertido.
+
+    Os arquivos ficam no mesmo volume do storage e são ligados (hard link)
+    no diretório de saída de cada cliente. O índice, o LRU, o total em bytes
+    e as métricas ficam no Redis.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        cache_dir: Path = CACHE_DIR,
+        max_bytes: int = config.RESULT_CACHE_MAX_BYTES,
+    ):
+        self.client = client
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self._claim = client.register_script(_CLAIM_SCRIPT)
+        self._attach = client.register_script(_ATTACH_SCRIPT)
+        self._release = client.register_script(_RELEASE_SCRIPT)
+
+    @staticmethod
+    def make_key(
+        input_hash: str,
+        conversion_type: str,
+        version: int,
+        options: dict | None = None,
+    ) -> str:
+        key = f"{input_hash}:{conversion_type}:v{version}"
+        if options:
+            encoded = json.dumps(options, sort_keys=True).encode("utf-8")
+            key += f":{hashlib.sha1(encoded).hexdigest()[:16]}"
+        return key
+
+    def get(self, key: str) -> Path | None:
+        entry = self.client.hgetall(self._entry_key(key))
+        path = Path(entry["path"]) if entry else None
+
+        if path is None or not path.is_file():
+            if entry:
+                self._drop(key, entry)
+            self.client.hincrby(STATS_KEY, "misses", 1)
+            return None
+
+        self.client.zadd(LRU_KEY, {key: time.time()})
+        self.client.hincrby(STATS_KEY, "hits", 1)
+        return path
+
+    def put(self, key: str, source: Path) -> Path:
+        source = Path(source)
+        target_dir = self.cache_dir / key[:2]
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        digest = key.split(":", 1)[0]
+        conversion = key.split(":", 1)[1].replace(":", "_")
+        target = target_dir / f"{digest}_{conversion}{source.suffix}"
+        tmp_target = target.with_name(f".{uuid4().hex}{source.suffix}")
+        _link_or_copy(source, tmp_target)
+        os.replace(tmp_target, target)
+
+        size = target.stat().st_size
+        previous = self.client.hget(self._entry_key(key), "size")
+
+        pipe = self.client.pipeline()
+        pipe.hset(self._entry_key(key), mapping={"path": str(target), "size": size})
+        pipe.zadd(LRU_KEY, {key: time.time()})
+        pipe.incrby(TOTAL_BYTES_KEY, size - int(previous or 0))
+        pipe.execute()
+
+        self._evict()
+        return target
+
+    def link_to(self, cached: Path, destination: Path) -> Path:
+        """
+        Liga o resultado em cache ao caminho de saída do job. A extensão
+        final segue a do arquivo em cache (ex.: .zip de várias abas).
+        """
+        destination = Path(destination).with_suffix(Path(cached).suffix)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.unlink(missing_ok=True)
+        _link_or_copy(Path(cached), destination)
+        return destination
+
+    def claim(self, key: str, job_id: str) -> bool:
+        return bool(
+            self._claim(
+                keys=[self._inflight_key(key), self._waiters_key(key)],
+                args=[job_id, config.RESULT_CACHE_INFLIGHT_TTL, self._waiters_ttl],
+            )
+        )
+
+    def attach(self, key: str, job_id: str, client_id: str) -> bool:
+        payload = json.dumps({"job_id": job_id, "client_id": client_id})
+        attached = self._attach(
+            keys=[self._inflight_key(key), self._waiters_key(key)],
+            args=[payload, self._waiters_ttl],
+        )
+        if attached:
+            self.client.hincrby(STATS_KEY, "coalesced", 1)
+        return bool(attached)
+
+    def release(self, key: str, job_id: str) -> list[dict]:
+        waiters = self._release(
+            keys=[self._inflight_key(key), self._waiters_key(key)], args=[job_id]
+        )
+        return [json.loads(w) for w in waiters]
+
+    def stats(self) -> dict:
+        raw = self.client.hgetall(STATS_KEY)
+        hits = int(raw.get("hits", 0))
+        misses = int(raw.get("misses", 0))
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "coalesced": int(raw.get("coalesced", 0)),
+            "evictions": int(raw.get("evictions", 0)),
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": self.client.zcard(LRU_KEY),
+            "size_bytes": int(self.client.get(TOTAL_BYTES_KEY) or 0),
+            "max_bytes": self.max_bytes,
+        }
+
+    def _evict(self) -> None:
+        while int(self.client.get(TOTAL_BYTES_KEY) or 0) > self.max_bytes:
+            oldest = self.client.zpopmin(LRU_KEY)
+            if not oldest:
+                self.client.set(TOTAL_BYTES_KEY, 0)
+                return
+            key, _ = oldest[0]
+            self._drop(key, self.client.hgetall(self._entry_key(key)))
+            self.client.hincrby(STATS_KEY, "evictions", 1)
+
+    def _drop(self, key: str, entry: dict) -> None:
+        if entry.get("path"):
+            Path(entry["path"]).unlink(missing_ok=True)
+
+        pipe = self.client.pipeline()
+        pipe.delete(self._entry_key(key))
+        pipe.zrem(LRU_KEY, key)
+        pipe.decrby(TOTAL_BYTES_KEY, int(entry.get("size", 0)))
+        pipe.execute()
+
+    @property
+    def _waiters_ttl(self) -> int:
+        return 2 * config.RESULT_CACHE_INFLIGHT_TTL
+
+    def _entry_key(self, key: str) -> str:
+        return f"{CACHE_PREFIX}:entry:{key}"
+
+    def _inflight_key(self, key: str) -> str:
+        return f"{CACHE_PREFIX}:inflight:{key}"
+
+    def _waiters_key(self, key: str) -> str:
+        return f"{CACHE_PREFIX}:waiters:{key}"
+
+
+def _link_or_copy(source: Path, destination: Path) -> None:
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+_cache = None
+
+
+def get_result_cache() -> ConversionResultCache:
+    global _cache
+    if _cache is None:
+        _cache = ConversionResultCache(get_redis_client())
+    return _cache
@@ -1,42 +1,86 @@
 import os
+import threading
 import time
 from pathlib import Path
 
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 # Ensure apps/api/.env is loaded even when running commands from repo root.
 ENV_PATH = Path(__file__).resolve().parents[4] / ".env"
 load_dotenv(dotenv_path=ENV_PATH)
 
-DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise ValueError(f"DATABASE_URL not set. Check: {ENV_PATH}")
-
 MAX_RETRIES = 10
 RETRY_DELAY = 3
+CONNECT_TIMEOUT = 5
+
+Base = declarative_base()
+
+_engine: Engine | None = None
+_engine_lock = threading.Lock()
+_session_factory = sessionmaker(autocommit=False, autoflush=False)
+
+
+def get_engine() -> Engine:
+    """
+    Cria o engine no primeiro uso. Nenhuma conexão é aberta aqui: o pool
+    conecta sob demanda e o pre_ping descarta conexões mortas.
+    """
+    global _engine
+    if _engine is not None:
+        return _engine
+
+    with _engine_lock:
+        if _engine is None:
+            database_url = os.getenv("DATABASE_URL")
+            if not database_url:
+                raise ValueError(f"DATABASE_URL not set. Check: {ENV_PATH}")
 
-engine = None
-for attempt in range(MAX_RETRIES):
+            # Limita a espera por um banco fora do ar (padrão do TCP: minutos).
+            connect_args = (
+                {"connect_timeout": CONNECT_TIMEOUT}
+                if database_url.startswith("postgresql")
+                else {}
+            )
+            _engine = create_engine(
+                database_url, pool_pre_ping=True, connect_args=connect_args
+            )
+            _session_factory.configure(bind=_engine)
+    return _engine
+
+
+def SessionLocal() -> Session:
+    get_engine()
+    return _session_factory()
+
+
+def check_database() -> bool:
+    """Prontidão: um SELECT 1, com a conexão limitada a CONNECT_TIMEOUT"""
     try:
-        engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-        with engine.connect() as conn:
+        with get_engine().connect() as conn:
             conn.execute(text("SELECT 1"))
-        print("Database connection OK")
-        break
-    except OperationalError as e:
-        print(f"Attempt {attempt + 1}/{MAX_RETRIES} failed: {e}")
-        if attempt == MAX_RETRIES - 1:
-            raise
-        time.sleep(RETRY_DELAY)
-
-if engine is None:
-    raise RuntimeError("Could not connect to database after retries")
-
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-Base = declarative_base()
+        return True
+    except Exception as e:
+        print(f"[Database] Indisponível: {e}")
+        return False
+
+
+def wait_for_database() -> None:
+    """Espera o banco ficar disponível (uso em comandos de linha, não na API)"""
+    for attempt in range(MAX_RETRIES):
+        try:
+            with get_engine().connect() as conn:
+                conn.execute(text("SELECT 1"))
+            print("Database connection OK")
+            return
+        except OperationalError as e:
+            print(f"Attempt {attempt + 1}/{MAX_RETRIES} failed: {e}")
+            if attempt == MAX_RETRIES - 1:
+                raise
+            time.sleep(RETRY_DELAY)
 
 
 def get_db():
@@ -0,0 +1,183 @@
+import atexit
+import os
+import queue
+import shlex
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import xmlrpc.client
+from pathlib import Path
+from app.config import config
+
+
+class _TimeoutTransport(xmlrpc.client.Transport):
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+
+    def make_connection(self, host):
+        connection = super().make_connection(host)
+        connection.timeout = self.timeout
+        return connection
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class OfficeInstance:
+    """
+    Um LibreOffice headless de longa duração, com perfil próprio, exposto
+    pelo unoserver (ponte UNO) e acessado via XML-RPC.
+    """
+
+    def __init__(self, index: int):
+        self.index = index
+        self.conversions = 0
+        self.process: subprocess.Popen | None = None
+        self.port: int | None = None
+        self.profile_dir = (
+            Path(tempfile.gettempdir()) / f"docflow_lo_{os.getpid()}_{index}"
+        )
+
+    def start(self) -> None:
+        self.port = _free_port()
+        cmd = shlex.split(config.UNOSERVER_CMD) + [
+            "--interface",
+            "127.0.0.1",
+            "--port",
+            str(self.port),
+            "--uno-port",
+            str(_free_port()),
+            "--user-installation",
+            str(self.profile_dir),
+            "--conversion-timeout",
+            str(config.LIBREOFFICE_TIMEOUT),
+        ]
+        self.process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+        self.conversions = 0
+
+        deadline = time.monotonic() + config.LIBREOFFICE_STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self.is_healthy():
+                print(f"[LibreOffice] Instância {self.index} pronta (:{self.port})")
+                return
+            if self.process.poll() is not None:
+                break
+            time.sleep(0.5)
+
+        self.stop()
+        raise RuntimeError(f"LibreOffice {self.index} não iniciou a tempo")
+
+    def stop(self) -> None:
+        if self.process is not None and self.process.poll() is None:
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM)
+                self.process.wait(timeout=10)
+            except (ProcessLookupError, subprocess.TimeoutExpired):
+                try:
+                    os.killpg(self.process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+        self.process = None
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def restart(self) -> None:
+        self.stop()
+        self.start()
+
+    def is_healthy(self) -> bool:
+        if self.process is None or self.process.poll() is not None:
+            return False
+        try:
+            self._proxy(timeout=5).info()
+            return True
+        except (OSError, xmlrpc.client.Error):
+            return False
+
+    def convert(self, input_path: str, output_path: str) -> None:
+        self.conversions += 1
+        self._proxy(timeout=config.LIBREOFFICE_TIMEOUT).convert(
+            input_path, None, output_path
+        )
+
+    def _proxy(self, timeout: float) -> xmlrpc.client.ServerProxy:
+        return xmlrpc.client.ServerProxy(
+            f"http://127.0.0.1:{self.port}",
+            transport=_TimeoutTransport(timeout),
+            allow_none=True,
+        )
+
+
+class LibreOfficePool:
+    """
+    Pool de instâncias LibreOffice. As instâncias ociosas ficam numa fila:
+    quem chega espera a próxima livre. Antes de cada uso a instância passa por
+    health check e é reiniciada se estiver fora do ar ou se já atingiu o
+    limite de conversões; travamentos (timeout) também forçam o restart.
+    """
+
+    def __init__(self, size: int):
+        self._idle: queue.Queue[OfficeInstance] = queue.Queue()
+        self._instances = [OfficeInstance(i) for i in range(size)]
+        for instance in self._instances:
+            instance.start()
+            self._idle.put(instance)
+
+    def convert(self, input_path: str, output_path: str) -> None:
+        try:
+            instance = self._idle.get(timeout=config.LIBREOFFICE_QUEUE_TIMEOUT)
+        except queue.Empty:
+            raise TimeoutError("Nenhuma instância LibreOffice disponível")
+
+        try:
+            if (
+                instance.conversions >= config.LIBREOFFICE_MAX_CONVERSIONS
+                or not instance.is_healthy()
+            ):
+                instance.restart()
+
+            instance.convert(input_path, output_path)
+        except OSError:
+            print(f"[LibreOffice] Instância {instance.index} travou, reiniciando")
+            instance.stop()
+            raise
+        finally:
+            self._idle.put(instance)
+
+    def close(self) -> None:
+        for instance in self._instances:
+            instance.stop()
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_libreoffice_pool() -> LibreOfficePool:
+    """
+    Retorna o pool do processo atual (lazy init + lock), encerrado no atexit.
+    """
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            return _pool
+
+        pool = LibreOfficePool(config.LIBREOFFICE_POOL_SIZE)
+        atexit.register(pool.close)
+        _pool = pool
+        return pool
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Enum
+from sqlalchemy import JSON, Column, String, DateTime, Enum, Integer
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from app.infra.db.db import Base
 from app.domain.enums.job_status import JobStatus
@@ -17,6 +17,8 @@ class DocumentJobModel(Base):
     output_path = Column(String)
     status = Column(Enum(JobStatus), nullable=False)
     error_message = Column(String)
+    options = Column(JSON)
+    recoveries = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
     expires_at = Column(DateTime)
@@ -1,14 +1,104 @@
 import json
+from app.config import config
 from .client import get_redis_client
 
 NOTIFICATION_CHANNEL = "job_notifications"
+EVENT_STREAM_PREFIX = "job_events"
+PROGRESS_PREFIX = "job_progress"
+
+# Eventos guardados por cliente para retomada do SSE (Last-Event-ID). O
+# progresso fica de fora para não empurrar os finais para fora do stream:
+# dele só se guarda o último valor de cada job em andamento.
+REPLAYABLE_EVENTS = ("job_completed", "job_failed")
+
+# Grava o evento no stream do cliente, descarta o progresso do job (que
+# terminou) e publica já com o ID do stream, numa única ida ao Redis.
+_PUBLISH_SCRIPT = """
+local id = redis.call(
+    'XADD', KEYS[1], 'MAXLEN', '~', ARGV[3], '*', 'payload', ARGV[2]
+)
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+redis.call('HDEL', KEYS[2], ARGV[5])
+local message = cjson.decode(ARGV[2])
+message['id'] = id
+redis.call('PUBLISH', ARGV[1], cjson.encode(message))
+return id
+"""
+
+_publish_script = None
 
 
 def publish_job_event(event_type: str, data: dict):
     client = get_redis_client()
     payload = {"type": event_type, "data": data}
+    client_id = data.get("client_id")
     try:
-        client.publish(NOTIFICATION_CHANNEL, json.dumps(payload))
-        print(f"[Redis Pub] Publicado {event_type} para {data.get('client_id')}")
+        if event_type in REPLAYABLE_EVENTS and client_id:
+            _publish_replayable(client, client_id, payload)
+        elif event_type == "job_progress" and client_id:
+            _publish_progress(client, client_id, payload)
+        else:
+            client.publish(NOTIFICATION_CHANNEL, json.dumps(payload))
+        print(f"[Redis Pub] Publicado {event_type} para {client_id}")
     except Exception as e:
         print(f"[Redis Pub] Erro ao publicar: {e}")
+
+
+def read_job_events(client_id: str, after_id: str, count: int) -> list[dict]:
+    """Eventos do cliente posteriores a `after_id`, mais antigos primeiro"""
+    entries = get_redis_client().xrange(
+        _stream_key(client_id), min=f"({after_id}", max="+", count=count
+    )
+    return [_from_entry(entry_id, fields) for entry_id, fields in entries]
+
+
+def oldest_job_event_id(client_id: str) -> str | None:
+    entries = get_redis_client().xrange(_stream_key(client_id), count=1)
+    return entries[0][0] if entries else None
+
+
+def read_job_progress(client_id: str) -> list[dict]:
+    """Último evento de progresso de cada job em andamento do cliente"""
+    entries = get_redis_client().hgetall(_progress_key(client_id))
+    return [json.loads(payload) for payload in entries.values()]
+
+
+def _publish_replayable(client, client_id: str, payload: dict) -> None:
+    global _publish_script
+    if _publish_script is None:
+        _publish_script = client.register_script(_PUBLISH_SCRIPT)
+    _publish_script(
+        keys=[_stream_key(client_id), _progress_key(client_id)],
+        args=[
+            NOTIFICATION_CHANNEL,
+            json.dumps(payload),
+            config.SSE_REPLAY_MAX_EVENTS,
+            config.SSE_REPLAY_TTL,
+            payload["data"].get("job_id") or "",
+        ],
+        client=client,
+    )
+
+
+def _publish_progress(client, client_id: str, payload: dict) -> None:
+    message = json.dumps(payload)
+    key = _progress_key(client_id)
+    pipe = client.pipeline()
+    pipe.hset(key, payload["data"].get("job_id") or "", message)
+    pipe.expire(key, config.SSE_REPLAY_TTL)
+    pipe.publish(NOTIFICATION_CHANNEL, message)
+    pipe.execute()
+
+
+def _from_entry(entry_id: str, fields: dict) -> dict:
+    payload = json.loads(fields["payload"])
+    payload["id"] = entry_id
+    return payload
+
+
+def _stream_key(client_id: str) -> str:
+    return f"{EVENT_STREAM_PREFIX}:{client_id}"
+
+
+def _progress_key(client_id: str) -> str:
+    return f"{PROGRESS_PREFIX}:{client_id}"
@@ -1,4 +1,7 @@
+import hashlib
+import os
 from pathlib import Path
+from typing import BinaryIO
 from uuid import UUID
 
 
@@ -20,14 +23,35 @@ def get_client_output_dir(client_id: str | UUID) -> Path:
 
 
 def get_directory_size(directory: Path) -> int:
-    """Calcula tamanho total em bytes de todos os arquivos na pasta (recursivo)"""
-    if not directory.exists() or not directory.is_dir():
-        return 0
+    """
+    Calcula tamanho total em bytes de todos os arquivos na pasta (recursivo).
+    Usa os.scandir, que já traz o tipo de cada entrada sem um stat extra.
+    """
     total = 0
-    for file_path in directory.rglob("*"):
-        if file_path.is_file() and not file_path.is_symlink():
-            try:
-                total += file_path.stat().st_size
-            except (PermissionError, FileNotFoundError):
-                pass
+    pending = [str(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
     return total
+
+
+def save_stream_with_hash(
+    stream: BinaryIO, destination: str | Path, chunk_size: int = 1024 * 1024
+) -> str:
+    """Grava o stream em disco calculando o SHA-256 na mesma passada"""
+    digest = hashlib.sha256()
+    with open(destination, "wb") as f:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+from typing import Callable
+import redis
+from app.infra.redis.client import get_redis_client
+from app.infra.redis.redis_pub import NOTIFICATION_CHANNEL
+
+
+Listener = Callable[[dict], None]
+
+
+class NotificationHub:
+    """
+    Uma única inscrição no canal de notificações por processo, repassada a
+    vários ouvintes (long-poll, SSE, Socket.IO). A thread sobe no primeiro ouvinte.
+
+    Os ouvintes rodam na thread da inscrição e não podem bloquear: só
+    enfileiram ou sinalizam.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], redis.Redis] = get_redis_client,
+        channel: str = NOTIFICATION_CHANNEL,
+    ):
+        self._client_factory = client_factory
+        self._channel = channel
+        self._listeners: list[Listener] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def add_listener(self, listener: Listener) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._listen, name="notification-hub", daemon=True
+                )
+                self._thread.start()
+
+    def remove_listener(self, listener: Listener) -> None:
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def dispatch(self, payload: dict) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(payload)
+            except Exception as e:
+                print(f"[Hub] Erro em ouvinte: {e}")
+
+    def _listen(self) -> None:
+        reconnect_delay = 5
+        while True:
+            try:
+                pubsub = self._client_factory().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self._channel)
+                reconnect_delay = 5
+                print("[Hub] Subscrito ao canal de notificações")
+
+                for message in pubsub.listen():
+                    try:
+                        payload = json.loads(message["data"])
+                    except (TypeError, ValueError):
+                        continue
+                    if isinstance(payload, dict):
+                        self.dispatch(payload)
+            except Exception as e:
+                print(
+                    f"[Hub] Inscrição perdida: {e}. "
+                    f"Reconectando em {reconnect_delay}s..."
+                )
+                time.sleep(reconnect_delay)
+                reconnect_delay = min(reconnect_delay * 2, 60)
+
+
+_hub: NotificationHub | None = None
+_hub_lock = threading.Lock()
+
+
+def get_notification_hub() -> NotificationHub:
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = NotificationHub()
+        return _hub
@@ -0,0 +1,80 @@
+import threading
+from app.realtime.hub import NotificationHub, get_notification_hub
+
+
+class JobStatusWatcher:
+    """
+    Acorda requisições de long-poll quando um job muda de estado: cada
+    evento do hub com `job_id` incrementa o contador do job, se alguém o
+    estiver observando.
+    """
+
+    def __init__(self, hub: NotificationHub | None = None):
+        self._hub = hub
+        self._cond = threading.Condition()
+        self._versions: dict[str, int] = {}
+        self._watchers: dict[str, int] = {}
+        self._started = False
+
+    def watch(self, job_ids: list[str]) -> dict[str, int]:
+        """
+        Passa a observar os jobs e devolve a versão atual de cada um. Deve ser
+        chamado antes de ler o estado, para não perder uma mudança no meio.
+        """
+        self._ensure_started()
+        with self._cond:
+            for job_id in job_ids:
+                self._watchers[job_id] = self._watchers.get(job_id, 0) + 1
+                self._versions.setdefault(job_id, 0)
+            return {job_id: self._versions[job_id] for job_id in job_ids}
+
+    def wait(self, token: dict[str, int], timeout: float) -> bool:
+        """
+        Espera até algum job do token mudar; False se o tempo acabar. O token
+        é atualizado para as versões atuais, pronto para a próxima espera.
+        """
+        with self._cond:
+            changed = self._cond.wait_for(
+                lambda: any(self._versions[j] != v for j, v in token.items()),
+                timeout,
+            )
+            token.update({job_id: self._versions[job_id] for job_id in token})
+            return changed
+
+    def unwatch(self, token: dict[str, int]) -> None:
+        with self._cond:
+            for job_id in token:
+                self._watchers[job_id] -= 1
+                if self._watchers[job_id] == 0:
+                    del self._watchers[job_id]
+                    del self._versions[job_id]
+
+    def notify(self, job_id: str) -> None:
+        with self._cond:
+            if job_id in self._versions:
+                self._versions[job_id] += 1
+                self._cond.notify_all()
+
+    def _ensure_started(self) -> None:
+        with self._cond:
+            if self._started:
+                return
+            self._started = True
+        (self._hub or get_notification_hub()).add_listener(self._on_event)
+
+    def _on_event(self, payload: dict) -> None:
+        job_id = (payload.get("data") or {}).get("job_id")
+        if job_id:
+            self.notify(job_id)
+
+
+_watcher: JobStatusWatcher | None = None
+_watcher_lock = threading.Lock()
+
+
+def get_job_status_watcher() -> JobStatusWatcher:
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = JobStatusWatcher()
+        return _watcher
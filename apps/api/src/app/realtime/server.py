@@ -1,20 +1,33 @@
+import threading
 from flask import request
 from uuid import UUID
 from .core import socketio
 from flask_socketio import join_room, leave_room, emit
 
+_listener_started = False
+_listener_lock = threading.Lock()
+
 
 def init_socketio(app):
     """
-    Inicializa o Socket.IO no app Flask e agenda o listener Redis
-    como background task.
+    Inicializa o Socket.IO no app Flask e registra o listener no hub de
+    notificações. Idempotente: chamadas repetidas não registram o app de
+    novo nem um segundo listener (que emitiria tudo em dobro).
     """
-    socketio.init_app(app)
+    global _listener_started
+
+    if "socketio" not in app.extensions:
+        socketio.init_app(app)
+
+    with _listener_lock:
+        if _listener_started:
+            return
+        _listener_started = True
 
     from .redis_listener import start_redis_listener
 
-    socketio.start_background_task(target=start_redis_listener)
-    print("[Socket.IO] Inicializado + listener Redis agendado como background task")
+    start_redis_listener()
+    print("[Socket.IO] Inicializado + listener registrado no hub de notificações")
 
 
 @socketio.on("connect")
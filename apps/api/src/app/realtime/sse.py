@@ -0,0 +1,174 @@
+import json
+import queue
+import threading
+from typing import Iterator
+from app.config import config
+from app.infra.redis.redis_pub import (
+    REPLAYABLE_EVENTS,
+    oldest_job_event_id,
+    read_job_events,
+    read_job_progress,
+)
+from app.realtime.hub import NotificationHub, get_notification_hub
+
+SUBSCRIBER_QUEUE_SIZE = 1000
+
+# O progresso vai ao vivo, mas não entra no histórico: na conexão o cliente
+# recebe o último valor de cada job em andamento.
+SSE_EVENTS = (*REPLAYABLE_EVENTS, "job_progress")
+
+
+class Subscription:
+    def __init__(self, client_id: str):
+        self.client_id = client_id
+        self.events: queue.Queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        # Fila cheia (cliente lento): a conexão é encerrada e o cliente
+        # retoma pelo Last-Event-ID.
+        self.dropped = False
+
+
+class ClientEventBroker:
+    """
+    Distribui os eventos do hub para as conexões SSE de cada cliente. Todas
+    as conexões do processo compartilham a mesma inscrição no Redis.
+    """
+
+    def __init__(self, hub: NotificationHub | None = None):
+        self._hub = hub
+        self._subscriptions: dict[str, set[Subscription]] = {}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def subscribe(self, client_id: str) -> Subscription:
+        subscription = Subscription(client_id)
+        with self._lock:
+            self._subscriptions.setdefault(client_id, set()).add(subscription)
+            start = not self._started
+            self._started = True
+        if start:
+            (self._hub or get_notification_hub()).add_listener(self.publish)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.client_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.client_id]
+
+    def publish(self, payload: dict) -> None:
+        if payload.get("type") not in SSE_EVENTS:
+            return
+        client_id = (payload.get("data") or {}).get("client_id")
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(client_id, ()))
+
+        for subscription in subscriptions:
+            try:
+                subscription.events.put_nowait(payload)
+            except queue.Full:
+                subscription.dropped = True
+                self.unsubscribe(subscription)
+
+
+_broker: ClientEventBroker | None = None
+_broker_lock = threading.Lock()
+
+
+def get_event_broker() -> ClientEventBroker:
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = ClientEventBroker()
+        return _broker
+
+
+def format_event(payload: dict) -> str:
+    lines = []
+    if payload.get("id"):
+        lines.append(f"id: {payload['id']}")
+    lines.append(f"event: {payload['type']}")
+    lines.append(f"data: {json.dumps(payload.get('data', {}))}")
+    return "\n".join(lines) + "\n\n"
+
+
+def event_stream(
+    broker: ClientEventBroker,
+    client_id: str,
+    last_event_id: str | None = None,
+    heartbeat: float = config.SSE_HEARTBEAT_SECONDS,
+) -> Iterator[str]:
+    """
+    Corpo da resposta SSE. Inscreve antes de ler o histórico, para nada
+    escapar entre os dois, e descarta os eventos ao vivo já reenviados.
+    Em seguida manda o progresso atual dos jobs em andamento. Comentários
+    periódicos mantêm proxies abertos e revelam desconexões.
+    """
+    subscription = broker.subscribe(client_id)
+    try:
+        yield f"retry: {config.SSE_RETRY_MS}\n\n"
+
+        last_seen = _parse_event_id(last_event_id)
+        if last_seen is not None:
+            for payload in _replay(client_id, last_event_id):
+                if payload["type"] == "resync":
+                    yield format_event(payload)
+                    continue
+                last_seen = max(last_seen, _parse_event_id(payload["id"]))
+                yield format_event(payload)
+
+        for payload in _latest_progress(client_id):
+            yield format_event(payload)
+
+        while True:
+            try:
+                payload = subscription.events.get(timeout=heartbeat)
+            except queue.Empty:
+                if subscription.dropped:
+                    return
+                yield ": ping\n\n"
+                continue
+
+            event_id = _parse_event_id(payload.get("id"))
+            if last_seen and event_id and event_id <= last_seen:
+                continue
+            yield format_event(payload)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+def _replay(client_id: str, last_event_id: str) -> list[dict]:
+    """
+    Eventos perdidos desde `last_event_id`. Se o histórico já não cobre esse
+    ponto (expirou ou foi aparado), manda antes um `resync` para o cliente
+    reler o estado dos jobs em GET /documents/jobs.
+    """
+    try:
+        oldest = oldest_job_event_id(client_id)
+        events = read_job_events(client_id, last_event_id, config.SSE_REPLAY_MAX_EVENTS)
+    except Exception as e:
+        print(f"[SSE] Falha ao ler o histórico do cliente {client_id}: {e}")
+        return [{"type": "resync", "data": {}}]
+
+    if oldest is None or _parse_event_id(oldest) > _parse_event_id(last_event_id):
+        return [{"type": "resync", "data": {}}, *events]
+    return events
+
+
+def _latest_progress(client_id: str) -> list[dict]:
+    try:
+        return read_job_progress(client_id)
+    except Exception as e:
+        print(f"[SSE] Falha ao ler o progresso do cliente {client_id}: {e}")
+        return []
+
+
+def _parse_event_id(event_id: str | None) -> tuple[int, int] | None:
+    """IDs de stream do Redis ("<ms>-<seq>") comparáveis como tuplas"""
+    try:
+        millis, seq = event_id.split("-")
+        return int(millis), int(seq)
+    except (AttributeError, ValueError):
+        return None
@@ -1,9 +1,9 @@
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from uuid import UUID
 from datetime import datetime, timezone
 from app.domain.entities.client_storage import ClientStorage
 from app.infra.models.client_storage_model import ClientStorageModel
-from app.infra.utils import get_directory_size, get_client_output_dir
 
 
 class ClientStorageRepository:
@@ -23,16 +23,50 @@ class ClientStorageRepository:
         self.db.commit()
         self.db.refresh(model)
 
-    def update_size(self, client_id: UUID, new_size_bytes: int) -> None:
-        model = self._get_model(client_id)
-        if not model:
-            return
-
-        model.size_bytes = new_size_bytes
-        model.last_calculated_at = datetime.utcnow()
+    def update_size(self, client_id: UUID, delta_bytes: int) -> None:
+        """
+        Soma `delta_bytes` ao uso do cliente num único UPDATE atômico, sem
+        perder incrementos de workers concorrentes.
+        """
+        self.db.execute(
+            update(ClientStorageModel)
+            .where(ClientStorageModel.client_id == client_id)
+            .values(size_bytes=ClientStorageModel.size_bytes + delta_bytes)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
 
+    def reconcile_size(self, client_id: UUID, recorded: int, measured: int) -> bool:
+        """
+        Troca o uso registrado pelo medido em disco, só se o registro ainda
+        for `recorded`. False se algum upload ou conversão mudou o valor
+        durante a medição: o ajuste fica para a próxima conferência.
+        """
+        result = self.db.execute(
+            update(ClientStorageModel)
+            .where(
+                ClientStorageModel.client_id == client_id,
+                ClientStorageModel.size_bytes == recorded,
+            )
+            .values(size_bytes=measured, last_calculated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
-        self.db.refresh(model)
+        return result.rowcount == 1
+
+    def get_size(self, client_id: UUID) -> int | None:
+        row = (
+            self.db.query(ClientStorageModel.size_bytes)
+            .filter_by(client_id=client_id)
+            .first()
+        )
+        return None if row is None else row.size_bytes or 0
+
+    def get_sizes(self) -> dict[UUID, int]:
+        rows = self.db.query(
+            ClientStorageModel.client_id, ClientStorageModel.size_bytes
+        ).all()
+        return {client_id: size or 0 for client_id, size in rows}
 
     def get_by_client_id(self, client_id: UUID | str) -> ClientStorage | None:
         if isinstance(client_id, str):
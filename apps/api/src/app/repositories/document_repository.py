@@ -1,8 +1,10 @@
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.job_status import JobStatus
 from app.infra.models.document_job_model import DocumentJobModel
 
 
@@ -12,45 +14,76 @@ class DocumentRepository:
         self.db = db
 
     def save(self, job: DocumentJob) -> None:
-        model = DocumentJobModel(
-            id=job.id,
+        model = self._to_model(job)
+
+        self.db.add(model)
+        self.db.commit()
+
+    def save_many(self, jobs: list[DocumentJob]) -> None:
+        """Insere todos os jobs numa única transação"""
+        self.db.add_all([self._to_model(job) for job in jobs])
+        self.db.commit()
+
+    def update(self, job: DocumentJob) -> None:
+        self._update(
+            job,
             conversion_type=job.conversion_type,
             input_filename=job.input_filename,
             input_path=job.input_path,
             output_path=job.output_path,
             status=job.status,
             error_message=job.error_message,
+            options=job.options,
+            recoveries=job.recoveries,
             created_at=job.created_at,
             updated_at=job.updated_at,
             expires_at=job.expires_at,
         )
 
-        self.db.add(model)
+    def update_status(self, job: DocumentJob) -> None:
+        """Grava só as colunas que mudam numa transição de status"""
+        self._update(job, **self._status_values(job))
+
+    def finish(self, job: DocumentJob, claimed_at: datetime) -> bool:
+        """
+        Grava o estado final só se o job ainda for de quem o processou: em
+        processamento e com o lease (updated_at) que esse worker renovou por
+        último. False quando outro worker o assumiu nesse meio-tempo.
+        """
+        result = self.db.execute(
+            update(DocumentJobModel)
+            .where(DocumentJobModel.id == job.id)
+            .where(DocumentJobModel.status == JobStatus.PROCESSING)
+            .where(DocumentJobModel.updated_at == claimed_at)
+            .values(**self._status_values(job))
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
-        self.db.refresh(model)
+        return result.rowcount == 1
 
-    def update(self, job: DocumentJob) -> None:
-        model = (
-            self.db.query(DocumentJobModel)
-            .filter(DocumentJobModel.id == job.id)
-            .first()
+    @staticmethod
+    def _status_values(job: DocumentJob) -> dict:
+        return dict(
+            output_path=job.output_path,
+            status=job.status,
+            error_message=job.error_message,
+            updated_at=job.updated_at,
+            expires_at=job.expires_at,
         )
 
-        if not model:
+    def _update(self, job: DocumentJob, **values) -> None:
+        # UPDATE direto, sem SELECT antes nem refresh depois.
+        result = self.db.execute(
+            update(DocumentJobModel)
+            .where(DocumentJobModel.id == job.id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            self.db.rollback()
             raise ValueError(f"Job {job.id} não encontrado para atualização")
 
-        model.conversion_type = job.conversion_type
-        model.input_filename = job.input_filename
-        model.input_path = job.input_path
-        model.output_path = job.output_path
-        model.status = job.status
-        model.error_message = job.error_message
-        model.created_at = job.created_at
-        model.updated_at = job.updated_at
-        model.expires_at = job.expires_at
-
         self.db.commit()
-        self.db.refresh(model)
 
     def get_by_id(self, job_id: str | UUID) -> DocumentJob | None:
         if isinstance(job_id, str):
@@ -66,6 +99,103 @@ class DocumentRepository:
 
         return self._to_domain(model)
 
+    def get_many(self, job_ids: list[str | UUID]) -> list[DocumentJob]:
+        ids = [UUID(str(job_id)) for job_id in job_ids]
+        models = (
+            self.db.query(DocumentJobModel).filter(DocumentJobModel.id.in_(ids)).all()
+        )
+
+        return [self._to_domain(m) for m in models]
+
+    def get_status(self, job_id: UUID) -> JobStatus | None:
+        return self.db.execute(
+            select(DocumentJobModel.status).where(DocumentJobModel.id == job_id)
+        ).scalar_one_or_none()
+
+    def claim(self, job_id: UUID, lease_seconds: int) -> DocumentJob | None:
+        """
+        Passa o job para processamento se estiver pendente ou com o lease
+        vencido (worker que parou no meio). O UPDATE é condicional, então só
+        um worker consegue o job; os demais recebem None.
+        """
+        now = datetime.utcnow()
+        stale = now - timedelta(seconds=lease_seconds)
+        stmt = (
+            update(DocumentJobModel)
+            .where(DocumentJobModel.id == job_id)
+            .where(
+                or_(
+                    DocumentJobModel.status == JobStatus.PENDING,
+                    and_(
+                        DocumentJobModel.status == JobStatus.PROCESSING,
+                        DocumentJobModel.updated_at < stale,
+                    ),
+                )
+            )
+            .values(status=JobStatus.PROCESSING, updated_at=now)
+            .returning(DocumentJobModel)
+            .execution_options(synchronize_session=False)
+        )
+
+        model = self.db.execute(stmt).scalars().first()
+        job = self._to_domain(model) if model else None
+        self.db.commit()
+        return job
+
+    def renew_lease(self, job_id: UUID, claimed_at: datetime) -> datetime | None:
+        """
+        Renova o lease (updated_at) se o job ainda for de quem o renovou por
+        último. Devolve o novo valor, ou None se outro worker o assumiu.
+        """
+        now = datetime.utcnow()
+        result = self.db.execute(
+            update(DocumentJobModel)
+            .where(DocumentJobModel.id == job_id)
+            .where(DocumentJobModel.status == JobStatus.PROCESSING)
+            .where(DocumentJobModel.updated_at == claimed_at)
+            .values(updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return now if result.rowcount == 1 else None
+
+    def requeue(self, job: DocumentJob) -> bool:
+        """
+        Devolve a pendente um job em processamento que perdeu o worker, desde
+        que ninguém o tenha assumido desde a leitura (mesmo updated_at).
+        """
+        now = datetime.utcnow()
+        result = self.db.execute(
+            update(DocumentJobModel)
+            .where(DocumentJobModel.id == job.id)
+            .where(DocumentJobModel.status == JobStatus.PROCESSING)
+            .where(DocumentJobModel.updated_at == job.updated_at)
+            .values(
+                status=JobStatus.PENDING,
+                recoveries=DocumentJobModel.recoveries + 1,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        if result.rowcount != 1:
+            return False
+        job.status = JobStatus.PENDING
+        job.recoveries += 1
+        job.updated_at = now
+        return True
+
+    def get_stale_jobs(self, stale_after_seconds: int) -> list[DocumentJob]:
+        stale = datetime.utcnow() - timedelta(seconds=stale_after_seconds)
+        models = (
+            self.db.query(DocumentJobModel)
+            .filter(DocumentJobModel.status == JobStatus.PROCESSING)
+            .filter(DocumentJobModel.updated_at < stale)
+            .all()
+        )
+
+        return [self._to_domain(m) for m in models]
+
     def get_expired_jobs(self) -> list[DocumentJob]:
         models = (
             self.db.query(DocumentJobModel)
@@ -75,6 +205,22 @@ class DocumentRepository:
 
         return [self._to_domain(m) for m in models]
 
+    def _to_model(self, job: DocumentJob) -> DocumentJobModel:
+        return DocumentJobModel(
+            id=job.id,
+            conversion_type=job.conversion_type,
+            input_filename=job.input_filename,
+            input_path=job.input_path,
+            output_path=job.output_path,
+            status=job.status,
+            error_message=job.error_message,
+            options=job.options or None,
+            recoveries=job.recoveries,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            expires_at=job.expires_at,
+        )
+
     def _to_domain(self, model: DocumentJobModel) -> DocumentJob:
         return DocumentJob(
             id=model.id,
@@ -84,6 +230,8 @@ class DocumentRepository:
             output_path=model.output_path,
             status=model.status,
             error_message=model.error_message,
+            options=model.options or {},
+            recoveries=model.recoveries or 0,
             created_at=model.created_at,
             updated_at=model.updated_at,
             expires_at=model.expires_at,
@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from uuid import UUID
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO, Callable
 from app.domain.entities.document_job import DocumentJob
+from app.domain.entities.converter_spec import get_converter_spec
 from app.domain.enums.conversion_type import ConversionType
-from app.infra.utils import get_client_input_dir, get_client_output_dir
+from app.infra.utils import (
+    get_client_input_dir,
+    get_client_output_dir,
+    save_stream_with_hash,
+)
 
 if TYPE_CHECKING:
     from app.repositories.document_repository import DocumentRepository
@@ -26,11 +31,56 @@ class DocumentService:
         client_id: UUID,
         conversion_type: ConversionType,
         input_filename: str,
+        options: dict | None = None,
+    ) -> DocumentJob:
+        job = self._build_job(client_id, conversion_type, input_filename, options)
+
+        self.job_repo.save(job)
+        return job
+
+    def create_batch(
+        self,
+        client_id: UUID,
+        conversion_type: ConversionType,
+        inputs: list[tuple[str, Callable[[], BinaryIO]]],
+        options: dict | None = None,
+    ) -> list[tuple[DocumentJob, str]]:
+        """
+        Grava os arquivos do lote e insere todos os jobs numa única transação.
+        Devolve cada job com o hash do seu arquivo de entrada. Se algo falhar,
+        os arquivos já gravados são removidos e nenhum job é criado.
+        """
+        jobs = []
+        hashes = []
+        try:
+            for filename, open_stream in inputs:
+                job = self._build_job(client_id, conversion_type, filename, options)
+                jobs.append(job)
+                with open_stream() as stream:
+                    hashes.append(save_stream_with_hash(stream, job.input_path))
+
+            self.job_repo.save_many(jobs)
+        except Exception:
+            for job in jobs:
+                Path(job.input_path).unlink(missing_ok=True)
+            raise
+
+        written = sum(Path(job.input_path).stat().st_size for job in jobs)
+        self.storage_repo.update_size(client_id, written)
+        return list(zip(jobs, hashes))
+
+    def _build_job(
+        self,
+        client_id: UUID,
+        conversion_type: ConversionType,
+        input_filename: str,
+        options: dict | None = None,
     ) -> DocumentJob:
         job = DocumentJob(
             conversion_type=conversion_type,
             input_filename=input_filename,
             input_path="",
+            options=options or {},
         )
 
         input_dir = get_client_input_dir(client_id)
@@ -42,17 +92,8 @@ class DocumentService:
         input_path = input_dir / f"{job.id}_{input_filename}"
         job.input_path = str(input_path)
 
-        ext_map = {
-            ConversionType.CSV_TO_JSON: "json",
-            ConversionType.CSV_TO_XLSX: "xlsx",
-            ConversionType.XLSX_TO_CSV: "csv",
-            ConversionType.TXT_TO_PDF: "pdf",
-            ConversionType.PDF_TO_TEXT: "txt",
-            ConversionType.DOCX_TO_PDF: "pdf",
-            ConversionType.DOCX_TO_MARKDOWN: "md",
-        }
-        ext = ext_map.get(conversion_type, "out")
+        spec = get_converter_spec(conversion_type)
+        ext = spec.output_extension if spec else "out"
         job.output_path = str(output_dir / f"{job.id}.{ext}")
 
-        self.job_repo.save(job)
         return job
@@ -1,6 +1,12 @@
+from pathlib import Path
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init
+from kombu import Queue
 from app.config import config
+from app.workers.routing import CONVERSION_QUEUES, DEFAULT_QUEUE
+from app.domain.enums.converter_resource import ConverterResource
+from app.workers.scheduling import MAX_PRIORITY
 
 celery = Celery(
     "document_processor",
@@ -9,6 +15,8 @@ celery = Celery(
     include=[
         "app.workers.tasks.conversion_worker",
         "app.workers.tasks.cleanup_old_files",
+        "app.workers.tasks.recover_stale_jobs",
+        "app.workers.tasks.reconcile_storage",
     ],
 )
 
@@ -17,6 +25,26 @@ celery.conf.update(
     task_serializer="json",
     result_serializer="json",
     accept_content=["json"],
+    task_default_queue=DEFAULT_QUEUE,
+    # Filas de conversão com prioridade (faixa rápida e divisão entre clientes).
+    task_queues=[
+        Queue(DEFAULT_QUEUE),
+        *(
+            Queue(name, queue_arguments={"x-max-priority": MAX_PRIORITY})
+            for name in CONVERSION_QUEUES.values()
+        ),
+    ],
+    # Conversões são enfileiradas com a fila do tipo (ver enqueue_conversion);
+    # esta rota só vale para chamadas sem fila explícita.
+    task_routes={
+        "process_conversion": {
+            "queue": CONVERSION_QUEUES[ConverterResource.CPU_BOUND]
+        },
+    },
+    worker_prefetch_multiplier=config.WORKER_PREFETCH_MULTIPLIER,
+    # Ack só ao fim da tarefa: se o worker cair, o broker reentrega e o
+    # claim no banco garante que apenas um worker converte o job.
+    task_acks_late=True,
 )
 
 celery.conf.beat_schedule = {
@@ -24,4 +52,47 @@ celery.conf.beat_schedule = {
         "task": "app.workers.tasks.cleanup_old_files.cleanup_expired_files",
         "schedule": crontab(minute="*/1"),
     },
+    "recover-stale-jobs": {
+        "task": "app.workers.tasks.recover_stale_jobs.recover_stale_jobs",
+        "schedule": crontab(minute="*/5"),
+    },
+    "reconcile-storage-usage": {
+        "task": "app.workers.tasks.reconcile_storage.reconcile_storage_usage",
+        "schedule": crontab(minute=f"*/{config.STORAGE_RECONCILE_MINUTES}"),
+    },
 }
+
+
+@worker_init.connect
+def preload_converters(**kwargs):
+    """
+    Importa os conversores no processo principal, antes do fork: os filhos
+    do prefork já nascem com os módulos carregados. Nos pools sem processos
+    filhos, o aquecimento completo acontece aqui.
+    """
+    from app.workers.registry import registry
+
+    if config.WORKER_READY_FILE:
+        Path(config.WORKER_READY_FILE).unlink(missing_ok=True)
+
+    if config.WORKER_POOL == "prefork":
+        registry.load()
+    else:
+        _warm_up()
+
+
+@worker_process_init.connect
+def warm_up_converters(**kwargs):
+    _warm_up()
+
+
+def _warm_up():
+    from app.workers.registry import registry
+    from app.workers.warmup import report_readiness, warm_up_converters
+
+    if not config.WORKER_WARM_UP:
+        registry.load()
+        return
+
+    results = warm_up_converters(registry)
+    report_readiness(results, config.WORKER_READY_FILE)
@@ -0,0 +1,27 @@
+from app.workers.converters.sniffing import CsvDialect
+from app.workers.converters.tabular import (
+    read_csv_into,
+    write_arrow_ipc,
+    write_parquet,
+)
+
+
+def convert_parquet(
+    input_path: str, output_path: str, dialect: CsvDialect | None = None
+) -> None:
+    read_csv_into(
+        input_path,
+        lambda reader: write_parquet(reader, output_path),
+        dialect=dialect,
+    )
+
+
+def convert_arrow(
+    input_path: str, output_path: str, dialect: CsvDialect | None = None
+) -> None:
+    """Arrow IPC em formato de arquivo (o mesmo do Feather v2)"""
+    read_csv_into(
+        input_path,
+        lambda reader: write_arrow_ipc(reader, output_path),
+        dialect=dialect,
+    )
@@ -1,6 +1,74 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from app.config import config
+from app.workers.converters.sniffing import CsvDialect
+from app.workers.converters.tabular import read_csv_into
 
 
-def convert(input_path: str, output_path: str) -> None:
-    df = pd.read_csv(input_path, encoding="utf-8")
-    df.to_json(output_path, orient="records", indent=4, force_ascii=False)
+CHUNK_SIZE = 50_000
+
+
+def convert(
+    input_path: str, output_path: str, dialect: CsvDialect | None = None
+) -> None:
+    _convert(input_path, output_path, lines=False, dialect=dialect)
+
+
+def convert_ndjson(
+    input_path: str, output_path: str, dialect: CsvDialect | None = None
+) -> None:
+    _convert(input_path, output_path, lines=True, dialect=dialect)
+
+
+def _convert(
+    input_path: str, output_path: str, lines: bool, dialect: CsvDialect | None
+) -> None:
+    indent = None if lines else (config.JSON_INDENT or None)
+
+    def write(reader: pa.RecordBatchReader) -> None:
+        frames = (_to_frame(batch) for batch in reader)
+        with open(output_path, "w", encoding="utf-8") as f:
+            if lines:
+                _write_lines(f, frames)
+            else:
+                _write_array(f, frames, indent)
+
+    read_csv_into(input_path, write, dialect=dialect, max_rows=CHUNK_SIZE)
+
+
+def _to_frame(batch: pa.RecordBatch) -> pd.DataFrame:
+    """Datas inferidas pelo Arrow saem como texto ISO, e não como epoch"""
+    columns = [
+        pc.cast(column, pa.string()) if pa.types.is_temporal(column.type) else column
+        for column in batch.columns
+    ]
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names).to_pandas()
+
+
+def _write_lines(f, frames) -> None:
+    for chunk in frames:
+        body = chunk.to_json(orient="records", lines=True, force_ascii=False)
+        if not body:
+            continue
+        f.write(body)
+        if not body.endswith("\n"):
+            f.write("\n")
+
+
+def _write_array(f, frames, indent: int | None) -> None:
+    """Escreve um array JSON único, serializando um chunk por vez."""
+    f.write("[")
+    first = True
+
+    for chunk in frames:
+        body = chunk.to_json(orient="records", indent=indent, force_ascii=False)
+        body = body.strip()[1:-1].rstrip()
+        if not body:
+            continue
+        if not first:
+            f.write(",")
+        f.write(body)
+        first = False
+
+    f.write("\n]" if indent and not first else "]")
@@ -1,10 +1,52 @@
-import pandas as pd
+import pyarrow as pa
+from openpyxl import Workbook
+from app.config import config
+from app.workers.converters.sniffing import CsvDialect, sniff_csv
+from app.workers.converters.tabular import iter_rows, read_csv_into
 
 
-def convert(input_path: str, output_path: str) -> None:
-    try:
-        df = pd.read_csv(input_path, encoding="utf-8", encoding_errors="replace")
-    except UnicodeDecodeError:
-        df = pd.read_csv(input_path, encoding="latin1")
+CHUNK_SIZE = 50_000
+MAX_SHEET_ROWS = 1_048_576
 
-    df.to_excel(output_path, index=False, engine="openpyxl")
+
+def convert(
+    input_path: str,
+    output_path: str,
+    as_text: bool | None = None,
+    dialect: CsvDialect | None = None,
+) -> None:
+    """
+    Converte CSV em XLSX em modo write-only: cada record batch lido do CSV vai
+    direto para a planilha, sem montar o workbook inteiro em memória. Ao
+    atingir o limite de linhas do Excel, a escrita continua em uma nova aba.
+    """
+    if as_text is None:
+        as_text = config.CSV_TO_XLSX_AS_TEXT
+
+    def write(reader: pa.RecordBatchReader) -> None:
+        wb = Workbook(write_only=True)
+        header = reader.schema.names if dialect.has_header else []
+        ws = _new_sheet(wb, header)
+        sheet_rows = 1 if header else 0
+
+        for batch in reader:
+            for row in iter_rows(batch):
+                if sheet_rows >= MAX_SHEET_ROWS:
+                    ws = _new_sheet(wb, header)
+                    sheet_rows = 1 if header else 0
+                ws.append(row)
+                sheet_rows += 1
+
+        wb.save(output_path)
+
+    dialect = dialect or sniff_csv(input_path)
+    read_csv_into(
+        input_path, write, dialect=dialect, as_text=as_text, max_rows=CHUNK_SIZE
+    )
+
+
+def _new_sheet(wb: Workbook, header: list):
+    ws = wb.create_sheet(f"Sheet{len(wb.worksheets) + 1}")
+    if header:
+        ws.append(header)
+    return ws
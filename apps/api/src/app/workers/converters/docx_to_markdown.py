@@ -1,11 +1,111 @@
+import mimetypes
+import shutil
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+import mammoth
 from markitdown import MarkItDown
+from markitdown.converters import DocxConverter
+from markitdown.converter_utils.docx.pre_process import pre_process_docx
 
 
-def convert(input_path: str, output_path: str) -> None:
-    md = MarkItDown()
-    result = md.convert(input_path)
+MEDIA_DIRNAME = "media"
 
-    content = result.text_content
+_markitdown = None
+_markitdown_lock = threading.Lock()
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(content)
+
+def convert(input_path: str, output_path: str) -> str:
+    """
+    Converte DOCX em Markdown extraindo as imagens para arquivos separados,
+    referenciados no Markdown, em vez de embuti-las em base64.
+
+    Sem imagens, o Markdown é gravado em `output_path`. Com imagens, o
+    Markdown e a pasta `media/` são agrupados em um .zip ao lado de
+    `output_path`; o caminho final gerado é retornado.
+    """
+    output_path = Path(output_path)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        media_dir = Path(tmp_dir) / MEDIA_DIRNAME
+        result = get_markitdown().convert(input_path, media_dir=media_dir)
+        images = sorted(media_dir.iterdir()) if media_dir.is_dir() else []
+
+        if not images:
+            with open(output_path, "w", encoding="utf-8") as f:
+                f.write(result.text_content)
+            return str(output_path)
+
+        bundle_path = output_path.with_suffix(".zip")
+        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr(output_path.name, result.text_content)
+            for image in images:
+                bundle.write(
+                    image,
+                    arcname=f"{MEDIA_DIRNAME}/{image.name}",
+                    compress_type=zipfile.ZIP_STORED,
+                )
+
+    return str(bundle_path)
+
+
+def get_markitdown() -> MarkItDown:
+    """
+    Retorna a instância MarkItDown do processo (lazy init + lock), já com o
+    conversor DOCX que extrai imagens registrado.
+    """
+    global _markitdown
+    if _markitdown is not None:
+        return _markitdown
+
+    with _markitdown_lock:
+        if _markitdown is not None:
+            return _markitdown
+
+        md = MarkItDown()
+        # Registros posteriores com a mesma prioridade têm precedência.
+        md.register_converter(SidecarDocxConverter())
+        _markitdown = md
+        return md
+
+
+def warm_up() -> None:
+    get_markitdown()
+
+
+class SidecarDocxConverter(DocxConverter):
+    """
+    DocxConverter que, quando recebe `media_dir`, grava cada imagem embutida
+    em disco e aponta o <img> para o arquivo, em vez de gerar data URIs.
+    """
+
+    def convert(self, file_stream, stream_info, **kwargs):
+        media_dir = kwargs.pop("media_dir", None)
+        if media_dir is None:
+            return super().convert(file_stream, stream_info, **kwargs)
+
+        html = mammoth.convert_to_html(
+            pre_process_docx(file_stream),
+            style_map=kwargs.get("style_map"),
+            convert_image=mammoth.images.img_element(_MediaWriter(media_dir)),
+        ).value
+
+        return self._html_converter.convert_string(html, **kwargs)
+
+
+class _MediaWriter:
+    def __init__(self, media_dir: Path):
+        self.media_dir = Path(media_dir)
+        self.count = 0
+
+    def __call__(self, image) -> dict:
+        self.count += 1
+        extension = mimetypes.guess_extension(image.content_type or "") or ".bin"
+        filename = f"image{self.count}{extension}"
+
+        self.media_dir.mkdir(parents=True, exist_ok=True)
+        with image.open() as src, open(self.media_dir / filename, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+        return {"src": f"{MEDIA_DIRNAME}/{filename}"}
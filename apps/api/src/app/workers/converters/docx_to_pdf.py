@@ -1,15 +1,39 @@
-import subprocess
 import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from app.config import config
+from app.infra.libreoffice.pool import get_libreoffice_pool
 
 
 def convert(input_path: str, output_path: str) -> None:
-    cmd = [
-        "soffice",
-        "--headless",
-        "--convert-to",
-        "pdf",
-        "--outdir",
-        os.path.dirname(output_path),
-        input_path,
-    ]
-    subprocess.run(cmd, check=True)
+    input_path = os.path.abspath(input_path)
+    output_path = os.path.abspath(output_path)
+
+    if config.LIBREOFFICE_POOL_SIZE > 0:
+        get_libreoffice_pool().convert(input_path, output_path)
+        return
+
+    _convert_with_soffice(input_path, output_path)
+
+
+def _convert_with_soffice(input_path: str, output_path: str) -> None:
+    """
+    Fallback sem pool: sobe um soffice por conversão, com perfil próprio
+    para permitir execuções paralelas, e move o PDF para `output_path`.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        profile_dir = Path(tmp_dir) / "profile"
+        cmd = [
+            "soffice",
+            f"-env:UserInstallation={profile_dir.as_uri()}",
+            "--headless",
+            "--convert-to",
+            "pdf",
+            "--outdir",
+            tmp_dir,
+            input_path,
+        ]
+        subprocess.run(cmd, check=True, timeout=config.LIBREOFFICE_TIMEOUT)
+        shutil.move(Path(tmp_dir) / f"{Path(input_path).stem}.pdf", output_path)
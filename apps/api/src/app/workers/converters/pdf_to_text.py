@@ -1,13 +1,83 @@
+from itertools import islice
 import pdfplumber
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdftypes import resolve1
+from pdfplumber.page import Page
+from app.domain.entities.page_selection import PageSelection
+from app.workers.parallel import imap_ordered
+from app.workers.progress import report_progress
 
 
-def convert(input_path: str, output_path: str) -> None:
-    with pdfplumber.open(input_path) as pdf:
-        text = ""
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text += page_text + "\n\n"
+PAGES_PER_SHARD = 10
+
+
+def convert(
+    input_path: str,
+    output_path: str,
+    pages: str | None = None,
+    max_pages: int | None = None,
+) -> None:
+    """
+    Extrai o texto do PDF dividindo as páginas em blocos processados em
+    paralelo. Cada processo abre o PDF por conta própria e os blocos são
+    gravados no arquivo de saída em ordem, conforme ficam prontos.
+
+    Com `pages` ("1-5,8,10-") e/ou `max_pages`, só as páginas pedidas são
+    lidas: a contagem vem do catálogo e a árvore de páginas é percorrida só
+    até a última página necessária.
+    """
+    selection = PageSelection.parse(pages, max_pages)
+    indexes = selection.resolve(_page_count(input_path))
+
+    shards = [
+        (input_path, indexes[start : start + PAGES_PER_SHARD])
+        for start in range(0, len(indexes), PAGES_PER_SHARD)
+    ]
 
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(text.strip())
+        previous = None
+        done = 0
+        for texts in imap_ordered(_extract_shard, shards):
+            done += len(texts)
+            report_progress(done, len(indexes))
+            for page_text in texts:
+                if not page_text:
+                    continue
+                if previous is None:
+                    previous = page_text.lstrip()
+                    continue
+                f.write(previous)
+                f.write("\n\n")
+                previous = page_text
+
+        if previous is not None:
+            f.write(previous.rstrip())
+
+
+def _page_count(input_path: str) -> int:
+    with open(input_path, "rb") as stream:
+        pdf = pdfplumber.PDF(stream)
+        count = resolve1(resolve1(pdf.doc.catalog.get("Pages")) or {}).get("Count")
+        if isinstance(count, int):
+            return count
+        return sum(1 for _ in PDFPage.create_pages(pdf.doc))
+
+
+def _extract_shard(shard: tuple[str, list[int]]) -> list[str]:
+    input_path, indexes = shard
+    wanted = set(indexes)
+    texts = []
+
+    # Sem o `with pdfplumber.open(...)`: o close() do pdfplumber monta a lista
+    # de todas as páginas do documento só para fechá-las.
+    with open(input_path, "rb") as stream:
+        pdf = pdfplumber.PDF(stream)
+        pages = islice(PDFPage.create_pages(pdf.doc), max(indexes) + 1)
+        for index, pdfminer_page in enumerate(pages):
+            if index not in wanted:
+                continue
+            page = Page(pdf, pdfminer_page, page_number=index + 1, initial_doctop=0)
+            texts.append(page.extract_text() or "")
+            page.close()
+
+    return texts
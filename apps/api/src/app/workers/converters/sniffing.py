@@ -0,0 +1,157 @@
+import codecs
+import csv
+import io
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+
+
+SAMPLE_BYTES = 256 * 1024
+SAMPLE_ROWS = 200
+CANDIDATE_DELIMITERS = (",", ";", "\t", "|")
+CANDIDATE_QUOTES = ('"', "'")
+FALLBACK_ENCODINGS = ("cp1252", "latin-1")
+
+
+class CsvSniffError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class CsvDialect:
+    encoding: str = "utf-8"
+    delimiter: str = ","
+    quotechar: str = '"'
+    has_header: bool = True
+    columns: tuple[str, ...] = ()
+
+
+def sniff_csv(path: str | Path) -> CsvDialect:
+    """
+    Detecta encoding (incluindo BOM), delimitador, aspas e cabeçalho lendo só
+    o começo do arquivo. Conteúdo binário falha aqui, antes do parse completo.
+    """
+    with open(path, "rb") as f:
+        raw = f.read(SAMPLE_BYTES)
+        truncated = bool(f.read(1))
+
+    if not raw:
+        return CsvDialect()
+
+    encoding, text = _detect_encoding(raw, truncated)
+    if "\x00" in text:
+        raise CsvSniffError("Arquivo não parece ser um CSV de texto")
+
+    if truncated:
+        # Descarta a última linha, que pode ter sido cortada na amostra.
+        text = text[: text.rfind("\n") + 1] or text
+
+    delimiter = _detect_delimiter(text)
+    quotechar = _detect_quotechar(text, delimiter)
+    rows = [row for row in _parse_rows(text, delimiter, quotechar) if row]
+    has_header = _detect_header(rows)
+
+    if has_header:
+        columns = tuple(rows[0]) if rows else ()
+    else:
+        width = Counter(len(row) for row in rows).most_common(1)[0][0]
+        columns = tuple(str(i) for i in range(width))
+
+    return CsvDialect(
+        encoding=encoding,
+        delimiter=delimiter,
+        quotechar=quotechar,
+        has_header=has_header,
+        columns=columns,
+    )
+
+
+def _detect_encoding(raw: bytes, truncated: bool) -> tuple[str, str]:
+    if raw.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig", raw[len(codecs.BOM_UTF8) :].decode("utf-8", "replace")
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16", raw.decode("utf-16", "replace")
+
+    try:
+        return "utf-8", raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # Amostra cortada no meio de um caractere multibyte ainda é UTF-8.
+        if truncated and e.start >= len(raw) - 3:
+            return "utf-8", raw[: e.start].decode("utf-8")
+
+    for encoding in FALLBACK_ENCODINGS:
+        try:
+            return encoding, raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+
+    raise CsvSniffError("Não foi possível detectar o encoding do arquivo")
+
+
+def _detect_delimiter(text: str) -> str:
+    """
+    Escolhe o delimitador que gera o mesmo número de colunas (> 1) no maior
+    número de linhas; em empate, o que gera mais colunas.
+    """
+    best, best_score = CANDIDATE_DELIMITERS[0], (0.0, 0)
+
+    for delimiter in CANDIDATE_DELIMITERS:
+        widths = [len(row) for row in _parse_rows(text, delimiter, '"') if row]
+        if not widths:
+            continue
+
+        width, count = Counter(widths).most_common(1)[0]
+        if width < 2:
+            continue
+
+        score = (count / len(widths), width)
+        if score > best_score:
+            best, best_score = delimiter, score
+
+    return best
+
+
+def _detect_quotechar(text: str, delimiter: str) -> str:
+    for quotechar in CANDIDATE_QUOTES:
+        opening = f"{delimiter}{quotechar}"
+        if text.startswith(quotechar) or opening in text:
+            return quotechar
+    return '"'
+
+
+def _detect_header(rows: list[list[str]]) -> bool:
+    """
+    Sem cabeçalho só quando a primeira linha tem valor numérico numa coluna
+    que é numérica no resto da amostra. Na dúvida, assume cabeçalho.
+    """
+    if len(rows) < 2:
+        return True
+
+    first, body = rows[0], rows[1:]
+    for index, value in enumerate(first):
+        column = [row[index] for row in body if index < len(row) and row[index]]
+        if column and all(_is_number(v) for v in column) and _is_number(value):
+            return False
+
+    return True
+
+
+def _parse_rows(text: str, delimiter: str, quotechar: str) -> list[list[str]]:
+    reader = csv.reader(io.StringIO(text), delimiter=delimiter, quotechar=quotechar)
+    rows = []
+    try:
+        for row in reader:
+            rows.append(row)
+            if len(rows) >= SAMPLE_ROWS:
+                break
+    except csv.Error:
+        pass
+    return rows
+
+
+def _is_number(value: str) -> bool:
+    try:
+        float(value.replace(",", "."))
+    except ValueError:
+        return False
+    return True
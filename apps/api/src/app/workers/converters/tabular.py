@@ -0,0 +1,248 @@
+import io
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from app.workers.converters.sniffing import CsvDialect, sniff_csv
+from app.workers.progress import report_progress
+
+
+BLOCK_SIZE = 4 * 1024 * 1024
+WHOLE_FILE_THRESHOLD_BYTES = 16 * 1024 * 1024
+TRANSCODE_CHUNK_CHARS = 1024 * 1024
+UTF8_ENCODINGS = ("utf-8", "utf-8-sig")
+
+# "In CSV column #3: Row #9: CSV conversion error to int64: invalid value 'x'"
+_CONVERSION_ERROR = re.compile(
+    r"In CSV column #(\d+):.*CSV conversion error to (\w+)"
+    r"(?:: invalid value '(.*)')?"
+)
+
+
+def read_csv_into(
+    input_path: str | Path,
+    write: Callable[[pa.RecordBatchReader], None],
+    dialect: CsvDialect | None = None,
+    as_text: bool = False,
+    max_rows: int | None = None,
+) -> None:
+    """
+    Lê o CSV em record batches do Arrow (parse multithread em C++) e entrega o
+    leitor ao `write`, que consome um batch por vez.
+
+    Arquivos pequenos são lidos de uma vez, com tipos inferidos sobre o
+    arquivo inteiro. Nos grandes a leitura é em streaming e os tipos vêm do
+    primeiro bloco; se um valor adiante não couber no tipo da coluna, a
+    leitura é refeita só com essa coluna rebaixada (inteiro para decimal ou
+    texto), mantendo os tipos das demais. Bytes inválidos no encoding fazem
+    a leitura ser refeita com substituição dos caracteres inválidos.
+    """
+    dialect = dialect or sniff_csv(input_path)
+    column_types: dict[str, pa.DataType] = {}
+    lenient = False
+
+    while True:
+        try:
+            with _open_batches(
+                input_path, dialect, as_text, lenient, max_rows, column_types
+            ) as reader:
+                write(reader)
+            return
+        except pa.ArrowInvalid as e:
+            match = _CONVERSION_ERROR.search(str(e))
+            if match is None:
+                if as_text and lenient:
+                    raise
+                print(f"[CSV] Lendo {Path(input_path).name} todo como texto: {e}")
+                as_text = lenient = True
+            elif match.group(2) in ("string", "binary"):
+                if lenient:
+                    raise
+                lenient = True
+            else:
+                name = _column_name(dialect, int(match.group(1)))
+                demoted = _demoted_type(
+                    column_types.get(name), match.group(2), match.group(3)
+                )
+                if demoted is None:
+                    raise
+                print(f"[CSV] Coluna {name!r} lida como {demoted}: {e}")
+                column_types[name] = demoted
+
+
+def write_parquet(reader: pa.RecordBatchReader, output_path: str | Path) -> None:
+    with pq.ParquetWriter(str(output_path), reader.schema, compression="zstd") as w:
+        for batch in reader:
+            w.write_batch(batch)
+
+
+def write_arrow_ipc(reader: pa.RecordBatchReader, output_path: str | Path) -> None:
+    with pa.OSFile(str(output_path), "wb") as sink:
+        with pa.ipc.new_file(sink, reader.schema) as w:
+            for batch in reader:
+                w.write_batch(batch)
+
+
+def dedup_column_names(names: list[str]) -> list[str]:
+    """Mesma regra do pandas.read_csv: repetidos viram `nome.1`, `nome.2`..."""
+    original = set(names)
+    counts: dict[str, int] = {}
+    unique = []
+    for name in names:
+        base, count = name, counts.get(name, 0)
+        while count > 0:
+            counts[base] = count + 1
+            name = f"{base}.{count}"
+            count = count + 1 if name in original else counts.get(name, 0)
+        unique.append(name)
+        counts[name] = count + 1
+    return unique
+
+
+def _column_name(dialect: CsvDialect, index: int) -> str:
+    columns = _column_names(dialect)
+    # Sem cabeçalho nem nomes, o Arrow gera f0, f1, ...
+    return columns[index] if columns else f"f{index}"
+
+
+def _column_names(dialect: CsvDialect) -> list[str]:
+    columns = list(dialect.columns)
+    if dialect.has_header and len(set(columns)) < len(columns):
+        return dedup_column_names(columns)
+    return columns
+
+
+def _demoted_type(current: pa.DataType | None, target: str, value: str | None):
+    """Inteiro que recebe um decimal vira float64; o resto vira texto"""
+    if current is None and "int" in target and value is not None:
+        try:
+            float(value)
+            return pa.float64()
+        except ValueError:
+            pass
+    if current == pa.string():
+        return None
+    return pa.string()
+
+
+def iter_rows(batch: pa.RecordBatch) -> Iterator[tuple]:
+    """Linhas do batch como tuplas, convertendo uma coluna inteira por vez"""
+    return zip(*(column.to_pylist() for column in batch.columns))
+
+
+@contextmanager
+def _open_batches(
+    input_path: str | Path,
+    dialect: CsvDialect,
+    as_text: bool,
+    lenient: bool,
+    max_rows: int | None,
+    column_types: dict[str, pa.DataType] | None = None,
+) -> Iterator[pa.RecordBatchReader]:
+    input_path = Path(input_path)
+    columns = _column_names(dialect)
+    column_names = None if dialect.has_header else columns
+    if dialect.has_header and columns != list(dialect.columns):
+        # O Arrow aceita nomes repetidos, mas JSON e planilhas não: renomeia
+        # como o pandas fazia (a, a.1, ...) e pula a linha do cabeçalho.
+        column_names = columns
+
+    read_options = pa_csv.ReadOptions(
+        use_threads=True,
+        block_size=BLOCK_SIZE,
+        column_names=column_names,
+        skip_rows=1 if dialect.has_header and column_names else 0,
+        autogenerate_column_names=not dialect.has_header and not dialect.columns,
+    )
+    parse_options = pa_csv.ParseOptions(
+        delimiter=dialect.delimiter, quote_char=dialect.quotechar
+    )
+    if as_text:
+        convert_options = pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in columns},
+            strings_can_be_null=False,
+            null_values=[""],
+        )
+    else:
+        convert_options = pa_csv.ConvertOptions(
+            column_types=column_types or {}, strings_can_be_null=True
+        )
+
+    if dialect.encoding in UTF8_ENCODINGS and not lenient:
+        source = pa.OSFile(str(input_path), "rb")
+    else:
+        source = _Utf8Stream(input_path, dialect.encoding)
+
+    size = input_path.stat().st_size
+
+    with source:
+        if size <= WHOLE_FILE_THRESHOLD_BYTES:
+            table = pa_csv.read_csv(
+                source, read_options, parse_options, convert_options
+            )
+            batches = _report_rows(table.to_batches(max_rows), table.num_rows)
+            yield pa.RecordBatchReader.from_batches(table.schema, batches)
+            return
+
+        reader = pa_csv.open_csv(source, read_options, parse_options, convert_options)
+        batches = _split(reader, max_rows) if max_rows else reader
+        yield pa.RecordBatchReader.from_batches(
+            reader.schema, _report_bytes(batches, source, size)
+        )
+
+
+def _report_rows(batches, total_rows: int) -> Iterator[pa.RecordBatch]:
+    done = 0
+    for batch in batches:
+        yield batch
+        done += batch.num_rows
+        report_progress(done, total_rows)
+
+
+def _report_bytes(batches, source, size: int) -> Iterator[pa.RecordBatch]:
+    """No streaming, o progresso é a posição de leitura no arquivo"""
+    for batch in batches:
+        yield batch
+        report_progress(source.tell(), size)
+
+
+def _split(reader: pa.RecordBatchReader, max_rows: int) -> Iterator[pa.RecordBatch]:
+    for batch in reader:
+        for offset in range(0, batch.num_rows, max_rows):
+            yield batch.slice(offset, max_rows)
+
+
+class _Utf8Stream(io.RawIOBase):
+    """
+    Recodifica o arquivo para UTF-8 em streaming, substituindo bytes
+    inválidos, para entregar ao leitor de CSV do Arrow.
+    """
+
+    def __init__(self, path: Path, encoding: str):
+        self._text = open(path, encoding=encoding, errors="replace", newline="")
+        self._pending = bytearray()
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._text.buffer.tell()
+
+    def readinto(self, buffer) -> int:
+        while len(self._pending) < len(buffer):
+            chunk = self._text.read(TRANSCODE_CHUNK_CHARS)
+            if not chunk:
+                break
+            self._pending += chunk.encode("utf-8")
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        del self._pending[:size]
+        return size
+
+    def close(self) -> None:
+        self._text.close()
+        super().close()
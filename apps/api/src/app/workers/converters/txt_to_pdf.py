@@ -1,30 +1,121 @@
-from fpdf import FPDF
+import io
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
+from fontTools import ttLib
+from fpdf import FPDF, XPos, YPos
+from app.workers.progress import report_progress
+
+
+FONT_PATH = Path(__file__).resolve().parents[1] / "fonts" / "Roboto-Regular.ttf"
+FONT_FAMILY = "Roboto-Regular"
+FONT_SIZE = 12
+LINE_HEIGHT = 6
+MAX_LINE_CHARS = 64 * 1024
+ENCODING_SAMPLE_BYTES = 1024 * 1024
+PROGRESS_EVERY_LINES = 5_000
+FALLBACK_ENCODING = "cp1252"
 
 
 def convert(input_path: str | Path, output_path: str | Path) -> None:
+    """
+    Lê o texto em streaming, linha a linha, e já o distribui nas páginas.
+
+    A quebra de linha é feita aqui, numa única passada por linha usando as
+    larguras da fonte: o multi_cell do fpdf recalcula a largura do trecho a
+    cada caractere, o que fica quadrático em arquivos grandes.
+    """
     pdf = FPDF()
+    font = _add_cached_font(pdf)
+    pdf.set_font(FONT_FAMILY, size=FONT_SIZE)
     pdf.add_page()
-    font_path = Path(__file__).resolve().parents[1] / "fonts" / "Roboto-Regular.ttf"
 
-    pdf.add_font(
-        family="Roboto-Regular",
-        style="",
-        fname=str(font_path),
-        uni=True,
-    )
-    pdf.set_font("Roboto-Regular", size=12)
+    max_width = (pdf.epw - 2 * pdf.c_margin) * pdf.k * 1000 / FONT_SIZE
 
     input_path = Path(input_path)
-    with input_path.open(encoding="utf-8") as f:
-        text = f.read()
-
-    pdf.multi_cell(
-        w=0,
-        h=6,
-        txt=text,
-        align="L",
-        markdown=False,
+    encoding = _detect_encoding(input_path)
+    size = input_path.stat().st_size
+
+    with input_path.open(encoding=encoding, errors="replace") as f:
+        lines = iter(lambda: f.readline(MAX_LINE_CHARS), "")
+        for number, line in enumerate(lines, 1):
+            if number % PROGRESS_EVERY_LINES == 0:
+                report_progress(f.buffer.tell(), size)
+            for segment in _wrap(line.rstrip("\r\n"), font.cw, max_width):
+                pdf.cell(
+                    w=0,
+                    h=LINE_HEIGHT,
+                    text=segment,
+                    new_x=XPos.LMARGIN,
+                    new_y=YPos.NEXT,
+                )
+
+    pdf.output(str(output_path))
+
+
+def _wrap(line: str, widths, max_width: float):
+    start = 0
+    width = 0.0
+    last_space = -1
+
+    for i, char in enumerate(line):
+        char_width = widths[ord(char)]
+        if width + char_width > max_width and i > start:
+            if char == " ":
+                yield line[start:i]
+                start = i + 1
+                width = 0.0
+                last_space = -1
+                continue
+            if last_space > start:
+                yield line[start:last_space]
+                start = last_space + 1
+                width = sum(widths[ord(c)] for c in line[start:i])
+            else:
+                yield line[start:i]
+                start = i
+                width = 0.0
+            last_space = -1
+
+        if char == " ":
+            last_space = i
+        width += char_width
+
+    yield line[start:]
+
+
+@lru_cache(maxsize=1)
+def _font_template():
+    pdf = FPDF()
+    pdf.add_font(family=FONT_FAMILY, style="", fname=str(FONT_PATH))
+    return pdf.fonts[FONT_FAMILY.lower()], FONT_PATH.read_bytes()
+
+
+def _add_cached_font(pdf: FPDF):
+    """
+    Reaproveita a fonte já processada neste processo (cmap, larguras,
+    descritor). O deepcopy do TTFFont compartilha essas estruturas e copia só
+    o estado do subset; o TTFont é reaberto a partir dos bytes em cache porque
+    o fpdf o modifica ao gerar o subset na saída.
+    """
+    template, font_bytes = _font_template()
+    font = deepcopy(template)
+    font.ttfont = ttLib.TTFont(
+        io.BytesIO(font_bytes), recalcTimestamp=False, lazy=True
     )
+    pdf.fonts[template.fontkey] = font
+    return font
+
+
+def _detect_encoding(path: Path) -> str:
+    with path.open("rb") as f:
+        sample = f.read(ENCODING_SAMPLE_BYTES)
+
+    try:
+        sample.decode("utf-8")
+    except UnicodeDecodeError as e:
+        # Amostra cortada no meio de um caractere multibyte ainda é UTF-8.
+        if e.start < len(sample) - 3:
+            return FALLBACK_ENCODING
 
-    pdf.output(output_path)
+    return "utf-8-sig"
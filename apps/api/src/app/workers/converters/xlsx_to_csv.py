@@ -1,6 +1,128 @@
-import pandas as pd
+import csv
+import tempfile
+import zipfile
+from pathlib import Path
+from openpyxl import load_workbook
+from python_calamine import CalamineWorkbook
+from werkzeug.utils import secure_filename
+from app.config import config
+from app.workers.parallel import imap_ordered
+from app.workers.progress import report_progress
 
 
-def convert(input_path: str, output_path: str) -> None:
-    df = pd.read_excel(input_path, engine="openpyxl")
-    df.to_csv(output_path, index=False, encoding="utf-8")
+PROGRESS_EVERY_ROWS = 10_000
+
+
+def convert(input_path: str, output_path: str) -> str:
+    """
+    Exporta cada aba da planilha para CSV lendo as linhas em streaming.
+
+    Com uma única aba o CSV é gravado em `output_path`. Com várias, cada aba
+    é exportada em paralelo e os CSVs são agrupados em um .zip ao lado de
+    `output_path`; o caminho final gerado é retornado.
+    """
+    engine = _engine_for(input_path)
+    sheet_names = _sheet_names(input_path, engine)
+
+    if len(sheet_names) <= 1:
+        sheet_name = sheet_names[0] if sheet_names else None
+        _export_sheet((input_path, sheet_name, output_path, engine))
+        return output_path
+
+    bundle_path = Path(output_path).with_suffix(".zip")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tasks = [
+            (
+                input_path,
+                name,
+                str(Path(tmp_dir) / _sheet_filename(index, name)),
+                engine,
+            )
+            for index, name in enumerate(sheet_names, start=1)
+        ]
+
+        with zipfile.ZipFile(bundle_path, "w", zipfile.ZIP_DEFLATED) as bundle:
+            for done, csv_path in enumerate(imap_ordered(_export_sheet, tasks), 1):
+                bundle.write(csv_path, arcname=Path(csv_path).name)
+                Path(csv_path).unlink()
+                report_progress(done, len(tasks))
+
+    return str(bundle_path)
+
+
+def _engine_for(input_path: str) -> str:
+    # O openpyxl não lê .xls; nos demais o calamine é opcional, pois carrega
+    # a aba inteira na memória.
+    if Path(input_path).suffix.lower() == ".xls":
+        return "calamine"
+    return config.XLSX_READER_ENGINE
+
+
+def _sheet_names(input_path: str, engine: str) -> list[str]:
+    if engine == "calamine":
+        workbook = CalamineWorkbook.from_path(input_path)
+        try:
+            return list(workbook.sheet_names)
+        finally:
+            workbook.close()
+
+    workbook = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def _sheet_filename(index: int, name: str) -> str:
+    return f"{index:02d}_{secure_filename(name) or 'sheet'}.csv"
+
+
+def _export_sheet(task: tuple[str, str | None, str, str]) -> str:
+    input_path, sheet_name, csv_path, engine = task
+
+    with open(csv_path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        for row in _iter_rows(input_path, sheet_name, engine):
+            writer.writerow([_normalize(value) for value in row])
+
+    return csv_path
+
+
+def _iter_rows(input_path: str, sheet_name: str | None, engine: str):
+    if engine == "calamine":
+        workbook = CalamineWorkbook.from_path(input_path)
+        try:
+            sheet = (
+                workbook.get_sheet_by_name(sheet_name)
+                if sheet_name is not None
+                else workbook.get_sheet_by_index(0)
+            )
+            yield from _with_progress(sheet.iter_rows(), sheet.height)
+        finally:
+            workbook.close()
+        return
+
+    workbook = load_workbook(input_path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name is not None else workbook.active
+        rows = sheet.iter_rows(values_only=True)
+        yield from _with_progress(rows, sheet.max_row or 0)
+    finally:
+        workbook.close()
+
+
+def _with_progress(rows, total: int):
+    """Reporta a cada bloco de linhas (só tem efeito fora dos processos filhos)"""
+    for index, row in enumerate(rows, 1):
+        yield row
+        if index % PROGRESS_EVERY_ROWS == 0:
+            report_progress(index, total)
+
+
+def _normalize(value):
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
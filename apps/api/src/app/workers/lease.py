@@ -0,0 +1,58 @@
+import threading
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+
+class JobLease:
+    """
+    Mantém o lease de um job renovando-o em segundo plano enquanto a
+    conversão roda. Se a renovação indicar que outro worker assumiu o job,
+    `lost` passa a True e quem converte não deve mais gravar o resultado.
+    """
+
+    def __init__(
+        self,
+        job_id: UUID,
+        claimed_at: datetime,
+        renew: Callable[[UUID, datetime], datetime | None],
+        interval: float,
+    ):
+        self.job_id = job_id
+        self.claimed_at = claimed_at
+        self.interval = interval
+        self._renew = renew
+        self._stop = threading.Event()
+        self._lost = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def lost(self) -> bool:
+        return self._lost
+
+    def start(self) -> "JobLease":
+        self._thread = threading.Thread(
+            target=self._run, name=f"lease-{self.job_id}", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                renewed = self._renew(self.job_id, self.claimed_at)
+            except Exception as e:
+                # Falha transitória do banco: tenta de novo no próximo ciclo.
+                print(f"[Lease] Falha ao renovar job {self.job_id}: {e}")
+                continue
+
+            if renewed is None:
+                print(f"[Lease] Job {self.job_id} assumido por outro worker")
+                self._lost = True
+                return
+            self.claimed_at = renewed
@@ -0,0 +1,76 @@
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+from app.config import config
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Teto de memória (MB) da conversão isolada em andamento; None fora dela.
+_memory_budget_mb: int | None = None
+
+
+def imap_ordered(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int | None = None,
+) -> Iterator[R]:
+    """
+    Executa `func` para cada item em um pool de processos e devolve os
+    resultados na ordem de entrada, à medida que ficam prontos.
+
+    No máximo `2 * workers` tarefas ficam em voo, então resultados prontos
+    fora de ordem não se acumulam sem limite em memória.
+
+    Cai para execução sequencial quando há um único item/worker ou quando o
+    processo atual é daemon (ex.: filho de um pool prefork fora do
+    `run_isolated`), que não pode criar processos filhos.
+    """
+    items = list(items)
+    workers = min(len(items), max_workers or pool_size())
+
+    if workers <= 1 or multiprocessing.current_process().daemon:
+        for item in items:
+            yield func(item)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+
+
+def limit_memory(memory_mb: int | None) -> None:
+    """Chamado pelo supervisor no processo isolado, antes da conversão"""
+    global _memory_budget_mb
+    _memory_budget_mb = memory_mb
+
+
+def pool_size() -> int:
+    """
+    Processos por conversão: CONVERTER_MAX_WORKERS repartido entre as
+    conversões simultâneas do worker, para o total não passar do teto. Numa
+    conversão isolada, também não mais do que cabe no seu teto de memória a
+    CONVERTER_POOL_WORKER_MEMORY_MB por processo.
+    """
+    workers = config.CONVERTER_MAX_WORKERS // worker_concurrency()
+    per_worker = config.CONVERTER_POOL_WORKER_MEMORY_MB
+    if _memory_budget_mb is not None and per_worker > 0:
+        workers = min(workers, _memory_budget_mb // per_worker)
+    return max(workers, 1)
+
+
+def worker_concurrency() -> int:
+    """Conversões simultâneas do worker Celery, como o entrypoint o sobe"""
+    if config.WORKER_POOL == "solo":
+        return 1
+    if config.WORKER_AUTOSCALE:
+        return max(int(config.WORKER_AUTOSCALE.split(",")[0]), 1)
+    return config.WORKER_CONCURRENCY or os.cpu_count() or 1
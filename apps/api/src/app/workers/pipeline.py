@@ -0,0 +1,110 @@
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Callable
+from app.domain.entities.converter_spec import get_converter_spec
+from app.domain.enums.conversion_type import ConversionType
+from app.workers.progress import progress_span
+
+
+Resolver = Callable[[ConversionType], Callable[[str, str], str | None]]
+
+
+def run_pipeline(
+    stages: tuple[ConversionType, ...],
+    resolve: Resolver,
+    input_path: str | Path,
+    output_path: str | Path,
+    **options,
+) -> str:
+    """
+    Executa os conversores em sequência, cada um lendo a saída do anterior.
+    Os intermediários ficam num diretório temporário local do worker; só o
+    artefato final é gravado em `output_path` (e conta para a cota). Cada
+    opção vai só para as etapas que a aceitam.
+    """
+    with tempfile.TemporaryDirectory(prefix="pipeline_") as scratch:
+        result = _run_stages(
+            stages,
+            resolve,
+            Path(input_path),
+            Path(output_path),
+            Path(scratch),
+            options,
+        )
+        return str(result)
+
+
+def _run_stages(
+    stages: tuple[ConversionType, ...],
+    resolve: Resolver,
+    input_path: Path,
+    output_path: Path,
+    scratch: Path,
+    options: dict,
+) -> Path:
+    current = input_path
+
+    for index, stage in enumerate(stages):
+        spec = get_converter_spec(stage)
+        remaining = stages[index + 1 :]
+        if remaining:
+            target = scratch / f"{index}_{stage.value}.{spec.output_extension}"
+        else:
+            target = output_path
+
+        stage_options = {k: v for k, v in options.items() if k in spec.options}
+        with progress_span(index / len(stages), (index + 1) / len(stages)):
+            result = resolve(stage)(str(current), str(target), **stage_options)
+        current = Path(result) if result else target
+
+        # Etapa que gerou vários arquivos (ex.: uma planilha com várias abas):
+        # o restante do pipeline roda em cada um e o resultado volta num .zip.
+        if remaining and current.suffix == ".zip":
+            with progress_span((index + 1) / len(stages), 1.0):
+                return _run_per_member(
+                    remaining,
+                    resolve,
+                    current,
+                    output_path,
+                    scratch / f"{index}_parts",
+                    options,
+                )
+
+    return current
+
+
+def _run_per_member(
+    stages: tuple[ConversionType, ...],
+    resolve: Resolver,
+    archive_path: Path,
+    output_path: Path,
+    scratch: Path,
+    options: dict,
+) -> Path:
+    extracted = scratch / "in"
+    converted = scratch / "out"
+    converted.mkdir(parents=True)
+
+    with zipfile.ZipFile(archive_path) as archive:
+        archive.extractall(extracted)
+
+    ext = get_converter_spec(stages[-1]).output_extension
+    zip_path = output_path.with_suffix(".zip")
+
+    members = sorted(p for p in extracted.rglob("*") if p.is_file())
+
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index, member in enumerate(members):
+            with progress_span(index / len(members), (index + 1) / len(members)):
+                result = _run_stages(
+                    stages,
+                    resolve,
+                    member,
+                    converted / f"{member.stem}.{ext}",
+                    scratch / f"part_{index}",
+                    options,
+                )
+            archive.write(result, result.name)
+
+    return zip_path
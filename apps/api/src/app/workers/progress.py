@@ -0,0 +1,109 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+from app.config import config
+from app.infra.redis.redis_pub import publish_job_event
+
+
+class ProgressReporter:
+    """
+    Publica o progresso de um job com limite de taxa: no máximo
+    `max_per_second` eventos por segundo, e entre um envio e outro só o
+    último valor é guardado (os intermediários são descartados).
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        client_id: str,
+        max_per_second: float = config.PROGRESS_MAX_EVENTS_PER_SECOND,
+        publish: Callable[[str, dict], None] = publish_job_event,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.job_id = job_id
+        self.client_id = client_id
+        self.interval = 1 / max_per_second if max_per_second > 0 else float("inf")
+        self._publish = publish
+        self._clock = clock
+        self._last_sent_at: float | None = None
+        self._last_sent: float | None = None
+        self._pending: float | None = None
+        self._span = (0.0, 1.0)
+
+    def report(self, done: float, total: float) -> None:
+        if total <= 0:
+            return
+
+        start, end = self._span
+        fraction = start + (end - start) * min(max(done / total, 0.0), 1.0)
+        self._pending = round(fraction * 100, 1)
+
+        now = self._clock()
+        if self._last_sent_at is None or now - self._last_sent_at >= self.interval:
+            self.flush(now)
+
+    def flush(self, now: float | None = None) -> None:
+        if self._pending is None or self._pending == self._last_sent:
+            self._pending = None
+            return
+
+        self._publish(
+            "job_progress",
+            {
+                "job_id": self.job_id,
+                "client_id": self.client_id,
+                "progress": self._pending,
+            },
+        )
+        self._last_sent = self._pending
+        self._last_sent_at = self._clock() if now is None else now
+        self._pending = None
+
+    @contextmanager
+    def span(self, start: float, end: float) -> Iterator[None]:
+        """Mapeia o progresso reportado dentro do bloco para [start, end]"""
+        outer = self._span
+        outer_start, outer_end = outer
+        width = outer_end - outer_start
+        self._span = (outer_start + width * start, outer_start + width * end)
+        try:
+            yield
+        finally:
+            self._span = outer
+
+
+_current: ContextVar[ProgressReporter | None] = ContextVar(
+    "progress_reporter", default=None
+)
+
+
+@contextmanager
+def reporting(job_id: str, client_id: str) -> Iterator[ProgressReporter]:
+    """Ativa o reporte de progresso para os conversores chamados no bloco"""
+    reporter = ProgressReporter(job_id, client_id)
+    token = _current.set(reporter)
+    try:
+        yield reporter
+    finally:
+        _current.reset(token)
+
+
+def report_progress(done: float, total: float) -> None:
+    """
+    Chamado pelos conversores por página, bloco ou aba. Sem job ativo (ex.:
+    testes ou processos filhos de um pool) não faz nada.
+    """
+    reporter = _current.get()
+    if reporter is not None:
+        reporter.report(done, total)
+
+
+@contextmanager
+def progress_span(start: float, end: float) -> Iterator[None]:
+    reporter = _current.get()
+    if reporter is None:
+        yield
+        return
+    with reporter.span(start, end):
+        yield
@@ -0,0 +1,62 @@
+import importlib
+import threading
+import time
+from functools import partial
+from typing import Callable
+from app.domain.entities.converter_spec import CONVERTER_SPECS
+from app.domain.enums.conversion_type import ConversionType
+from app.workers.pipeline import run_pipeline
+
+
+ConvertFunc = Callable[[str, str], str | None]
+
+
+class ConverterRegistry:
+    """
+    Resolve e inicializa cada conversor uma única vez por processo. Módulos
+    que expõem `warm_up()` são aquecidos no carregamento. Pipelines viram uma
+    função que encadeia os conversores das suas etapas.
+    """
+
+    def __init__(self):
+        self._converters: dict[ConversionType, ConvertFunc] = {}
+        self._lock = threading.Lock()
+        # Tempo de import + warm_up de cada módulo, medido no carregamento.
+        self.load_seconds: dict[str, float] = {}
+
+    def load(self) -> None:
+        with self._lock:
+            if self._converters:
+                return
+
+            warmed = set()
+            converters = {}
+            for conversion_type, spec in CONVERTER_SPECS.items():
+                if spec.is_pipeline:
+                    converters[conversion_type] = partial(
+                        run_pipeline, spec.stages, self.get
+                    )
+                    continue
+
+                started = time.perf_counter()
+                module = importlib.import_module(
+                    f"app.workers.converters.{spec.module_name}"
+                )
+                if spec.module_name not in warmed and hasattr(module, "warm_up"):
+                    module.warm_up()
+                    warmed.add(spec.module_name)
+                self.load_seconds.setdefault(
+                    spec.module_name, time.perf_counter() - started
+                )
+                converters[conversion_type] = getattr(module, spec.func_name)
+
+            self._converters = converters
+            print(f"[Registry] {len(converters)} conversores carregados")
+
+    def get(self, conversion_type: ConversionType) -> ConvertFunc:
+        if not self._converters:
+            self.load()
+        return self._converters[ConversionType(conversion_type)]
+
+
+registry = ConverterRegistry()
@@ -0,0 +1,25 @@
+from app.domain.entities.converter_spec import get_converter_spec
+from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.converter_resource import ConverterResource
+
+
+DEFAULT_QUEUE = "celery"
+
+CONVERSION_QUEUES: dict[ConverterResource, str] = {
+    ConverterResource.LIGHT: "conversions.light",
+    ConverterResource.CPU_BOUND: "conversions.cpu",
+    ConverterResource.SUBPROCESS_BOUND: "conversions.subprocess",
+}
+
+ALL_QUEUES = (DEFAULT_QUEUE, *CONVERSION_QUEUES.values())
+
+
+def queue_for(conversion_type: ConversionType | str) -> str:
+    """
+    Fila de um tipo de conversão, pela classe do conversor. Assim um job
+    rápido de CSV não espera atrás de conversões pesadas do LibreOffice, e
+    cada grupo de workers é dimensionado à parte.
+    """
+    spec = get_converter_spec(ConversionType(conversion_type))
+    resource = spec.resource if spec else ConverterResource.CPU_BOUND
+    return CONVERSION_QUEUES[resource]
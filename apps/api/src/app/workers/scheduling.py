@@ -0,0 +1,165 @@
+import time
+import redis
+from app.config import config
+from app.domain.entities.converter_spec import get_converter_spec
+from app.domain.enums.conversion_type import ConversionType
+from app.infra.redis.client import get_redis_client
+
+
+FAIR_SHARE_PREFIX = "fair_share"
+
+# Prioridades do RabbitMQ (0-9, maior sai antes). Mensagens sem prioridade,
+# como jobs adiados pelo limite de execuções do cliente, ficam com 0.
+MAX_PRIORITY = 9
+FAST_LANE_PRIORITY = 9
+NORMAL_PRIORITY = 6
+MIN_PRIORITY = 1
+
+# Resultado de `acquire`: vaga nova desta entrega ou já reservada para o job
+# (reentrega de uma mensagem cujo worker morreu, ou entrega duplicada).
+SLOT_DENIED = 0
+SLOT_TAKEN = 1
+SLOT_HELD = 2
+
+# Os jobs de cada cliente ficam num ZSET com o momento da entrada. Entradas
+# mais velhas que o TTL (worker morto, mensagem perdida) caem uma a uma; o
+# TTL da chave só recolhe clientes parados.
+_PURGE = """
+local stale = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1] - ARGV[2])
+if #stale > 0 then
+    redis.call('ZREM', KEYS[1], unpack(stale))
+    if KEYS[2] then
+        redis.call('HDEL', KEYS[2], unpack(stale))
+    end
+end
+"""
+
+# Registra o custo do job e devolve o backlog do cliente antes dele.
+_ADMIT_SCRIPT = (
+    _PURGE
+    + """
+local backlog = 0
+for _, cost in ipairs(redis.call('HVALS', KEYS[2])) do
+    backlog = backlog + tonumber(cost)
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+redis.call('HSET', KEYS[2], ARGV[3], ARGV[4])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+return tostring(backlog)
+"""
+)
+
+# Reserva uma execução para o job se o cliente ainda estiver abaixo do
+# limite. Um job que já tem a vaga a mantém, sem ocupar outra.
+_ACQUIRE_SCRIPT = (
+    _PURGE
+    + """
+if redis.call('ZSCORE', KEYS[1], ARGV[3]) then
+    return 2
+end
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[4]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], ARGV[1], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+)
+
+
+def estimate_cost(
+    conversion_type: ConversionType | str, input_size_bytes: int
+) -> float:
+    """Custo estimado do job, em segundos de conversão"""
+    spec = get_converter_spec(ConversionType(conversion_type))
+    if spec is None:
+        return 0.0
+    return spec.estimate_seconds(input_size_bytes)
+
+
+def priority_for(cost: float, backlog_seconds: float) -> int:
+    """
+    Jobs pequenos entram na faixa rápida; cada BACKLOG_STEP segundos de
+    trabalho que o cliente já tem na fila baixam um nível. Assim quem envia
+    centenas de arquivos grandes não passa na frente dos demais.
+    """
+    fast = cost <= config.FAST_LANE_MAX_SECONDS
+    base = FAST_LANE_PRIORITY if fast else NORMAL_PRIORITY
+    step = config.FAIR_SHARE_BACKLOG_STEP_SECONDS
+    penalty = int(backlog_seconds // step) if step > 0 else 0
+    return max(base - penalty, MIN_PRIORITY)
+
+
+class FairScheduler:
+    """
+    Contabiliza por cliente, no Redis, o trabalho enfileirado (custo
+    estimado em segundos) e as conversões em execução, ambos por job.
+
+    Na publicação, o backlog do cliente define a prioridade do job. No worker,
+    `acquire` aplica o limite de execuções simultâneas por cliente. `finish`
+    e `release` removem o job e podem ser repetidos sem efeito.
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis,
+        max_inflight: int = config.FAIR_SHARE_MAX_INFLIGHT_PER_CLIENT,
+        ttl: int = config.RESULT_CACHE_INFLIGHT_TTL,
+    ):
+        self.client = client
+        self.max_inflight = max_inflight
+        self.ttl = ttl
+        self._admit = client.register_script(_ADMIT_SCRIPT)
+        self._acquire = client.register_script(_ACQUIRE_SCRIPT)
+
+    def admit(self, client_id: str, job_id: str, cost: float) -> int:
+        """Soma o custo ao backlog do cliente e devolve a prioridade do job"""
+        backlog = self._admit(
+            keys=[self._backlog_key(client_id), self._cost_key(client_id)],
+            args=[time.time(), self.ttl, job_id, cost],
+        )
+        return priority_for(cost, float(backlog))
+
+    def finish(self, client_id: str, job_id: str) -> None:
+        pipe = self.client.pipeline()
+        pipe.zrem(self._backlog_key(client_id), job_id)
+        pipe.hdel(self._cost_key(client_id), job_id)
+        pipe.execute()
+
+    def acquire(self, client_id: str, job_id: str) -> int:
+        """SLOT_DENIED se o cliente está no limite; senão SLOT_TAKEN/SLOT_HELD"""
+        if self.max_inflight <= 0:
+            return SLOT_TAKEN
+        return int(
+            self._acquire(
+                keys=[self._running_key(client_id)],
+                args=[time.time(), self.ttl, job_id, self.max_inflight],
+            )
+        )
+
+    def release(self, client_id: str, job_id: str) -> None:
+        if self.max_inflight > 0:
+            self.client.zrem(self._running_key(client_id), job_id)
+
+    @staticmethod
+    def _backlog_key(client_id: str) -> str:
+        return f"{FAIR_SHARE_PREFIX}:backlog:{client_id}"
+
+    @staticmethod
+    def _cost_key(client_id: str) -> str:
+        return f"{FAIR_SHARE_PREFIX}:cost:{client_id}"
+
+    @staticmethod
+    def _running_key(client_id: str) -> str:
+        return f"{FAIR_SHARE_PREFIX}:running:{client_id}"
+
+
+_scheduler: FairScheduler | None = None
+
+
+def get_fair_scheduler() -> FairScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = FairScheduler(get_redis_client())
+    return _scheduler
@@ -0,0 +1,238 @@
+import json
+import multiprocessing
+import os
+import resource
+import select
+import shutil
+import signal
+import sys
+import tempfile
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+from app.config import config
+from app.domain.entities.converter_spec import ConverterSpec
+from app.workers.parallel import limit_memory
+
+
+POLL_INTERVAL = 0.2
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+
+class ConversionLimitExceeded(RuntimeError):
+    pass
+
+
+class ConverterProcessError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class ConversionLimits:
+    memory_mb: int
+    timeout_seconds: int
+    cpu_seconds: int
+
+    @classmethod
+    def for_spec(
+        cls, spec: ConverterSpec | None, input_size_bytes: int
+    ) -> "ConversionLimits":
+        """
+        O teto de memória parte da estimativa do conversor para o tamanho do
+        arquivo, com folga, entre o mínimo e o máximo configurados.
+        """
+        estimate = spec.estimate_memory_mb(input_size_bytes) if spec else 0
+        memory_mb = max(
+            config.CONVERTER_MIN_MEMORY_MB,
+            int(estimate * config.CONVERTER_MEMORY_HEADROOM),
+        )
+        return cls(
+            memory_mb=min(memory_mb, config.CONVERTER_MAX_MEMORY_MB),
+            timeout_seconds=config.CONVERTER_TIMEOUT,
+            cpu_seconds=config.CONVERTER_CPU_LIMIT,
+        )
+
+
+def run_isolated(func: Callable, args: tuple, limits: ConversionLimits):
+    """
+    Executa `func(*args)` num processo filho (fork, herdando os conversores já
+    carregados) e devolve o resultado.
+
+    O filho roda no próprio grupo de processos, com limite de CPU via rlimit.
+    O pai acompanha o tempo total e a memória somada do grupo (o filho e os
+    processos que ele criar) e mata o grupo inteiro ao passar de um dos
+    limites. Arquivos temporários do filho ficam num diretório que o
+    pai remove ao final, mesmo quando o filho é morto.
+    """
+    scratch = tempfile.mkdtemp(prefix="conversion_")
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+
+    if pid == 0:
+        os.close(read_fd)
+        _run_child(func, args, limits, scratch, write_fd)
+
+    os.close(write_fd)
+    try:
+        # Repetido no pai para não depender de o filho já ter se isolado.
+        os.setpgid(pid, pid)
+    except OSError:
+        pass
+
+    try:
+        payload, status = _supervise(pid, read_fd, limits)
+    finally:
+        os.close(read_fd)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    if payload is None:
+        raise ConverterProcessError(_describe_exit(status, limits))
+    if "error" in payload:
+        raise ConverterProcessError(payload["error"])
+    return payload["result"]
+
+
+def _run_child(func, args, limits: ConversionLimits, scratch: str, write_fd: int):
+    code = 0
+    try:
+        os.setpgid(0, 0)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        _allow_child_processes()
+        limit_memory(limits.memory_mb)
+        if limits.cpu_seconds > 0:
+            resource.setrlimit(
+                resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 5)
+            )
+        tempfile.tempdir = scratch
+
+        payload = {"result": func(*args)}
+    except BaseException as e:
+        traceback.print_exc()
+        payload = {"error": str(e) or type(e).__name__}
+        code = 1
+
+    try:
+        with os.fdopen(write_fd, "w") as f:
+            json.dump(payload, f, default=str)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _allow_child_processes() -> None:
+    """
+    O fork herda do processo do prefork (billiard) a marca de daemon, que
+    proíbe criar processos e faria o imap_ordered rodar em sequência. Aqui
+    ela não protege nada: o pai mata o grupo inteiro ao terminar ou estourar
+    um limite, então não sobram órfãos.
+    """
+    multiprocessing.current_process()._config["daemon"] = False
+
+
+def _supervise(pid: int, read_fd: int, limits: ConversionLimits):
+    deadline = time.monotonic() + limits.timeout_seconds
+    chunks = []
+
+    while True:
+        ready, _, _ = select.select([read_fd], [], [], POLL_INTERVAL)
+        if ready:
+            data = os.read(read_fd, 65536)
+            if data:
+                chunks.append(data)
+                continue
+            _, status = os.waitpid(pid, 0)
+        else:
+            # Netos (ex.: pool de processos) podem manter o pipe aberto depois
+            # que o filho termina, então o fim do filho é checado à parte.
+            done, status = os.waitpid(pid, os.WNOHANG)
+            if done:
+                chunks.extend(_drain(read_fd))
+
+        if ready or done:
+            _kill_group(pid)
+            raw = b"".join(chunks)
+            return (json.loads(raw) if raw else None), status
+
+        if time.monotonic() > deadline:
+            _kill_group(pid)
+            os.waitpid(pid, 0)
+            raise ConversionLimitExceeded(
+                f"Tempo limite de {limits.timeout_seconds}s excedido na conversão"
+            )
+
+        used_mb = _group_memory_bytes(pid) / (1024 * 1024)
+        if used_mb > limits.memory_mb:
+            _kill_group(pid)
+            os.waitpid(pid, 0)
+            raise ConversionLimitExceeded(
+                f"Limite de memória de {limits.memory_mb} MB excedido na conversão "
+                f"({used_mb:.0f} MB em uso)"
+            )
+
+
+def _drain(read_fd: int) -> list[bytes]:
+    os.set_blocking(read_fd, False)
+    chunks = []
+    try:
+        while data := os.read(read_fd, 65536):
+            chunks.append(data)
+    except BlockingIOError:
+        pass
+    return chunks
+
+
+def _kill_group(pgid: int) -> None:
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _group_memory_bytes(pgid: int) -> int:
+    """
+    Soma o PSS dos processos do grupo. O RSS contaria em cada processo as
+    páginas herdadas do worker pelo fork (copy-on-write), e um pool de N
+    processos pagaria N vezes a imagem do pai; no PSS a página compartilhada
+    é dividida entre quem a usa.
+    """
+    total = 0
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = Path(entry.path, "stat").read_text()
+        except OSError:
+            continue
+
+        # Campos após o nome do processo: state(0) ppid(1) pgrp(2) ... rss(21)
+        fields = stat.rsplit(")", 1)[1].split()
+        if int(fields[2]) == pgid:
+            pss = _pss_bytes(entry.path)
+            total += int(fields[21]) * PAGE_SIZE if pss is None else pss
+    return total
+
+
+def _pss_bytes(proc_path: str) -> int | None:
+    """PSS de /proc/<pid>/smaps_rollup; None se indisponível (kernel < 4.14)"""
+    try:
+        with open(Path(proc_path, "smaps_rollup")) as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def _describe_exit(status: int, limits: ConversionLimits) -> str:
+    if os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        if sig == signal.SIGXCPU:
+            return f"Limite de CPU de {limits.cpu_seconds}s excedido na conversão"
+        if sig == signal.SIGKILL:
+            return "Processo de conversão encerrado pelo sistema (falta de memória)"
+        return f"Processo de conversão encerrado pelo sinal {signal.Signals(sig).name}"
+    return f"Processo de conversão terminou sem resultado (código {status})"
@@ -1,45 +1,99 @@
+from celery import chord
 from app.workers.celery_app import celery
+from functools import partial
+from datetime import datetime
 from pathlib import Path
-import importlib
 from uuid import UUID
 from app.infra.db.db import SessionLocal
 from app.repositories.document_repository import DocumentRepository
 from app.repositories.client_storage_repository import ClientStorageRepository
 from app.domain.enums.conversion_type import ConversionType
 from app.domain.entities.document_job import DocumentJob
-from app.infra.utils import (
-    get_client_input_dir,
-    get_client_output_dir,
-    get_directory_size,
-)
+from app.domain.enums.job_status import JobStatus
 from app.infra.redis.redis_pub import publish_job_event
-
-
-CONVERTERS = {
-    ConversionType.CSV_TO_JSON: "csv_to_json.convert",
-    ConversionType.CSV_TO_XLSX: "csv_to_xlsx.convert",
-    ConversionType.XLSX_TO_CSV: "xlsx_to_csv.convert",
-    ConversionType.TXT_TO_PDF: "txt_to_pdf.convert",
-    ConversionType.PDF_TO_TEXT: "pdf_to_text.convert",
-    ConversionType.DOCX_TO_PDF: "docx_to_pdf.convert",
-    ConversionType.DOCX_TO_MARKDOWN: "docx_to_markdown.convert",
-}
+from app.infra.cache.result_cache import get_result_cache
+from app.infra.cache.job_status_cache import record_job_status
+from app.domain.entities.converter_spec import get_converter_spec
+from app.config import config
+from app.workers.registry import registry
+from app.workers.progress import reporting
+from app.workers.lease import JobLease
+from app.workers.supervisor import ConversionLimits, run_isolated
+from app.workers.routing import queue_for
+from app.workers.scheduling import (
+    NORMAL_PRIORITY,
+    SLOT_DENIED,
+    SLOT_TAKEN,
+    estimate_cost,
+    get_fair_scheduler,
+    priority_for,
+)
+from app.domain.enums.converter_resource import ConverterResource
 
 
 @celery.task(name="process_conversion")
-def process_conversion(job_id: str, client_id: str):
+def process_conversion(
+    job_id: str,
+    client_id: str,
+    input_hash: str | None = None,
+    options: dict | None = None,
+    cost: float = 0.0,
+    conversion_type: str | None = None,
+):
     db = SessionLocal()
     job_repo = DocumentRepository(db)
     storage_repo = ClientStorageRepository(db)
+    scheduler = get_fair_scheduler() if config.FAIR_SHARE_ENABLED else None
+    acquired = claimed = False
+    lease = None
 
     try:
         job_uuid = UUID(job_id)
-        job = job_repo.get_by_id(job_uuid)
+        if conversion_type is None:
+            # Mensagem enfileirada antes de o payload trazer o tipo.
+            job = job_repo.get_by_id(job_uuid)
+            if not job:
+                return
+            conversion_type = job.conversion_type
+        conversion_type = ConversionType(conversion_type)
+        job = None
+
+        retry = (job_id, client_id, input_hash, options, cost, conversion_type.value)
+        if scheduler:
+            slot = scheduler.acquire(client_id, job_id)
+            if slot == SLOT_DENIED:
+                # Cliente já no limite de conversões simultâneas: o job volta
+                # para o fim da fila e o worker segue com os de outros clientes.
+                _republish(retry, conversion_type, config.FAIR_SHARE_RETRY_DELAY)
+                return
+            # Vaga que já era do job fica com a entrega que o assumir.
+            acquired = slot == SLOT_TAKEN
+
+        # O claim devolve a linha do job, dispensando uma leitura separada.
+        job = job_repo.claim(job_uuid, config.JOB_LEASE_SECONDS)
         if not job:
+            status = job_repo.get_status(job_uuid)
+            if status in (JobStatus.PENDING, JobStatus.PROCESSING):
+                # Outro worker está com o job (entrega duplicada ou reentrega
+                # após queda). Confere de novo quando o lease dele puder vencer.
+                _republish(retry, conversion_type, config.JOB_LEASE_SECONDS)
             return
+        # Só a entrega que assumiu o job o tira do backlog do cliente; também
+        # limpa o registro de uma entrega anterior que morreu com o job.
+        claimed = True
 
-        job.mark_processing()
-        job_repo.update(job)
+        if options is None:
+            # Reenfileirado pela recuperação: as opções vêm do próprio job.
+            options = job.options or None
+
+        lease = JobLease(
+            job.id, job.updated_at, _renew_lease, config.JOB_LEASE_SECONDS / 4
+        ).start()
+        record_job_status(job, client_id)
+        publish_job_event(
+            "job_processing",
+            {"job_id": job_id, "status": job.status.value, "client_id": client_id},
+        )
 
         input_path = Path(job.input_path)
         output_path = Path(job.output_path) if job.output_path else None
@@ -47,43 +101,87 @@ def process_conversion(job_id: str, client_id: str):
         if not output_path:
             raise ValueError("output_path não definido no job")
 
-        module_name, func_name = CONVERTERS[ConversionType(job.conversion_type)].rsplit(
-            ".", 1
-        )
-        converter_module = importlib.import_module(
-            f"app.workers.converters.{module_name}"
-        )
-        convert_func = getattr(converter_module, func_name)
+        spec = get_converter_spec(conversion_type)
+        use_cache = config.RESULT_CACHE_ENABLED and input_hash
+        cache = get_result_cache() if use_cache else None
+        cache_key = None
 
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        convert_func(str(input_path), str(output_path))
+        if cache:
+            cache_key = cache.make_key(
+                input_hash, conversion_type.value, spec.version if spec else 1, options
+            )
+            cached = cache.get(cache_key)
+            if cached:
+                output_path = cache.link_to(cached, output_path)
+                claimed_at = _stop_lease(lease, job)
+                _complete_job(
+                    job, job_repo, storage_repo, client_id, output_path, claimed_at
+                )
+                return
 
-        job.mark_completed(str(output_path))
-        print("Passou")
-        publish_job_event(
-            "job_completed",
-            {
-                "job_id": str(job.id),
-                "status": job.status.value,
-                "download_url": f"/documents/download/{job.id}",
-                "filename": job.input_filename,
-                "client_id": client_id,
-            },
-        )
+            if not cache.claim(cache_key, job_id) and cache.attach(
+                cache_key, job_id, client_id
+            ):
+                # Outro worker já converte este mesmo arquivo; o job fica em
+                # processamento e é concluído quando aquele terminar.
+                return
+
+        convert_func = registry.get(conversion_type)
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with reporting(job_id, client_id):
+                result_path = _run_converter(
+                    spec,
+                    partial(convert_func, **(options or {})),
+                    input_path,
+                    output_path,
+                )
+        except Exception:
+            if cache_key:
+                _requeue_waiters(
+                    cache.release(cache_key, job_id),
+                    conversion_type,
+                    input_hash,
+                    options,
+                )
+            raise
+        if result_path:
+            output_path = Path(result_path)
 
-        job_repo.update(job)
+        if cache_key:
+            _share_result(
+                cache,
+                cache_key,
+                job_id,
+                output_path,
+                conversion_type,
+                input_hash,
+                options,
+                job_repo,
+                storage_repo,
+            )
 
-        client_dir = get_client_output_dir(client_id)
-        new_size = get_directory_size(client_dir)
-        storage_repo.update_size(UUID(client_id), new_size)
+        claimed_at = _stop_lease(lease, job)
+        if lease.lost:
+            return
+        _complete_job(job, job_repo, storage_repo, client_id, output_path, claimed_at)
 
     except Exception as e:
         db.rollback()
 
+        if lease is not None and lease.lost:
+            # O job e o arquivo de saída agora são do worker que o assumiu.
+            print(f"[Worker] Falha em job {job_id} já assumido por outro worker: {e}")
+            return
+
         if "job" in locals() and job is not None:
+            claimed_at = _stop_lease(lease, job)
             job.mark_failed(str(e))
-            job_repo.update(job)
-            db.commit()
+            if not job_repo.finish(job, claimed_at):
+                print(f"[Worker] Falha em job {job_id} assumido por outro worker: {e}")
+                return
+            record_job_status(job, client_id)
 
             publish_job_event(
                 "job_failed",
@@ -95,6 +193,7 @@ def process_conversion(job_id: str, client_id: str):
                 },
             )
 
+        # Saída parcial nunca entrou na cota, então não há o que descontar.
         if (
             "output_path" in locals()
             and output_path is not None
@@ -102,10 +201,266 @@ def process_conversion(job_id: str, client_id: str):
         ):
             output_path.unlink(missing_ok=True)
 
-        if "client_id" in locals() and client_id:
-            client_dir = get_client_output_dir(client_id)
-            new_size = get_directory_size(client_dir)
-            storage_repo.update_size(UUID(client_id), new_size)
+    finally:
+        if lease is not None:
+            lease.stop()
+        if scheduler:
+            _release_share(scheduler, client_id, job_id, acquired or claimed, claimed)
+        db.close()
+
+
+def _republish(args: tuple, conversion_type: ConversionType, countdown: int) -> None:
+    process_conversion.apply_async(
+        args, queue=queue_for(conversion_type), countdown=countdown
+    )
+
+
+def _stop_lease(lease: JobLease | None, job: DocumentJob):
+    """
+    Para a renovação antes da escrita final e devolve o lease vigente, que
+    serve de fencing token: a escrita só vale se o banco ainda tiver esse valor.
+    """
+    if lease is None:
+        return job.updated_at
+    lease.stop()
+    return lease.claimed_at
+
+
+def _renew_lease(job_id: UUID, claimed_at):
+    db = SessionLocal()
+    try:
+        return DocumentRepository(db).renew_lease(job_id, claimed_at)
+    finally:
+        db.close()
+
+
+def _release_share(
+    scheduler, client_id: str, job_id: str, release: bool, finish: bool
+) -> None:
+    try:
+        if release:
+            scheduler.release(client_id, job_id)
+        if finish:
+            scheduler.finish(client_id, job_id)
+    except Exception as e:
+        print(f"[FairShare] Falha ao liberar a cota do cliente {client_id}: {e}")
+
+
+def _run_converter(spec, convert_func, input_path: Path, output_path: Path):
+    """
+    Conversores que rodam em Python vão para um processo filho com teto de
+    memória, tempo e CPU. Os que já delegam a outro processo (LibreOffice)
+    rodam aqui mesmo, com o timeout do próprio pool.
+    """
+    args = (str(input_path), str(output_path))
+    if not config.CONVERTER_ISOLATION or (
+        spec and spec.resource is ConverterResource.SUBPROCESS_BOUND
+    ):
+        return convert_func(*args)
+
+    limits = ConversionLimits.for_spec(spec, input_path.stat().st_size)
+    return run_isolated(convert_func, args, limits)
+
+
+def _complete_job(
+    job: DocumentJob,
+    job_repo: DocumentRepository,
+    storage_repo: ClientStorageRepository,
+    client_id: str,
+    output_path: Path,
+    claimed_at: datetime,
+) -> bool:
+    job.mark_completed(str(output_path))
+    if not job_repo.finish(job, claimed_at):
+        print(f"[Worker] Job {job.id} assumido por outro worker; resultado descartado")
+        return False
+
+    record_job_status(job, client_id)
+    publish_job_event(
+        "job_completed",
+        {
+            "job_id": str(job.id),
+            "status": job.status.value,
+            "download_url": f"/documents/download/{job.id}",
+            "filename": job.input_filename,
+            "client_id": client_id,
+        },
+    )
+
+    storage_repo.update_size(UUID(client_id), output_path.stat().st_size)
+    return True
+
+
+def _share_result(
+    cache,
+    cache_key: str,
+    job_id: str,
+    output_path: Path,
+    conversion_type: ConversionType,
+    input_hash: str,
+    options: dict | None,
+    job_repo: DocumentRepository,
+    storage_repo: ClientStorageRepository,
+) -> None:
+    """
+    Guarda o resultado no cache e conclui os jobs que aguardavam esta mesma
+    conversão. Se o cache falhar, eles voltam para a fila.
+    """
+    try:
+        cached = cache.put(cache_key, output_path)
+    except Exception as e:
+        print(f"[Cache] Falha ao armazenar resultado: {e}")
+        _requeue_waiters(
+            cache.release(cache_key, job_id), conversion_type, input_hash, options
+        )
+        return
+
+    for waiter in cache.release(cache_key, job_id):
+        try:
+            job = job_repo.get_by_id(UUID(waiter["job_id"]))
+            if not job or not job.output_path:
+                continue
+            output_path = cache.link_to(cached, Path(job.output_path))
+            # O job em espera não tem lease: o fencing usa o updated_at lido.
+            _complete_job(
+                job,
+                job_repo,
+                storage_repo,
+                waiter["client_id"],
+                output_path,
+                job.updated_at,
+            )
+        except Exception as e:
+            print(f"[Cache] Falha ao concluir job em espera {waiter['job_id']}: {e}")
+            job_repo.db.rollback()
+            enqueue_conversion(
+                waiter["job_id"], waiter["client_id"], conversion_type, None, options
+            )
+
+
+def _requeue_waiters(
+    waiters: list[dict],
+    conversion_type: ConversionType,
+    input_hash: str,
+    options: dict | None,
+) -> None:
+    """A conversão falhou: cada job em espera tenta por conta própria"""
+    for waiter in waiters:
+        enqueue_conversion(
+            waiter["job_id"], waiter["client_id"], conversion_type, input_hash, options
+        )
+
+
+def enqueue_conversion(
+    job_id: str,
+    client_id: str,
+    conversion_type: ConversionType,
+    input_hash: str | None = None,
+    options: dict | None = None,
+    input_size_bytes: int | None = None,
+) -> None:
+    """
+    Enfileira a conversão na fila da classe do seu conversor, com prioridade
+    pelo custo estimado e pelo backlog do cliente (quando o tamanho é dado).
+    """
+    conversion_type = ConversionType(conversion_type)
+    cost, priority = _admit(client_id, job_id, conversion_type, input_size_bytes)
+    process_conversion.apply_async(
+        (job_id, client_id, input_hash, options, cost, conversion_type.value),
+        queue=queue_for(conversion_type),
+        priority=priority,
+    )
+
+
+def _admit(
+    client_id: str,
+    job_id: str,
+    conversion_type: ConversionType,
+    input_size_bytes: int | None,
+) -> tuple[float, int]:
+    if not config.FAIR_SHARE_ENABLED or input_size_bytes is None:
+        return 0.0, NORMAL_PRIORITY
+
+    cost = estimate_cost(conversion_type, input_size_bytes)
+    try:
+        return cost, get_fair_scheduler().admit(client_id, job_id, cost)
+    except Exception as e:
+        print(f"[FairShare] Falha ao registrar job do cliente {client_id}: {e}")
+        return 0.0, priority_for(cost, 0)
+
+
+def dispatch_batch(
+    batch_id: str,
+    client_id: str,
+    jobs: list[tuple[DocumentJob, str]],
+    options: dict | None = None,
+) -> None:
+    """
+    Enfileira os jobs do lote como um chord com um evento final agregado.
+    Os menores são registrados primeiro e ficam com prioridade maior.
+    """
+    sized = [
+        (job, input_hash, Path(job.input_path).stat().st_size)
+        for job, input_hash in jobs
+    ]
+    sized.sort(key=lambda item: estimate_cost(item[0].conversion_type, item[2]))
+
+    header = []
+    for job, input_hash, size in sized:
+        conversion_type = ConversionType(job.conversion_type)
+        cost, priority = _admit(client_id, str(job.id), conversion_type, size)
+        header.append(
+            process_conversion.s(
+                str(job.id), client_id, input_hash, options, cost, conversion_type.value
+            ).set(queue=queue_for(conversion_type), priority=priority)
+        )
+    job_ids = [str(job.id) for job, _ in jobs]
+    chord(header)(finalize_batch.s(batch_id, client_id, job_ids))
+
+
+@celery.task(name="finalize_batch", bind=True, max_retries=None)
+def finalize_batch(self, _results, batch_id: str, client_id: str, job_ids: list):
+    db = SessionLocal()
+    job_repo = DocumentRepository(db)
+
+    try:
+        by_id = {str(job.id): job for job in job_repo.get_many(job_ids)}
+        jobs = [by_id[job_id] for job_id in job_ids if job_id in by_id]
+
+        # Jobs coalescidos pelo cache terminam depois do worker que os recebeu.
+        pending = [
+            job
+            for job in jobs
+            if job.status in (JobStatus.PENDING, JobStatus.PROCESSING)
+        ]
+        elapsed = self.request.retries * config.BATCH_POLL_INTERVAL
+        if pending and elapsed < config.RESULT_CACHE_INFLIGHT_TTL:
+            raise self.retry(countdown=config.BATCH_POLL_INTERVAL)
+
+        completed = [job for job in jobs if job.status == JobStatus.COMPLETED]
+        publish_job_event(
+            "batch_completed",
+            {
+                "batch_id": batch_id,
+                "client_id": client_id,
+                "total": len(job_ids),
+                "completed": len(completed),
+                "failed": len(jobs) - len(completed) - len(pending),
+                "jobs": [
+                    {
+                        "job_id": str(job.id),
+                        "status": job.status.value,
+                        "filename": job.input_filename,
+                        "download_url": (
+                            f"/documents/download/{job.id}"
+                            if job.status == JobStatus.COMPLETED
+                            else None
+                        ),
+                    }
+                    for job in jobs
+                ],
+            },
+        )
 
     finally:
         db.close()
@@ -0,0 +1,69 @@
+from celery import shared_task
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from uuid import UUID
+from sqlalchemy.orm import Session
+from app.config import config
+from app.infra.db.db import SessionLocal
+from app.infra.utils import (
+    get_client_input_dir,
+    get_client_output_dir,
+    get_directory_size,
+)
+from app.repositories.client_storage_repository import ClientStorageRepository
+
+
+@shared_task
+def reconcile_storage_usage():
+    """
+    Corrige a diferença entre o uso registrado de cada cliente e o que está
+    de fato em disco (entrada + saída). Os clientes são conferidos em
+    paralelo, cada um com a sua sessão.
+    """
+    db = SessionLocal()
+    try:
+        client_ids = list(ClientStorageRepository(db).get_sizes())
+    finally:
+        db.close()
+
+    with ThreadPoolExecutor(config.STORAGE_RECONCILE_WORKERS) as pool:
+        drifts = pool.map(_reconcile_client, client_ids)
+        for client_id, drift in zip(client_ids, drifts):
+            if drift is None:
+                print(f"[Storage] Cliente {client_id}: alterado na medição, pulado")
+            elif drift:
+                print(f"[Storage] Cliente {client_id}: ajuste de {drift} bytes")
+
+
+def _reconcile_client(
+    client_id: UUID, session_factory: Callable[[], Session] = SessionLocal
+) -> int | None:
+    """
+    Lê o uso registrado logo antes de medir o disco e grava o medido só se
+    o registro não mudou nesse meio-tempo. Uma escrita durante a medição
+    pode ou não ter entrado na soma; somar a diferença ao valor atual a
+    contaria duas vezes, então o cliente fica para a próxima rodada.
+    Devolve o ajuste aplicado, ou None se o cliente foi pulado.
+    """
+    db = session_factory()
+    try:
+        storage_repo = ClientStorageRepository(db)
+        recorded = storage_repo.get_size(client_id)
+        if recorded is None:
+            return 0
+
+        measured = _client_usage(client_id)
+        if not storage_repo.reconcile_size(client_id, recorded, measured):
+            return None
+        return measured - recorded
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _client_usage(client_id: UUID) -> int:
+    return get_directory_size(get_client_input_dir(client_id)) + get_directory_size(
+        get_client_output_dir(client_id)
+    )
@@ -0,0 +1,67 @@
+from celery import shared_task
+from app.config import config
+from app.infra.cache.job_status_cache import job_client_id, record_job_status
+from app.infra.db.db import SessionLocal
+from app.infra.redis.redis_pub import publish_job_event
+from app.repositories.document_repository import DocumentRepository
+
+
+@shared_task
+def recover_stale_jobs():
+    """
+    Jobs em processamento sem renovação de lease por muito tempo perderam o
+    worker (processo morto sem reentrega da mensagem, ou jobs que aguardavam
+    a conversão de um worker que morreu). Voltam para a fila com as opções
+    guardadas no job; depois de JOB_MAX_RECOVERIES tentativas, falham.
+
+    A folga cobre a reentrega normal da mensagem, que reassume o job depois
+    de um lease, e jobs que aguardam outra conversão do mesmo arquivo, que
+    só terminam junto com ela.
+    """
+    from app.workers.tasks.conversion_worker import enqueue_conversion
+
+    stale_after = max(
+        3 * config.JOB_LEASE_SECONDS,
+        config.CONVERTER_TIMEOUT + config.JOB_LEASE_SECONDS,
+    )
+
+    db = SessionLocal()
+    try:
+        job_repo = DocumentRepository(db)
+        for job in job_repo.get_stale_jobs(stale_after):
+            client_id = job_client_id(job)
+
+            if job.recoveries < config.JOB_MAX_RECOVERIES:
+                if job_repo.requeue(job):
+                    record_job_status(job, client_id)
+                    enqueue_conversion(
+                        str(job.id),
+                        client_id,
+                        job.conversion_type,
+                        options=job.options or None,
+                    )
+                    print(f"[Worker] Job {job.id} sem worker reenfileirado")
+                continue
+
+            claimed_at = job.updated_at
+            job.mark_failed("Conversão interrompida. Envie o arquivo novamente.")
+            if not job_repo.finish(job, claimed_at):
+                # Um worker reassumiu o job depois da leitura.
+                continue
+            record_job_status(job, client_id)
+
+            publish_job_event(
+                "job_failed",
+                {
+                    "job_id": str(job.id),
+                    "status": "failed",
+                    "error": job.error_message,
+                    "client_id": client_id,
+                },
+            )
+            print(f"[Worker] Job {job.id} sem worker marcado como falho")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
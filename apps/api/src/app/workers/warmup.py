@@ -0,0 +1,185 @@
+import json
+import tempfile
+import time
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+from app.config import config
+from app.domain.entities.converter_spec import CONVERTER_SPECS
+from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.converter_resource import ConverterResource
+from app.workers.registry import ConverterRegistry
+
+
+@dataclass
+class WarmUpResult:
+    conversion_type: str
+    load_seconds: float
+    first_run_seconds: float | None = None
+    warm_run_seconds: float | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def warm_up_converters(
+    registry: ConverterRegistry, types: list[ConversionType] | None = None
+) -> list[WarmUpResult]:
+    """
+    Carrega os conversores e roda uma conversão mínima de cada um, duas
+    vezes: a primeira mede a latência do primeiro job no processo, a segunda
+    a de um job já aquecido. Falhas são reportadas sem interromper os demais.
+    """
+    registry.load()
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix="warm_up_") as tmp_dir:
+        samples: dict[str, Path] = {}
+        for conversion_type in types or default_warm_up_types():
+            spec = CONVERTER_SPECS[conversion_type]
+            result = WarmUpResult(
+                conversion_type=conversion_type.value,
+                load_seconds=registry.load_seconds.get(spec.module_name, 0.0),
+            )
+            results.append(result)
+
+            try:
+                source = _input_extension(conversion_type)
+                if source not in samples:
+                    samples[source] = Path(tmp_dir) / f"sample.{source}"
+                    SAMPLE_BUILDERS[source](samples[source])
+
+                convert = registry.get(conversion_type)
+                name = f"{conversion_type.value}.{spec.output_extension}"
+                output = Path(tmp_dir) / name
+                result.first_run_seconds = _timed(convert, samples[source], output)
+                result.warm_run_seconds = _timed(convert, samples[source], output)
+            except Exception as e:
+                result.error = str(e) or type(e).__name__
+
+    return results
+
+
+def default_warm_up_types() -> list[ConversionType]:
+    """
+    Tipos configurados em WORKER_WARM_UP_TYPES ou, sem configuração, todos
+    os conversores que rodam no próprio processo. Pipelines reaproveitam os
+    conversores das etapas e o LibreOffice tem a própria inicialização.
+    """
+    if config.WORKER_WARM_UP_TYPES:
+        return [
+            ConversionType(name.strip())
+            for name in config.WORKER_WARM_UP_TYPES.split(",")
+            if name.strip()
+        ]
+    return [
+        conversion_type
+        for conversion_type, spec in CONVERTER_SPECS.items()
+        if not spec.is_pipeline and spec.resource != ConverterResource.SUBPROCESS_BOUND
+    ]
+
+
+def report_readiness(results: list[WarmUpResult], ready_file: str) -> None:
+    """Imprime o resumo do aquecimento e grava o arquivo de prontidão"""
+    for r in results:
+        if r.ok:
+            print(
+                f"[Worker] {r.conversion_type}: carga {r.load_seconds * 1000:.0f} ms, "
+                f"1º job {r.first_run_seconds * 1000:.0f} ms, "
+                f"aquecido {r.warm_run_seconds * 1000:.0f} ms"
+            )
+        else:
+            print(f"[Worker] {r.conversion_type}: falha no autoteste: {r.error}")
+
+    failed = [r.conversion_type for r in results if not r.ok]
+    print(
+        f"[Worker] Pronto: {len(results) - len(failed)}/{len(results)} "
+        "conversores aquecidos"
+    )
+
+    if ready_file:
+        payload = {"ready_at": time.time(), "converters": [asdict(r) for r in results]}
+        Path(ready_file).write_text(json.dumps(payload), encoding="utf-8")
+
+
+def _timed(convert: Callable, input_path: Path, output_path: Path) -> float:
+    started = time.perf_counter()
+    convert(str(input_path), str(output_path))
+    return time.perf_counter() - started
+
+
+def _input_extension(conversion_type: ConversionType) -> str:
+    return conversion_type.value.split("_to_")[0]
+
+
+def _build_csv(path: Path) -> None:
+    path.write_text("id,nome,valor\n1,ação,1.5\n2,teste,2.5\n", encoding="utf-8")
+
+
+def _build_txt(path: Path) -> None:
+    path.write_text("Autoteste do worker\nSegunda linha\n", encoding="utf-8")
+
+
+def _build_xlsx(path: Path) -> None:
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["id", "nome"])
+    sheet.append([1, "teste"])
+    workbook.save(path)
+
+
+def _build_pdf(path: Path) -> None:
+    from fpdf import FPDF
+
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=12)
+    pdf.add_page()
+    pdf.cell(text="Autoteste do worker")
+    pdf.output(str(path))
+
+
+_DOCX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/'
+        'vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+        'relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats'
+        '.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="word/document.xml"/></Relationships>'
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/'
+        'wordprocessingml/2006/main"><w:body><w:p><w:r>'
+        "<w:t>Autoteste do worker</w:t></w:r></w:p></w:body></w:document>"
+    ),
+}
+
+
+def _build_docx(path: Path) -> None:
+    with zipfile.ZipFile(path, "w") as docx:
+        for name, content in _DOCX_PARTS.items():
+            docx.writestr(name, content)
+
+
+SAMPLE_BUILDERS: dict[str, Callable[[Path], None]] = {
+    "csv": _build_csv,
+    "txt": _build_txt,
+    "xlsx": _build_xlsx,
+    "pdf": _build_pdf,
+    "docx": _build_docx,
+}
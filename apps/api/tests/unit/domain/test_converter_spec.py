@@ -0,0 +1,32 @@
+from app.domain.entities.converter_spec import CONVERTER_SPECS, get_converter_spec
+from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.converter_resource import ConverterResource
+
+
+def test_every_conversion_type_has_a_spec():
+    assert set(CONVERTER_SPECS) == set(ConversionType)
+
+
+def test_get_converter_spec_accepts_raw_values_and_unknown_types():
+    spec = get_converter_spec("docx_to_pdf")
+
+    assert spec.conversion_type is ConversionType.DOCX_TO_PDF
+    assert spec.output_extension == "pdf"
+    assert spec.resource is ConverterResource.SUBPROCESS_BOUND
+    assert get_converter_spec("custom_conversion") is None
+
+
+def test_estimate_memory_scales_with_input_size():
+    spec = get_converter_spec(ConversionType.TXT_TO_PDF)
+
+    assert spec.estimate_memory_mb(10 * 1024 * 1024) == 10 * spec.memory_mb_per_input_mb
+
+
+def test_pipeline_stages_are_plain_converters_ending_in_the_output_type():
+    for spec in CONVERTER_SPECS.values():
+        if not spec.is_pipeline:
+            continue
+
+        stages = [get_converter_spec(stage) for stage in spec.stages]
+        assert all(stage.handler and not stage.is_pipeline for stage in stages)
+        assert stages[-1].output_extension == spec.output_extension
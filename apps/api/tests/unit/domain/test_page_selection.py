@@ -0,0 +1,21 @@
+import pytest
+
+from app.domain.entities.page_selection import PageSelection
+
+
+def test_resolve_merges_ranges_and_clamps_to_page_count():
+    selection = PageSelection.parse("8-10, 1-2, 2, 9-")
+
+    assert selection.resolve(11) == [0, 1, 7, 8, 9, 10]
+    assert selection.resolve(3) == [0, 1]
+
+
+def test_max_pages_alone_takes_the_first_pages():
+    assert PageSelection.parse(max_pages=5).resolve(2000) == [0, 1, 2, 3, 4]
+    assert PageSelection.parse().is_all
+
+
+@pytest.mark.parametrize("pages", ["0-3", "5-2", "a-b", "1-2-3"])
+def test_invalid_ranges_are_rejected(pages):
+    with pytest.raises(ValueError):
+        PageSelection.parse(pages)
@@ -0,0 +1,137 @@
+import io
+import zipfile
+from uuid import uuid4
+import pytest
+from flask import Flask, g
+from flask_smorest import Api
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.config import config
+from app.domain.entities import client_storage
+from app.domain.enums.conversion_type import ConversionType
+from app.http.documents import routes
+from app.infra.db.db import Base
+from app.infra.models import client_storage_model, document_job_model  # noqa: F401
+from app.repositories.client_storage_repository import ClientStorageRepository
+from app.repositories.document_repository import DocumentRepository
+from app.services import document_service
+from app.services.document_service import DocumentService
+from app.workers.tasks import conversion_worker
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/batch.db")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def dispatched(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        conversion_worker,
+        "dispatch_batch",
+        lambda batch_id, client_id, jobs, options: calls.append(jobs),
+    )
+    return calls
+
+
+@pytest.fixture
+def client(sessions, dispatched, tmp_path, monkeypatch):
+    for name in ("get_client_input_dir", "get_client_output_dir"):
+        monkeypatch.setattr(
+            document_service, name, lambda client_id: tmp_path / str(client_id)
+        )
+
+    app = Flask(__name__)
+    app.config.update(API_TITLE="teste", API_VERSION="v1", OPENAPI_VERSION="3.0.3")
+
+    @app.before_request
+    def create_db_session():
+        g.db = sessions()
+        g.storage_repository = ClientStorageRepository(g.db)
+        g.document_service = DocumentService(
+            DocumentRepository(g.db), g.storage_repository
+        )
+
+    Api(app).register_blueprint(routes.documents_bp)
+    test_client = app.test_client()
+    test_client.set_cookie("client_id", str(uuid4()))
+    return test_client
+
+
+def _zip(members: dict[str, bytes]) -> io.BytesIO:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    buffer.seek(0)
+    return buffer
+
+
+def _upload(client, *files):
+    return client.post(
+        "/documents/upload/batch",
+        data={
+            "conversion_type": ConversionType.CSV_TO_JSON.value,
+            "files": list(files),
+        },
+        content_type="multipart/form-data",
+    )
+
+
+def test_zip_members_become_jobs_and_unsupported_ones_are_skipped(client, dispatched):
+    archive = _zip(
+        {
+            "dados/a.csv": b"id\n1\n",
+            "dados/": b"",
+            "imagem.png": b"\x89PNG",
+            "../b.csv": b"id\n2\n",
+        }
+    )
+
+    response = _upload(client, (archive, "lote.zip"), (io.BytesIO(b"id\n3\n"), "c.csv"))
+
+    assert response.status_code == 202
+    body = response.get_json()
+    assert [job["filename"] for job in body["jobs"]] == ["a.csv", "b.csv", "c.csv"]
+    jobs = dispatched[0]
+    assert [job.input_filename for job, _ in jobs] == ["a.csv", "b.csv", "c.csv"]
+    with open(jobs[1][0].input_path, "rb") as stream:
+        assert stream.read() == b"id\n2\n"
+
+
+def test_invalid_zip_is_rejected(client, dispatched):
+    response = _upload(client, (io.BytesIO(b"nao e zip"), "lote.zip"))
+
+    assert response.status_code == 400
+    assert dispatched == []
+
+
+def test_batch_over_the_member_limit_is_rejected(client, dispatched, monkeypatch):
+    monkeypatch.setattr(config, "BATCH_MAX_FILES", 2)
+    archive = _zip({f"{i}.csv": b"id\n1\n" for i in range(3)})
+
+    response = _upload(client, (archive, "lote.zip"))
+
+    assert response.status_code == 400
+    assert dispatched == []
+
+
+def test_quota_is_checked_against_the_whole_batch(client, dispatched, monkeypatch):
+    # Cada arquivo cabe na cota sozinho; os dois juntos, não.
+    monkeypatch.setattr(client_storage, "MAX_DAILY_QUOTA_BYTES", 1000)
+    archive = _zip({"a.csv": b"x" * 600})
+
+    response = _upload(client, (archive, "lote.zip"), (io.BytesIO(b"y" * 600), "b.csv"))
+
+    assert response.status_code == 403
+    assert dispatched == []
+
+
+def test_batch_without_supported_files_is_rejected(client, dispatched):
+    response = _upload(client, (io.BytesIO(b"\x89PNG"), "imagem.png"))
+
+    assert response.status_code == 400
+    assert dispatched == []
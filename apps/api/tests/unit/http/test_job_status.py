@@ -0,0 +1,33 @@
+from flask import Flask, g
+from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.conversion_type import ConversionType
+from app.http.documents import routes
+
+
+class FakeRepository:
+    def __init__(self, jobs):
+        self.jobs = jobs
+
+    def get_many(self, job_ids):
+        return [job for job in self.jobs if str(job.id) in job_ids]
+
+
+def test_redis_outage_is_logged_once_per_request(monkeypatch, capsys):
+    def unavailable():
+        raise ConnectionError("sem conexão")
+
+    monkeypatch.setattr(routes, "get_job_status_cache", unavailable)
+    job = DocumentJob(
+        conversion_type=ConversionType.CSV_TO_JSON,
+        input_filename="a.csv",
+        input_path="/c/cliente/a.csv",
+    )
+    monkeypatch.setattr(routes, "job_client_id", lambda job: "cliente")
+
+    with Flask(__name__).test_request_context():
+        g.document_repository = FakeRepository([job])
+        for _ in range(3):
+            snapshots = routes._job_statuses([str(job.id)], "cliente")
+
+    assert list(snapshots) == [str(job.id)]
+    assert capsys.readouterr().out.count("Redis indisponível") == 1
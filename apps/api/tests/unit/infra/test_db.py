@@ -0,0 +1,72 @@
+from app.infra.db import db
+
+
+def test_engine_is_created_lazily_and_readiness_does_not_raise(monkeypatch, tmp_path):
+    monkeypatch.setattr(db, "_engine", None)
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path}/ready.db")
+
+    assert db.check_database() is True
+    engine = db.get_engine()
+    assert db.get_engine() is engine
+
+    session = db.SessionLocal()
+    try:
+        assert session.get_bind() is engine
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def test_check_database_reports_unavailable_database(monkeypatch, tmp_path):
+    monkeypatch.setattr(db, "_engine", None)
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path}/missing/dir.db")
+
+    assert db.check_database() is False
+    db.get_engine().dispose()
+
+
+def test_init_db_adds_columns_missing_from_existing_tables(tmp_path):
+    from sqlalchemy import create_engine, inspect, text
+    from app.entrypoints.init_db import _add_missing_columns
+
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    db.Base.metadata.create_all(bind=engine)
+    # Tabela como era antes das colunas novas, já com um job gravado.
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE document_jobs DROP COLUMN options"))
+        conn.execute(text("ALTER TABLE document_jobs DROP COLUMN recoveries"))
+        conn.execute(
+            text(
+                "INSERT INTO document_jobs (id, conversion_type, input_filename,"
+                " input_path, status) VALUES ('a', 'CSV_TO_JSON', 'a.csv',"
+                " '/c/a.csv', 'PENDING')"
+            )
+        )
+
+    _add_missing_columns(engine)
+
+    columns = {c["name"] for c in inspect(engine).get_columns("document_jobs")}
+    assert {"options", "recoveries", "status"} <= columns
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT recoveries FROM document_jobs")).scalar() == 0
+    engine.dispose()
+
+
+def test_init_db_lists_enum_labels_missing_from_existing_types():
+    from app.domain.enums.conversion_type import ConversionType
+    from app.entrypoints.init_db import _missing_enum_values
+
+    existing = {
+        "conversiontype": ["CSV_TO_JSON", "CSV_TO_XLSX", "XLSX_TO_CSV"],
+        "jobstatus": ["PENDING", "PROCESSING", "COMPLETED", "FAILED"],
+    }
+
+    missing = _missing_enum_values(existing)
+
+    assert ("conversiontype", "CSV_TO_NDJSON") in missing
+    assert ("conversiontype", "DOCX_TO_TEXT") in missing
+    assert ("conversiontype", "XLSX_TO_ARROW") in missing
+    assert ("conversiontype", "CSV_TO_JSON") not in missing
+    assert len(missing) == len(ConversionType) - 3
+    # Tipo ainda inexistente fica para o create_all.
+    assert _missing_enum_values({}) == []
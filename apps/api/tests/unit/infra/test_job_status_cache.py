@@ -0,0 +1,90 @@
+from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.conversion_type import ConversionType
+from app.infra.cache.job_status_cache import (
+    JobStatusCache,
+    job_client_id,
+    job_snapshot,
+    snapshot_etag,
+)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            self.calls.append((getattr(self.client, name), args, kwargs))
+
+        return call
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+
+    def register_script(self, script):
+        def backfill(keys, args):
+            if keys[0] in self.hashes:
+                return 0
+            pairs = args[1:]
+            self.hashes[keys[0]] = dict(zip(pairs[::2], pairs[1::2]))
+            return 1
+
+        return backfill
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def expire(self, key, ttl):
+        pass
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+def _job(client_id="3f1c0c8e-8a55-4d1b-9a43-6f1c5f0a9b10") -> DocumentJob:
+    return DocumentJob(
+        conversion_type=ConversionType.CSV_TO_JSON,
+        input_filename="dados.csv",
+        input_path=f"/storage/inputs/{client_id}/dados.csv",
+        output_path=f"/storage/outputs/{client_id}/dados.json",
+    )
+
+
+def test_cached_snapshot_matches_database_snapshot_and_etag():
+    job = _job()
+    job.mark_completed(job.output_path)
+    cache = JobStatusCache(FakeRedis())
+
+    cache.set(job, job_client_id(job))
+    entry = cache.get_many([str(job.id)])[str(job.id)]
+
+    assert entry["client_id"] == job_client_id(job)
+    assert entry["snapshot"] == job_snapshot(job)
+    assert entry["snapshot"]["output_filename"] == "dados.json"
+    assert entry["snapshot"]["error"] is None
+    assert snapshot_etag([entry["snapshot"]]) == snapshot_etag([job_snapshot(job)])
+
+
+def test_backfill_does_not_overwrite_newer_state():
+    job = _job()
+    cache = JobStatusCache(FakeRedis())
+    stale = job_snapshot(job)
+
+    job.mark_failed("Arquivo corrompido")
+    cache.set(job, job_client_id(job))
+    job.status, job.error_message = stale["status"], None
+    cache.backfill(job, job_client_id(job))
+
+    snapshot = cache.get_many([str(job.id)])[str(job.id)]["snapshot"]
+    assert snapshot["status"] == "failed"
+    assert snapshot["error"] == "Arquivo corrompido"
+    assert snapshot_etag([snapshot]) != snapshot_etag([stale])
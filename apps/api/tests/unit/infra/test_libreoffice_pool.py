@@ -0,0 +1,86 @@
+import sys
+import textwrap
+
+import pytest
+
+from app.infra.libreoffice import pool as pool_module
+from app.infra.libreoffice.pool import LibreOfficePool
+
+
+FAKE_UNOSERVER = textwrap.dedent(
+    """
+    import argparse
+    import shutil
+    from xmlrpc.server import SimpleXMLRPCServer
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interface")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--uno-port")
+    parser.add_argument("--user-installation")
+    parser.add_argument("--conversion-timeout")
+    args = parser.parse_args()
+
+    server = SimpleXMLRPCServer((args.interface, args.port), allow_none=True, logRequests=False)
+    server.register_function(lambda: {"api": "3"}, "info")
+
+    def convert(inpath=None, indata=None, outpath=None, *rest):
+        shutil.copyfile(inpath, outpath)
+
+    server.register_function(convert, "convert")
+    server.serve_forever()
+    """
+)
+
+
+@pytest.fixture
+def fake_pool(tmp_path, monkeypatch):
+    script = tmp_path / "fake_unoserver.py"
+    script.write_text(FAKE_UNOSERVER, encoding="utf-8")
+    monkeypatch.setattr(
+        pool_module.config, "UNOSERVER_CMD", f"{sys.executable} {script}"
+    )
+    monkeypatch.setattr(pool_module.config, "LIBREOFFICE_MAX_CONVERSIONS", 2)
+
+    pool = LibreOfficePool(size=1)
+    yield pool
+    pool.close()
+
+
+def test_convert_writes_exact_output_path(fake_pool, tmp_path):
+    input_path = tmp_path / "relatorio.docx"
+    input_path.write_bytes(b"conteudo")
+    output_path = tmp_path / "job-id.pdf"
+
+    fake_pool.convert(str(input_path), str(output_path))
+
+    assert output_path.read_bytes() == b"conteudo"
+
+
+def test_instance_is_restarted_after_max_conversions(fake_pool, tmp_path):
+    input_path = tmp_path / "in.docx"
+    input_path.write_bytes(b"x")
+    instance = fake_pool._instances[0]
+
+    fake_pool.convert(str(input_path), str(tmp_path / "1.pdf"))
+    fake_pool.convert(str(input_path), str(tmp_path / "2.pdf"))
+    first_process = instance.process
+
+    fake_pool.convert(str(input_path), str(tmp_path / "3.pdf"))
+
+    assert instance.process is not first_process
+    assert instance.conversions == 1
+
+
+def test_dead_instance_is_restarted_before_use(fake_pool, tmp_path):
+    input_path = tmp_path / "in.docx"
+    input_path.write_bytes(b"x")
+    instance = fake_pool._instances[0]
+
+    instance.process.kill()
+    instance.process.wait()
+
+    fake_pool.convert(str(input_path), str(tmp_path / "out.pdf"))
+
+    assert instance.is_healthy()
+    assert (tmp_path / "out.pdf").exists()
@@ -0,0 +1,38 @@
+import pytest
+from app.infra.redis import redis_pub
+from app.infra.redis.redis_pub import (
+    publish_job_event,
+    read_job_events,
+    read_job_progress,
+)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(redis_pub, "get_redis_client", lambda: client)
+    monkeypatch.setattr(redis_pub, "_publish_script", None)
+    return client
+
+
+def test_progress_stays_out_of_the_replay_stream(client):
+    for progress in (10, 50):
+        publish_job_event(
+            "job_progress", {"job_id": "j1", "client_id": "c1", "progress": progress}
+        )
+    publish_job_event("job_progress", {"job_id": "j2", "client_id": "c1"})
+
+    assert read_job_events("c1", "0-0", 10) == []
+    latest = {p["data"]["job_id"]: p["data"] for p in read_job_progress("c1")}
+    assert latest["j1"]["progress"] == 50
+    assert set(latest) == {"j1", "j2"}
+
+
+def test_final_event_is_replayed_and_clears_the_job_progress(client):
+    publish_job_event("job_progress", {"job_id": "j1", "client_id": "c1"})
+    publish_job_event("job_completed", {"job_id": "j1", "client_id": "c1"})
+
+    events = read_job_events("c1", "0-0", 10)
+    assert [event["type"] for event in events] == ["job_completed"]
+    assert read_job_progress("c1") == []
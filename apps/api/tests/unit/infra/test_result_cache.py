@@ -0,0 +1,129 @@
+import hashlib
+import io
+
+import pytest
+
+from app.infra.cache.result_cache import ConversionResultCache
+from app.infra.utils import save_stream_with_hash
+
+
+def test_save_stream_with_hash_writes_file_and_returns_sha256(tmp_path):
+    data = b"a,b\n1,2\n" * 500_000
+    destination = tmp_path / "input.csv"
+
+    digest = save_stream_with_hash(io.BytesIO(data), destination, chunk_size=4096)
+
+    assert destination.read_bytes() == data
+    assert digest == hashlib.sha256(data).hexdigest()
+
+
+def test_cache_key_changes_with_conversion_type_and_version():
+    digest = hashlib.sha256(b"x").hexdigest()
+
+    key = ConversionResultCache.make_key(digest, "csv_to_json", 1)
+
+    assert key == f"{digest}:csv_to_json:v1"
+    assert key != ConversionResultCache.make_key(digest, "csv_to_ndjson", 1)
+    assert key != ConversionResultCache.make_key(digest, "csv_to_json", 2)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis(decode_responses=True)
+    return ConversionResultCache(client, cache_dir=tmp_path / "cache", max_bytes=10)
+
+
+def _output(tmp_path, name: str, size: int):
+    path = tmp_path / name
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def test_put_get_and_link_to_share_the_cached_file(cache, tmp_path):
+    cached = cache.put("k1:csv_to_json:v1", _output(tmp_path, "a.json", 4))
+
+    assert cache.get("k1:csv_to_json:v1") == cached
+    assert cache.get("k2:csv_to_json:v1") is None
+
+    linked = cache.link_to(cached, tmp_path / "out" / "job.json")
+    assert linked.read_bytes() == b"xxxx"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_eviction_drops_least_recently_used_and_keeps_total_in_sync(cache, tmp_path):
+    first = cache.put("k1:csv_to_json:v1", _output(tmp_path, "a.json", 4))
+    cache.put("k2:csv_to_json:v1", _output(tmp_path, "b.json", 4))
+    cache.get("k1:csv_to_json:v1")
+
+    # 4 + 4 + 4 > 10: sai o k2, o menos usado recentemente.
+    cache.put("k3:csv_to_json:v1", _output(tmp_path, "c.json", 4))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert stats["size_bytes"] == 8
+    assert stats["evictions"] == 1
+    assert cache.get("k2:csv_to_json:v1") is None
+    assert cache.get("k1:csv_to_json:v1") == first
+
+    # Regravar a mesma chave troca o tamanho em vez de somar.
+    cache.put("k1:csv_to_json:v1", _output(tmp_path, "a2.json", 2))
+    assert cache.stats()["size_bytes"] == 6
+
+
+def test_entry_whose_file_disappeared_is_dropped_on_get(cache, tmp_path):
+    cached = cache.put("k1:csv_to_json:v1", _output(tmp_path, "a.json", 4))
+    cached.unlink()
+
+    assert cache.get("k1:csv_to_json:v1") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["size_bytes"] == 0
+
+
+def test_claim_attach_release_hands_waiters_to_the_owner(cache):
+    assert cache.claim("k", "job-1") is True
+    assert cache.claim("k", "job-2") is False
+    assert cache.attach("k", "job-2", "client-b") is True
+    assert cache.attach("k", "job-3", "client-c") is True
+
+    # Só quem fez o claim libera; os demais recebem lista vazia.
+    assert cache.release("k", "job-2") == []
+    waiters = cache.release("k", "job-1")
+
+    assert [w["job_id"] for w in waiters] == ["job-2", "job-3"]
+    assert cache.release("k", "job-1") == []
+    assert cache.stats()["coalesced"] == 2
+
+
+def test_attach_without_conversion_in_flight_is_refused(cache):
+    assert cache.attach("k", "job-2", "client-b") is False
+
+    assert cache.claim("k", "job-2") is True
+
+
+def test_redelivered_owner_reclaims_its_own_conversion(cache):
+    assert cache.claim("k", "job-1") is True
+    assert cache.attach("k", "job-2", "client-b") is True
+
+    # Worker morreu: a mensagem do job-1 volta e ele reassume a conversão,
+    # sem cair na própria lista de espera.
+    assert cache.claim("k", "job-1") is True
+    assert cache.claim("k", "job-3") is False
+
+    waiters = cache.release("k", "job-1")
+    assert [w["job_id"] for w in waiters] == ["job-2"]
+
+
+def test_new_owner_takes_over_waiters_left_by_an_expired_claim(cache):
+    assert cache.claim("k", "job-1") is True
+    assert cache.attach("k", "job-2", "client-b") is True
+    waiters_key = cache._waiters_key("k")
+    assert cache.client.ttl(waiters_key) > cache.client.ttl(cache._inflight_key("k"))
+
+    # O dono morreu e o claim expirou; a lista de espera continua.
+    cache.client.delete(cache._inflight_key("k"))
+
+    assert cache.claim("k", "job-3") is True
+    waiters = cache.release("k", "job-3")
+    assert [w["job_id"] for w in waiters] == ["job-2"]
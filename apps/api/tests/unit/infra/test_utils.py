@@ -0,0 +1,19 @@
+import os
+
+from app.infra.utils import get_directory_size
+
+
+def test_directory_size_counts_nested_files_once(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"x" * 10)
+    nested = tmp_path / "sub" / "deeper"
+    nested.mkdir(parents=True)
+    (nested / "b.bin").write_bytes(b"y" * 25)
+    # Links simbólicos não contam (nem como arquivo nem como diretório).
+    os.symlink(nested, tmp_path / "link")
+    os.symlink(tmp_path / "a.txt", tmp_path / "a-link.txt")
+
+    assert get_directory_size(tmp_path) == 35
+
+
+def test_directory_size_of_missing_directory_is_zero(tmp_path):
+    assert get_directory_size(tmp_path / "missing") == 0
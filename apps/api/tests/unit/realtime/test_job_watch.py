@@ -0,0 +1,36 @@
+import threading
+import time
+
+from app.realtime.job_watch import JobStatusWatcher
+
+
+def _watcher() -> JobStatusWatcher:
+    watcher = JobStatusWatcher()
+    # Sem Redis nos testes: as notificações são entregues à mão.
+    watcher._ensure_started = lambda: None
+    return watcher
+
+
+def test_wait_returns_as_soon_as_a_watched_job_changes():
+    watcher = _watcher()
+    token = watcher.watch(["a", "b"])
+    threading.Timer(0.05, watcher.notify, args=("b",)).start()
+
+    started = time.monotonic()
+    assert watcher.wait(token, timeout=5) is True
+    assert time.monotonic() - started < 1
+
+    # O token avança: sem nova mudança, a próxima espera expira.
+    assert watcher.wait(token, timeout=0.05) is False
+
+
+def test_unwatched_jobs_are_ignored_and_forgotten():
+    watcher = _watcher()
+    token = watcher.watch(["a"])
+    watcher.notify("outro")
+
+    assert watcher.wait(token, timeout=0.05) is False
+
+    watcher.unwatch(token)
+    watcher.notify("a")
+    assert watcher._versions == {}
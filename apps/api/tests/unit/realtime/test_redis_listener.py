@@ -0,0 +1,31 @@
+from app.realtime import redis_listener
+
+
+class FakeHub:
+    def __init__(self):
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def dispatch(self, payload):
+        for listener in self.listeners:
+            listener(payload)
+
+
+def test_socketio_emits_from_the_shared_hub_subscription(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(
+        redis_listener.socketio,
+        "emit",
+        lambda event, data, room: emitted.append((event, room)),
+    )
+    hub = FakeHub()
+
+    redis_listener.start_redis_listener(hub)
+    hub.dispatch({"type": "job_progress", "data": {"client_id": "c1"}})
+    hub.dispatch({"type": "job_processing", "data": {"client_id": "c1"}})
+    hub.dispatch({"type": "job_completed", "data": {}})
+
+    assert len(hub.listeners) == 1
+    assert emitted == [("job_progress", "c1")]
@@ -0,0 +1,94 @@
+import pytest
+from app.realtime import sse
+from app.realtime.sse import ClientEventBroker, event_stream
+
+
+class FakeHub:
+    def __init__(self):
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+
+def _event(event_id, event_type="job_completed", client_id="c1", **data):
+    data = {"client_id": client_id, **data}
+    return {"id": event_id, "type": event_type, "data": data}
+
+
+@pytest.fixture(autouse=True)
+def no_progress(monkeypatch):
+    monkeypatch.setattr(sse, "read_job_progress", lambda client_id: [])
+
+
+def test_broker_shares_one_hub_listener_and_routes_by_client():
+    hub = FakeHub()
+    broker = ClientEventBroker(hub)
+    first, second, other = (
+        broker.subscribe("c1"),
+        broker.subscribe("c1"),
+        broker.subscribe("c2"),
+    )
+
+    broker.publish(_event("1-0", job_id="j1"))
+    broker.publish(_event("2-0", event_type="job_processing", job_id="j1"))
+    broker.publish(_event(None, event_type="job_progress", job_id="j2"))
+
+    assert len(hub.listeners) == 1
+    assert first.events.qsize() == second.events.qsize() == 2
+    assert other.events.empty()
+
+    broker.unsubscribe(first)
+    broker.unsubscribe(second)
+    broker.unsubscribe(other)
+    assert broker._subscriptions == {}
+
+
+def test_resume_replays_missed_events_and_skips_duplicates(monkeypatch):
+    monkeypatch.setattr(sse, "oldest_job_event_id", lambda client_id: "1-0")
+    monkeypatch.setattr(
+        sse,
+        "read_job_events",
+        lambda client_id, after_id, count: [_event("3-0", job_id="j1")],
+    )
+    broker = ClientEventBroker(FakeHub())
+    stream = event_stream(broker, "c1", last_event_id="2-0", heartbeat=0.01)
+
+    assert next(stream).startswith("retry:")
+    assert next(stream).startswith("id: 3-0\nevent: job_completed\n")
+
+    # Já reenviado pelo histórico: o mesmo evento ao vivo é descartado.
+    broker.publish(_event("3-0", job_id="j1"))
+    broker.publish(_event("4-0", event_type="job_failed", job_id="j2"))
+    assert next(stream).startswith("id: 4-0\nevent: job_failed\n")
+    assert next(stream) == ": ping\n\n"
+
+    stream.close()
+    assert broker._subscriptions == {}
+
+
+def test_resume_past_trimmed_history_asks_for_resync(monkeypatch):
+    monkeypatch.setattr(sse, "oldest_job_event_id", lambda client_id: "9-0")
+    monkeypatch.setattr(sse, "read_job_events", lambda *args: [])
+    stream = event_stream(ClientEventBroker(FakeHub()), "c1", last_event_id="2-0")
+
+    next(stream)
+    assert next(stream) == "event: resync\ndata: {}\n\n"
+    stream.close()
+
+
+def test_connection_starts_with_the_progress_of_running_jobs(monkeypatch):
+    progress = {"type": "job_progress", "data": {"job_id": "j1", "progress": 40}}
+    monkeypatch.setattr(sse, "read_job_progress", lambda client_id: [progress])
+    broker = ClientEventBroker(FakeHub())
+    stream = event_stream(broker, "c1", heartbeat=0.01)
+
+    next(stream)
+    assert next(stream) == (
+        'event: job_progress\ndata: {"job_id": "j1", "progress": 40}\n\n'
+    )
+
+    # O progresso segue ao vivo, sem ID de histórico.
+    broker.publish(_event(None, event_type="job_progress", job_id="j1"))
+    assert next(stream).startswith("event: job_progress\n")
+    stream.close()
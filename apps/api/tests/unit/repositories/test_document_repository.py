@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.job_status import JobStatus
+from app.infra.db.db import Base
+from app.infra.models.document_job_model import DocumentJobModel
+from app.repositories.document_repository import DocumentRepository
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/jobs.db")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def _job(**values) -> DocumentJob:
+    return DocumentJob(
+        conversion_type=ConversionType.CSV_TO_JSON,
+        input_filename="a.csv",
+        input_path="/c/a.csv",
+        **values,
+    )
+
+
+def test_update_of_a_missing_job_raises_and_rolls_back(sessions):
+    db = sessions()
+    repo = DocumentRepository(db)
+    staged = _job()
+    db.add(repo._to_model(staged))
+
+    with pytest.raises(ValueError):
+        repo.update_status(_job())
+
+    assert not db.in_transaction()
+    # O que estava pendente na sessão foi descartado junto.
+    assert DocumentRepository(sessions()).get_by_id(staged.id) is None
+
+
+def test_status_update_leaves_the_other_columns_alone(sessions):
+    job = _job()
+    DocumentRepository(sessions()).save(job)
+    # Outra escrita muda o nome de entrada enquanto o worker converte.
+    db = sessions()
+    db.query(DocumentJobModel).filter_by(id=job.id).update(
+        {"input_filename": "renomeado.csv", "recoveries": 2}
+    )
+    db.commit()
+
+    job.mark_failed("falhou")
+    DocumentRepository(sessions()).update_status(job)
+
+    saved = DocumentRepository(sessions()).get_by_id(job.id)
+    assert (saved.status, saved.error_message) == (JobStatus.FAILED, "falhou")
+    assert saved.updated_at == job.updated_at
+    assert (saved.input_filename, saved.recoveries) == ("renomeado.csv", 2)
+
+
+def test_claim_returns_the_row_it_updated(sessions):
+    created = datetime.utcnow() - timedelta(minutes=5)
+    job = _job(updated_at=created)
+    DocumentRepository(sessions()).save(job)
+
+    claimed = DocumentRepository(sessions()).claim(job.id, lease_seconds=60)
+
+    assert claimed.id == job.id
+    assert claimed.status == JobStatus.PROCESSING
+    assert claimed.updated_at > created
+    saved = DocumentRepository(sessions()).get_by_id(job.id)
+    assert saved.updated_at == claimed.updated_at
+    # O lease acabou de ser renovado: ninguém mais consegue o job.
+    assert DocumentRepository(sessions()).claim(job.id, lease_seconds=60) is None
+
+
+def test_claim_of_an_unknown_job_returns_none(sessions):
+    assert DocumentRepository(sessions()).claim(uuid4(), lease_seconds=60) is None
@@ -1,6 +1,10 @@
+import hashlib
+import io
 from pathlib import Path
 from uuid import uuid4
 
+import pytest
+
 from app.domain.enums.conversion_type import ConversionType
 from app.services.document_service import DocumentService
 
@@ -12,9 +16,16 @@ class DummyJobRepository:
     def save(self, job):
         self.saved_jobs.append(job)
 
+    def save_many(self, jobs):
+        self.saved_jobs.extend(jobs)
+
 
 class DummyStorageRepository:
-    pass
+    def __init__(self):
+        self.deltas = []
+
+    def update_size(self, client_id, delta_bytes):
+        self.deltas.append((client_id, delta_bytes))
 
 
 def test_create_job_saves_job_and_builds_expected_paths(tmp_path, monkeypatch):
@@ -66,3 +77,62 @@ def test_create_job_uses_fallback_extension_for_unknown_conversion_type(
     job = service.create_job(client_id, "custom_conversion", "file.bin")
 
     assert Path(job.output_path).suffix == ".out"
+
+
+def test_create_batch_writes_inputs_and_saves_jobs_together(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    repo = DummyJobRepository()
+    storage_repo = DummyStorageRepository()
+    service = DocumentService(repo, storage_repo)
+    client_id = uuid4()
+
+    monkeypatch.setattr(
+        "app.services.document_service.get_client_input_dir",
+        lambda _client_id: input_dir,
+    )
+    monkeypatch.setattr(
+        "app.services.document_service.get_client_output_dir",
+        lambda _client_id: tmp_path / "output",
+    )
+
+    inputs = [
+        ("a.csv", lambda: io.BytesIO(b"x,y\n1,2\n")),
+        ("b.csv", lambda: io.BytesIO(b"x,y\n3,4\n")),
+    ]
+    created = service.create_batch(client_id, ConversionType.CSV_TO_JSON, inputs)
+
+    assert [job for job, _ in created] == repo.saved_jobs
+    # Os bytes de entrada entram na cota num único incremento.
+    assert storage_repo.deltas == [(client_id, 16)]
+    for (job, input_hash), (_, open_stream) in zip(created, inputs):
+        data = open_stream().read()
+        assert Path(job.input_path).read_bytes() == data
+        assert input_hash == hashlib.sha256(data).hexdigest()
+
+
+def test_create_batch_removes_written_inputs_when_a_file_fails(tmp_path, monkeypatch):
+    input_dir = tmp_path / "input"
+    repo = DummyJobRepository()
+    service = DocumentService(repo, DummyStorageRepository())
+
+    monkeypatch.setattr(
+        "app.services.document_service.get_client_input_dir",
+        lambda _client_id: input_dir,
+    )
+    monkeypatch.setattr(
+        "app.services.document_service.get_client_output_dir",
+        lambda _client_id: tmp_path / "output",
+    )
+
+    def broken_stream():
+        raise OSError("falha de leitura")
+
+    with pytest.raises(OSError):
+        service.create_batch(
+            uuid4(),
+            ConversionType.CSV_TO_JSON,
+            [("a.csv", lambda: io.BytesIO(b"x\n1\n")), ("b.csv", broken_stream)],
+        )
+
+    assert repo.saved_jobs == []
+    assert list(input_dir.iterdir()) == []
@@ -0,0 +1,170 @@
+from uuid import uuid4
+import pytest
+from celery.exceptions import Retry
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.config import config
+from app.domain.entities.document_job import DocumentJob
+from app.domain.enums.conversion_type import ConversionType
+from app.domain.enums.job_status import JobStatus
+from app.infra.db.db import Base
+from app.infra.models import document_job_model  # noqa: F401
+from app.repositories.document_repository import DocumentRepository
+from app.workers.routing import queue_for
+from app.workers.scheduling import FairScheduler
+from app.workers.tasks import conversion_worker
+from app.workers.tasks.conversion_worker import dispatch_batch, finalize_batch
+
+
+def _job(tmp_path, conversion_type, size: int) -> DocumentJob:
+    job = DocumentJob(
+        conversion_type=conversion_type,
+        input_filename=f"{size}.bin",
+        input_path="",
+    )
+    input_path = tmp_path / f"{job.id}.bin"
+    input_path.write_bytes(b"x" * size)
+    job.input_path = str(input_path)
+    return job
+
+
+@pytest.fixture
+def chords(monkeypatch):
+    calls = []
+
+    def fake_chord(header):
+        return lambda callback: calls.append((header, callback))
+
+    monkeypatch.setattr(conversion_worker, "chord", fake_chord)
+    return calls
+
+
+def test_batch_is_dispatched_as_a_chord_smallest_first(tmp_path, chords, monkeypatch):
+    monkeypatch.setattr(config, "FAIR_SHARE_ENABLED", False)
+    large = _job(tmp_path, ConversionType.CSV_TO_JSON, 5000)
+    small = _job(tmp_path, ConversionType.CSV_TO_JSON, 10)
+    client_id = str(uuid4())
+
+    dispatch_batch("lote", client_id, [(large, "h1"), (small, "h2")], {"x": 1})
+
+    [(header, callback)] = chords
+    assert [task.args[0] for task in header] == [str(small.id), str(large.id)]
+    assert header[0].args[2:4] == ("h2", {"x": 1})
+    assert header[0].options["queue"] == queue_for(ConversionType.CSV_TO_JSON)
+    # O evento final lista os jobs na ordem em que foram enviados.
+    assert callback.args == ("lote", client_id, [str(large.id), str(small.id)])
+
+
+def test_batch_jobs_are_admitted_with_their_cost(tmp_path, chords, monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(config, "FAST_LANE_MAX_SECONDS", 0)
+    monkeypatch.setattr(config, "FAIR_SHARE_BACKLOG_STEP_SECONDS", 0.05)
+    scheduler = FairScheduler(fakeredis.FakeRedis(decode_responses=True))
+    monkeypatch.setattr(conversion_worker, "get_fair_scheduler", lambda: scheduler)
+    jobs = [
+        (_job(tmp_path, ConversionType.CSV_TO_JSON, size), "h")
+        for size in (50_000_000, 1_000)
+    ]
+
+    dispatch_batch("lote", str(uuid4()), jobs)
+
+    [(header, _)] = chords
+    small, large = header
+    assert small.args[4] < large.args[4]
+    # O maior entra depois, já com o backlog do menor na frente.
+    assert small.options["priority"] > large.options["priority"]
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path}/jobs.db")
+    Base.metadata.create_all(bind=engine)
+    sessions = sessionmaker(bind=engine)
+    monkeypatch.setattr(conversion_worker, "SessionLocal", sessions)
+    return DocumentRepository(sessions())
+
+
+@pytest.fixture
+def events(monkeypatch):
+    published = []
+    monkeypatch.setattr(
+        conversion_worker,
+        "publish_job_event",
+        lambda event, data: published.append((event, data)),
+    )
+    return published
+
+
+@pytest.fixture
+def retries(monkeypatch):
+    countdowns = []
+
+    def retry(countdown=None, **kwargs):
+        countdowns.append(countdown)
+        return Retry()
+
+    monkeypatch.setattr(finalize_batch, "retry", retry)
+    return countdowns
+
+
+def _saved(repo, status: JobStatus) -> DocumentJob:
+    job = DocumentJob(
+        conversion_type=ConversionType.CSV_TO_JSON,
+        input_filename=f"{status.value}.csv",
+        input_path="/c/a.csv",
+    )
+    job.status = status
+    repo.save(job)
+    return job
+
+
+def _finalize(job_ids: list, retries: int = 0):
+    return finalize_batch.apply(
+        args=(None, "lote", "cliente", [str(job_id) for job_id in job_ids]),
+        retries=retries,
+    )
+
+
+def test_batch_waits_for_jobs_still_pending(repo, events, retries, monkeypatch):
+    monkeypatch.setattr(config, "BATCH_POLL_INTERVAL", 5)
+    done = _saved(repo, JobStatus.COMPLETED)
+    waiting = _saved(repo, JobStatus.PROCESSING)
+
+    result = _finalize([done.id, waiting.id], retries=2)
+
+    assert result.state == "RETRY"
+    assert retries == [5]
+    assert events == []
+
+
+def test_batch_event_aggregates_completed_and_failed_jobs(repo, events, retries):
+    done = _saved(repo, JobStatus.COMPLETED)
+    failed = _saved(repo, JobStatus.FAILED)
+    missing = uuid4()
+
+    _finalize([done.id, missing, failed.id])
+
+    assert retries == []
+    [(event, data)] = events
+    assert event == "batch_completed"
+    assert (data["total"], data["completed"], data["failed"]) == (3, 1, 1)
+    assert [job["job_id"] for job in data["jobs"]] == [str(done.id), str(failed.id)]
+    assert data["jobs"][0]["download_url"] == f"/documents/download/{done.id}"
+    assert data["jobs"][1]["download_url"] is None
+
+
+def test_batch_gives_up_waiting_after_the_inflight_ttl(
+    repo, events, retries, monkeypatch
+):
+    monkeypatch.setattr(config, "BATCH_POLL_INTERVAL", 5)
+    monkeypatch.setattr(config, "RESULT_CACHE_INFLIGHT_TTL", 10)
+    done = _saved(repo, JobStatus.COMPLETED)
+    stuck = _saved(repo, JobStatus.PENDING)
+
+    _finalize([done.id, stuck.id], retries=2)
+
+    assert retries == []
+    [(_, data)] = events
+    # O job parado não conta como concluído nem como falho.
+    assert (data["completed"], data["failed"]) == (1, 0)
+    assert data["jobs"][1]["status"] == JobStatus.PENDING.value
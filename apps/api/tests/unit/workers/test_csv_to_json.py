@@ -0,0 +1,80 @@
+import json
+
+from app.workers.converters import csv_to_json, tabular
+
+
+def _write_csv(path, rows):
+    lines = ["id,name,score"]
+    lines += [f"{i},nome {i},{i * 1.5}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def test_streaming_array_matches_in_memory_output(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 25)
+
+    in_memory_path = tmp_path / "in_memory.json"
+    csv_to_json.convert(str(input_path), str(in_memory_path))
+
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(csv_to_json, "CHUNK_SIZE", 7)
+    streamed_path = tmp_path / "streamed.json"
+    csv_to_json.convert(str(input_path), str(streamed_path))
+
+    expected = json.loads(in_memory_path.read_text(encoding="utf-8"))
+    assert json.loads(streamed_path.read_text(encoding="utf-8")) == expected
+    assert len(expected) == 25
+    assert expected[3] == {"id": 3, "name": "nome 3", "score": 4.5}
+
+
+def test_streaming_array_compact_mode(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 10)
+    output_path = tmp_path / "output.json"
+
+    monkeypatch.setattr(csv_to_json.config, "JSON_INDENT", 0)
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(csv_to_json, "CHUNK_SIZE", 3)
+    csv_to_json.convert(str(input_path), str(output_path))
+
+    content = output_path.read_text(encoding="utf-8")
+    assert "\n" not in content
+    assert len(json.loads(content)) == 10
+
+
+def test_streaming_array_with_header_only(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 0)
+    output_path = tmp_path / "output.json"
+
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    csv_to_json.convert(str(input_path), str(output_path))
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == []
+
+
+def test_ndjson_writes_one_record_per_line(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 12)
+    output_path = tmp_path / "output.ndjson"
+
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(csv_to_json, "CHUNK_SIZE", 5)
+    csv_to_json.convert_ndjson(str(input_path), str(output_path))
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 12
+    assert json.loads(lines[-1])["id"] == 11
+
+
+def test_repeated_header_names_do_not_fail_the_conversion(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("a,b,a\n1,2,3\n", encoding="utf-8")
+
+    for threshold in (tabular.WHOLE_FILE_THRESHOLD_BYTES, 0):
+        monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", threshold)
+        output_path = tmp_path / f"out_{threshold}.json"
+        csv_to_json.convert(str(input_path), str(output_path))
+
+        rows = json.loads(output_path.read_text(encoding="utf-8"))
+        assert rows == [{"a": 1, "b": 2, "a.1": 3}]
@@ -0,0 +1,72 @@
+from openpyxl import load_workbook
+
+from app.workers.converters import csv_to_xlsx
+
+
+def _write_csv(path, rows):
+    lines = ["code,amount,note"]
+    lines += [f"{i:04d},{i * 2},{'' if i % 2 else 'ok'}" for i in range(rows)]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def _sheet_values(workbook, name):
+    return [list(row) for row in workbook[name].iter_rows(values_only=True)]
+
+
+def test_convert_writes_header_and_typed_values(tmp_path):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 3)
+    output_path = tmp_path / "output.xlsx"
+
+    csv_to_xlsx.convert(str(input_path), str(output_path), as_text=False)
+
+    rows = _sheet_values(load_workbook(output_path), "Sheet1")
+    assert rows == [
+        ["code", "amount", "note"],
+        [0, 0, "ok"],
+        [1, 2, None],
+        [2, 4, "ok"],
+    ]
+
+
+def test_convert_as_text_keeps_values_verbatim(tmp_path):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 2)
+    output_path = tmp_path / "output.xlsx"
+
+    csv_to_xlsx.convert(str(input_path), str(output_path), as_text=True)
+
+    rows = _sheet_values(load_workbook(output_path), "Sheet1")
+    assert rows[1] == ["0000", "0", "ok"]
+    assert rows[2][0] == "0001"
+
+
+def test_convert_rolls_over_to_new_sheet_when_row_limit_is_reached(
+    tmp_path, monkeypatch
+):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 10)
+    output_path = tmp_path / "output.xlsx"
+
+    monkeypatch.setattr(csv_to_xlsx, "MAX_SHEET_ROWS", 5)
+    monkeypatch.setattr(csv_to_xlsx, "CHUNK_SIZE", 3)
+    csv_to_xlsx.convert(str(input_path), str(output_path), as_text=False)
+
+    workbook = load_workbook(output_path)
+    assert workbook.sheetnames == ["Sheet1", "Sheet2", "Sheet3"]
+    assert [len(_sheet_values(workbook, n)) for n in workbook.sheetnames] == [5, 5, 3]
+    assert all(
+        _sheet_values(workbook, n)[0] == ["code", "amount", "note"]
+        for n in workbook.sheetnames
+    )
+
+
+def test_convert_header_only_csv(tmp_path):
+    input_path = tmp_path / "input.csv"
+    _write_csv(input_path, 0)
+    output_path = tmp_path / "output.xlsx"
+
+    csv_to_xlsx.convert(str(input_path), str(output_path))
+
+    rows = _sheet_values(load_workbook(output_path), "Sheet1")
+    assert rows == [["code", "amount", "note"]]
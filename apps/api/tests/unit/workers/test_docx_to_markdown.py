@@ -0,0 +1,88 @@
+import zipfile
+from pathlib import Path
+
+from app.workers.converters import docx_to_markdown
+
+
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d4944415478da63f8cfc0f01f0005000201a3c0b6b80000000049454e44ae426082"
+)
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">
+<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>
+<Default Extension="xml" ContentType="application/xml"/>
+<Default Extension="png" ContentType="image/png"/>
+<Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>
+</Types>"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/>
+</Relationships>"""
+
+DOCUMENT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rIdImg" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="media/image1.png"/>
+</Relationships>"""
+
+IMAGE_RUN = """<w:r><w:drawing><wp:inline>
+<wp:docPr id="1" name="Imagem" descr="logo"/>
+<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">
+<pic:pic><pic:blipFill><a:blip r:embed="rIdImg"/></pic:blipFill></pic:pic>
+</a:graphicData></a:graphic>
+</wp:inline></w:drawing></w:r>"""
+
+
+def _document_xml(with_image):
+    image = f"<w:p>{IMAGE_RUN}</w:p>" if with_image else ""
+    return f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+ xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+ xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+ xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"
+ xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">
+<w:body><w:p><w:r><w:t>Relatório mensal</w:t></w:r></w:p>{image}</w:body>
+</w:document>"""
+
+
+def _build_docx(path, with_image):
+    with zipfile.ZipFile(path, "w") as docx:
+        docx.writestr("[Content_Types].xml", CONTENT_TYPES)
+        docx.writestr("_rels/.rels", ROOT_RELS)
+        docx.writestr("word/document.xml", _document_xml(with_image))
+        if with_image:
+            docx.writestr("word/_rels/document.xml.rels", DOCUMENT_RELS)
+            docx.writestr("word/media/image1.png", PNG_BYTES)
+
+
+def test_document_without_images_is_written_as_markdown(tmp_path):
+    input_path = tmp_path / "input.docx"
+    _build_docx(input_path, with_image=False)
+    output_path = tmp_path / "output.md"
+
+    result = docx_to_markdown.convert(str(input_path), str(output_path))
+
+    assert result == str(output_path)
+    assert "Relatório mensal" in output_path.read_text(encoding="utf-8")
+
+
+def test_images_are_extracted_to_sidecar_files(tmp_path):
+    input_path = tmp_path / "input.docx"
+    _build_docx(input_path, with_image=True)
+    output_path = tmp_path / "output.md"
+
+    result = docx_to_markdown.convert(str(input_path), str(output_path))
+
+    assert Path(result) == tmp_path / "output.zip"
+    with zipfile.ZipFile(result) as bundle:
+        markdown = bundle.read("output.md").decode("utf-8")
+        assert bundle.read("media/image1.png") == PNG_BYTES
+
+    assert "](media/image1.png)" in markdown
+    assert "data:" not in markdown
+
+
+def test_markitdown_instance_is_reused():
+    assert docx_to_markdown.get_markitdown() is docx_to_markdown.get_markitdown()
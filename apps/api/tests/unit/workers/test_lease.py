@@ -0,0 +1,83 @@
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+from app.workers.lease import JobLease
+
+
+def test_lease_is_renewed_while_running():
+    calls = []
+
+    def renew(job_id, claimed_at):
+        calls.append(claimed_at)
+        return claimed_at + timedelta(seconds=1)
+
+    start = datetime(2024, 1, 1)
+    lease = JobLease(uuid4(), start, renew, interval=0.01).start()
+    time.sleep(0.1)
+    lease.stop()
+
+    assert len(calls) >= 2
+    # Cada renovação usa o valor devolvido pela anterior.
+    assert calls[1] == start + timedelta(seconds=1)
+    assert not lease.lost
+
+
+def test_lease_is_lost_when_another_worker_takes_the_job():
+    lease = JobLease(uuid4(), datetime(2024, 1, 1), lambda *_: None, 0.01).start()
+    time.sleep(0.05)
+    lease.stop()
+
+    assert lease.lost
+
+
+def test_transient_renew_errors_do_not_lose_the_lease():
+    def renew(job_id, claimed_at):
+        raise ConnectionError("banco indisponível")
+
+    lease = JobLease(uuid4(), datetime(2024, 1, 1), renew, 0.01).start()
+    time.sleep(0.05)
+    lease.stop()
+
+    assert not lease.lost
+
+
+def test_final_write_is_fenced_by_the_lease(tmp_path):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.domain.entities.document_job import DocumentJob
+    from app.domain.enums.conversion_type import ConversionType
+    from app.domain.enums.job_status import JobStatus
+    from app.infra.db.db import Base
+    from app.infra.models import document_job_model  # noqa: F401
+    from app.repositories.document_repository import DocumentRepository
+
+    engine = create_engine(f"sqlite:///{tmp_path}/jobs.db")
+    Base.metadata.create_all(bind=engine)
+    repo = DocumentRepository(sessionmaker(bind=engine)())
+    job = DocumentJob(
+        conversion_type=ConversionType.CSV_TO_JSON,
+        input_filename="a.csv",
+        input_path="/c/a.csv",
+        output_path="/o/a.json",
+    )
+    repo.save(job)
+
+    stale = repo.claim(job.id, lease_seconds=60)
+    stale_claimed_at = stale.updated_at
+    # Outro worker assumiu o job (lease vencido) depois do último renovar.
+    repo.db.execute(
+        document_job_model.DocumentJobModel.__table__.update().values(
+            updated_at=stale.updated_at - timedelta(minutes=5)
+        )
+    )
+    repo.db.commit()
+    owner = repo.claim(job.id, lease_seconds=60)
+
+    stale.mark_completed(stale.output_path)
+    assert repo.finish(stale, stale_claimed_at) is False
+
+    owner_claimed_at = owner.updated_at
+    owner.mark_failed("erro")
+    assert repo.finish(owner, owner_claimed_at) is True
+    assert repo.get_status(job.id) == JobStatus.FAILED
+    engine.dispose()
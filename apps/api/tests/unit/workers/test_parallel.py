@@ -0,0 +1,30 @@
+from app.config import config
+from app.workers import parallel
+from app.workers.parallel import pool_size
+
+
+def test_pool_is_split_between_concurrent_conversions(monkeypatch):
+    monkeypatch.setattr(config, "CONVERTER_MAX_WORKERS", 8)
+    monkeypatch.setattr(config, "WORKER_POOL", "prefork")
+    monkeypatch.setattr(config, "WORKER_AUTOSCALE", "")
+    monkeypatch.setattr(config, "WORKER_CONCURRENCY", 4)
+    assert pool_size() == 2
+
+    monkeypatch.setattr(config, "WORKER_AUTOSCALE", "16,2")
+    assert pool_size() == 1
+
+    monkeypatch.setattr(config, "WORKER_POOL", "solo")
+    assert pool_size() == 8
+
+
+def test_isolated_pool_fits_in_the_memory_ceiling(monkeypatch):
+    monkeypatch.setattr(config, "CONVERTER_MAX_WORKERS", 8)
+    monkeypatch.setattr(config, "WORKER_POOL", "solo")
+    monkeypatch.setattr(config, "CONVERTER_POOL_WORKER_MEMORY_MB", 256)
+
+    monkeypatch.setattr(parallel, "_memory_budget_mb", 512)
+    assert pool_size() == 2
+    monkeypatch.setattr(parallel, "_memory_budget_mb", 100)
+    assert pool_size() == 1
+    monkeypatch.setattr(parallel, "_memory_budget_mb", None)
+    assert pool_size() == 8
@@ -0,0 +1,41 @@
+from fpdf import FPDF
+
+from app.config import config
+from app.workers.converters import pdf_to_text
+
+
+def _build_pdf(path, pages):
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=12)
+    for number in range(1, pages + 1):
+        pdf.add_page()
+        pdf.cell(text=f"Pagina {number}")
+    pdf.output(str(path))
+
+
+def test_pages_are_written_in_order_across_shards(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.pdf"
+    _build_pdf(input_path, 7)
+    output_path = tmp_path / "output.txt"
+
+    monkeypatch.setattr(pdf_to_text, "PAGES_PER_SHARD", 2)
+    monkeypatch.setattr(config, "CONVERTER_MAX_WORKERS", 3)
+    pdf_to_text.convert(str(input_path), str(output_path))
+
+    expected = "\n\n".join(f"Pagina {n}" for n in range(1, 8))
+    assert output_path.read_text(encoding="utf-8") == expected
+
+
+def test_page_range_and_max_pages_limit_extraction(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.pdf"
+    _build_pdf(input_path, 30)
+    output_path = tmp_path / "output.txt"
+
+    monkeypatch.setattr(pdf_to_text, "PAGES_PER_SHARD", 2)
+    monkeypatch.setattr(config, "CONVERTER_MAX_WORKERS", 1)
+    pdf_to_text.convert(
+        str(input_path), str(output_path), pages="2-3, 12, 28-", max_pages=4
+    )
+
+    expected = "\n\n".join(f"Pagina {n}" for n in (2, 3, 12, 28))
+    assert output_path.read_text(encoding="utf-8") == expected
@@ -0,0 +1,52 @@
+import json
+import zipfile
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from app.domain.enums.conversion_type import ConversionType
+from app.workers.registry import ConverterRegistry
+
+
+def _build_workbook(path, sheets):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+
+def test_xlsx_to_json_keeps_intermediates_out_of_output_dir(tmp_path):
+    input_path = tmp_path / "input.xlsx"
+    _build_workbook(input_path, {"Dados": [["id", "nome"], [1, "Ana"]]})
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    output_path = output_dir / "job.json"
+
+    convert = ConverterRegistry().get(ConversionType.XLSX_TO_JSON)
+    result = convert(str(input_path), str(output_path))
+
+    assert Path(result) == output_path
+    assert list(output_dir.iterdir()) == [output_path]
+    assert json.loads(output_path.read_text(encoding="utf-8")) == [
+        {"id": 1, "nome": "Ana"}
+    ]
+
+
+def test_multi_file_stage_runs_remaining_stages_per_member(tmp_path):
+    input_path = tmp_path / "input.xlsx"
+    _build_workbook(
+        input_path,
+        {"Vendas": [["produto"], ["a"]], "Clientes": [["nome"], ["Ana"]]},
+    )
+    output_path = tmp_path / "job.json"
+
+    convert = ConverterRegistry().get(ConversionType.XLSX_TO_JSON)
+    result = convert(str(input_path), str(output_path))
+
+    assert Path(result) == tmp_path / "job.zip"
+    with zipfile.ZipFile(result) as bundle:
+        assert bundle.namelist() == ["01_Vendas.json", "02_Clientes.json"]
+        assert json.loads(bundle.read("02_Clientes.json")) == [{"nome": "Ana"}]
@@ -0,0 +1,52 @@
+from app.workers import progress
+from app.workers.progress import ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _reporter(events, clock, max_per_second=2):
+    return ProgressReporter(
+        "job",
+        "client",
+        max_per_second=max_per_second,
+        publish=lambda event, data: events.append(data["progress"]),
+        clock=clock,
+    )
+
+
+def test_reports_are_throttled_and_last_value_wins():
+    events, clock = [], FakeClock()
+    reporter = _reporter(events, clock)
+
+    for done in range(1, 101):
+        reporter.report(done, 100)
+        clock.now += 0.01
+
+    reporter.flush()
+
+    # 1 s de chamadas a 2 eventos/s: o primeiro, um no meio e o último.
+    assert events == [1.0, 51.0, 100.0]
+
+
+def test_pipeline_spans_map_stage_progress_into_the_job_range():
+    events, clock = [], FakeClock()
+    reporter = _reporter(events, clock, max_per_second=0)
+    token = progress._current.set(reporter)
+    try:
+        with progress.progress_span(0.5, 1.0):
+            with progress.progress_span(0.0, 0.5):
+                progress.report_progress(1, 2)
+    finally:
+        progress._current.reset(token)
+
+    assert events == [62.5]
+
+
+def test_report_progress_without_active_job_is_a_noop():
+    progress.report_progress(5, 10)
@@ -0,0 +1,51 @@
+from uuid import uuid4
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.domain.entities.client_storage import ClientStorage
+from app.infra.db.db import Base
+from app.infra.models import client_storage_model  # noqa: F401
+from app.repositories.client_storage_repository import ClientStorageRepository
+from app.workers.tasks import reconcile_storage
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/storage.db")
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(bind=engine)
+
+
+def _client_with_size(sessions, size: int):
+    client_id = uuid4()
+    storage = ClientStorage.create_new(client_id)
+    storage.size_bytes = size
+    ClientStorageRepository(sessions()).save(storage)
+    return client_id
+
+
+def test_recorded_size_is_replaced_by_the_measured_one(sessions, monkeypatch):
+    client_id = _client_with_size(sessions, 100)
+    monkeypatch.setattr(reconcile_storage, "_client_usage", lambda _: 250)
+
+    drift = reconcile_storage._reconcile_client(client_id, sessions)
+
+    assert drift == 150
+    assert ClientStorageRepository(sessions()).get_size(client_id) == 250
+
+
+def test_write_during_the_measurement_is_not_counted_twice(sessions, monkeypatch):
+    client_id = _client_with_size(sessions, 100)
+
+    def measure_while_uploading(_):
+        # Upload de 50 bytes registrado no meio da varredura; o arquivo já
+        # está no disco e entra na medição.
+        ClientStorageRepository(sessions()).update_size(client_id, 50)
+        return 150
+
+    monkeypatch.setattr(reconcile_storage, "_client_usage", measure_while_uploading)
+
+    drift = reconcile_storage._reconcile_client(client_id, sessions)
+
+    assert drift is None
+    assert ClientStorageRepository(sessions()).get_size(client_id) == 150
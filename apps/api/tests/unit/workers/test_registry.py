@@ -0,0 +1,15 @@
+from app.domain.enums.conversion_type import ConversionType
+from app.workers.converters import csv_to_json
+from app.workers.registry import ConverterRegistry
+
+
+def test_registry_resolves_every_conversion_type_once():
+    registry = ConverterRegistry()
+
+    registry.load()
+    first = {t: registry.get(t) for t in ConversionType}
+    registry.load()
+
+    assert all(callable(func) for func in first.values())
+    assert registry.get(ConversionType.CSV_TO_NDJSON) is csv_to_json.convert_ndjson
+    assert {t: registry.get(t) for t in ConversionType} == first
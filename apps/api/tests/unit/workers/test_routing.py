@@ -0,0 +1,50 @@
+import pytest
+from app.config import config
+from app.domain.enums.conversion_type import ConversionType
+from app.entrypoints.worker import build_worker_args
+from app.workers.routing import ALL_QUEUES, queue_for
+
+
+def test_conversions_are_routed_by_converter_class():
+    assert queue_for(ConversionType.CSV_TO_JSON) == "conversions.light"
+    assert queue_for(ConversionType.XLSX_TO_CSV) == "conversions.cpu"
+    assert queue_for(ConversionType.DOCX_TO_PDF) == "conversions.subprocess"
+    # Pipeline que passa pelo LibreOffice vai para a fila dele.
+    assert queue_for("docx_to_text") == "conversions.subprocess"
+
+
+def test_worker_consumes_all_queues_by_default(monkeypatch):
+    monkeypatch.setattr(config, "WORKER_POOL", "prefork")
+    monkeypatch.setattr(config, "WORKER_CONCURRENCY", 4)
+    monkeypatch.setattr(config, "WORKER_AUTOSCALE", "")
+    monkeypatch.setattr(config, "WORKER_QUEUES", "")
+
+    args = build_worker_args()
+
+    assert "--pool=prefork" in args
+    assert "--concurrency=4" in args
+    assert f"--queues={','.join(ALL_QUEUES)}" in args
+
+
+def test_worker_fleet_with_threads_and_own_queue(monkeypatch):
+    monkeypatch.setattr(config, "WORKER_POOL", "threads")
+    monkeypatch.setattr(config, "WORKER_CONCURRENCY", 2)
+    monkeypatch.setattr(config, "WORKER_AUTOSCALE", "")
+    monkeypatch.setattr(config, "WORKER_QUEUES", "conversions.subprocess")
+
+    args = build_worker_args()
+
+    assert "--pool=threads" in args
+    assert "--queues=conversions.subprocess" in args
+
+
+def test_autoscale_requires_prefork(monkeypatch):
+    monkeypatch.setattr(config, "WORKER_AUTOSCALE", "8,2")
+    monkeypatch.setattr(config, "WORKER_POOL", "prefork")
+    args = build_worker_args()
+    assert "--autoscale=8,2" in args
+    assert not any(arg.startswith("--concurrency") for arg in args)
+
+    monkeypatch.setattr(config, "WORKER_POOL", "threads")
+    with pytest.raises(ValueError):
+        build_worker_args()
@@ -0,0 +1,100 @@
+import pytest
+from app.config import config
+from app.domain.enums.conversion_type import ConversionType
+from app.workers import scheduling
+from app.workers.scheduling import (
+    FAST_LANE_PRIORITY,
+    MIN_PRIORITY,
+    NORMAL_PRIORITY,
+    SLOT_DENIED,
+    SLOT_HELD,
+    SLOT_TAKEN,
+    FairScheduler,
+    estimate_cost,
+    priority_for,
+)
+
+MB = 1024 * 1024
+
+
+def test_cost_grows_with_size_and_converter_weight():
+    small_csv = estimate_cost(ConversionType.CSV_TO_JSON, 1 * MB)
+    large_csv = estimate_cost(ConversionType.CSV_TO_JSON, 500 * MB)
+    small_docx = estimate_cost(ConversionType.DOCX_TO_PDF, 1 * MB)
+
+    assert small_csv < large_csv
+    assert small_csv < small_docx
+    # Pipeline custa a soma das etapas.
+    assert estimate_cost(ConversionType.DOCX_TO_TEXT, MB) == (
+        small_docx + estimate_cost(ConversionType.PDF_TO_TEXT, MB)
+    )
+
+
+def test_small_jobs_take_the_fast_lane(monkeypatch):
+    monkeypatch.setattr(config, "FAST_LANE_MAX_SECONDS", 2)
+    monkeypatch.setattr(config, "FAIR_SHARE_BACKLOG_STEP_SECONDS", 60)
+
+    assert priority_for(0.5, 0) == FAST_LANE_PRIORITY
+    assert priority_for(30, 0) == NORMAL_PRIORITY
+
+
+def test_client_backlog_lowers_priority_down_to_the_floor(monkeypatch):
+    monkeypatch.setattr(config, "FAST_LANE_MAX_SECONDS", 2)
+    monkeypatch.setattr(config, "FAIR_SHARE_BACKLOG_STEP_SECONDS", 60)
+
+    assert priority_for(30, 59) == NORMAL_PRIORITY
+    assert priority_for(30, 120) == NORMAL_PRIORITY - 2
+    assert priority_for(30, 10_000) == MIN_PRIORITY
+    # Um arquivo pequeno de um cliente novo passa à frente desse backlog.
+    assert priority_for(0.5, 0) > priority_for(0.5, 600)
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    fakeredis = pytest.importorskip("fakeredis")
+    monkeypatch.setattr(config, "FAST_LANE_MAX_SECONDS", 2)
+    monkeypatch.setattr(config, "FAIR_SHARE_BACKLOG_STEP_SECONDS", 60)
+    return FairScheduler(
+        fakeredis.FakeRedis(decode_responses=True), max_inflight=1, ttl=100
+    )
+
+
+def test_backlog_is_tracked_per_job_and_finish_is_idempotent(scheduler):
+    assert scheduler.admit("c1", "job-1", 120) == NORMAL_PRIORITY
+    assert scheduler.admit("c1", "job-2", 30) == NORMAL_PRIORITY - 2
+
+    # Entrega duplicada que também chame finish não desconta duas vezes.
+    scheduler.finish("c1", "job-1")
+    scheduler.finish("c1", "job-1")
+
+    assert scheduler.admit("c1", "job-3", 30) == NORMAL_PRIORITY
+    assert scheduler.admit("c2", "job-4", 30) == NORMAL_PRIORITY
+
+
+def test_stale_jobs_leave_the_backlog_one_at_a_time(scheduler, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(scheduling.time, "time", lambda: now)
+    scheduler.admit("c1", "lost", 600)
+
+    now += 50
+    scheduler.admit("c1", "job-1", 120)
+    # Novas entradas não renovam a perdida: ela sai quando passa do TTL.
+    now += 60
+    assert scheduler.admit("c1", "job-2", 30) == NORMAL_PRIORITY - 2
+
+
+def test_running_slot_is_kept_by_the_job_that_holds_it(scheduler, monkeypatch):
+    now = 1_000_000.0
+    monkeypatch.setattr(scheduling.time, "time", lambda: now)
+
+    assert scheduler.acquire("c1", "job-1") == SLOT_TAKEN
+    assert scheduler.acquire("c1", "job-2") == SLOT_DENIED
+    # Reentrega do mesmo job não ocupa outra vaga.
+    assert scheduler.acquire("c1", "job-1") == SLOT_HELD
+
+    scheduler.release("c1", "job-1")
+    assert scheduler.acquire("c1", "job-2") == SLOT_TAKEN
+
+    # Vaga de um worker morto expira sozinha.
+    now += 101
+    assert scheduler.acquire("c1", "job-3") == SLOT_TAKEN
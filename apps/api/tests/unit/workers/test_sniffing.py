@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from app.workers.converters import csv_to_json
+from app.workers.converters.sniffing import CsvSniffError, sniff_csv
+
+
+def test_detects_semicolon_cp1252_without_bom(tmp_path):
+    path = tmp_path / "vendas.csv"
+    content = "nome;cidade;valor\nJoão;São Paulo;10,5\nAna;Brasília;3\n"
+    path.write_bytes(content.encode("cp1252"))
+
+    dialect = sniff_csv(path)
+
+    assert dialect.encoding == "cp1252"
+    assert dialect.delimiter == ";"
+    assert dialect.has_header
+
+
+def test_detects_utf8_bom_tabs_and_missing_header(tmp_path):
+    path = tmp_path / "dados.tsv"
+    path.write_bytes("\ufeff1\t2.5\tx\n2\t3.0\ty\n3\t4.5\tz\n".encode("utf-8"))
+
+    dialect = sniff_csv(path)
+
+    assert dialect.encoding == "utf-8-sig"
+    assert dialect.delimiter == "\t"
+    assert not dialect.has_header
+
+
+def test_quoted_delimiters_do_not_change_detection(tmp_path):
+    path = tmp_path / "quoted.csv"
+    path.write_text('id,descricao\n1,"a; b; c"\n2,"d; e"\n', encoding="utf-8")
+
+    dialect = sniff_csv(path)
+
+    assert dialect.delimiter == ","
+    assert dialect.quotechar == '"'
+
+
+def test_binary_content_fails_before_parsing(tmp_path):
+    path = tmp_path / "fake.csv"
+    path.write_bytes(b"PK\x03\x04\x00\x00\x08\x00" * 100)
+
+    with pytest.raises(CsvSniffError):
+        sniff_csv(path)
+
+
+def test_csv_to_json_reads_brazilian_csv_as_columns(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_bytes("nome;cidade\nJoão;São Paulo\n".encode("cp1252"))
+    output_path = tmp_path / "output.json"
+
+    csv_to_json.convert(str(input_path), str(output_path))
+
+    assert json.loads(output_path.read_text(encoding="utf-8")) == [
+        {"nome": "João", "cidade": "São Paulo"}
+    ]
@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import tempfile
+import time
+import pytest
+from app.workers.supervisor import (
+    ConversionLimitExceeded,
+    ConversionLimits,
+    ConverterProcessError,
+    run_isolated,
+)
+from app.workers.parallel import imap_ordered
+
+
+LIMITS = ConversionLimits(memory_mb=512, timeout_seconds=30, cpu_seconds=30)
+
+
+def _write(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+
+def _slow_pid(_):
+    time.sleep(0.2)
+    return os.getpid()
+
+
+def _pool_pids():
+    return sorted(set(imap_ordered(_slow_pid, range(4), max_workers=2)))
+
+
+def test_child_of_a_daemon_process_can_still_use_a_pool(monkeypatch):
+    # Como num filho do prefork do Celery.
+    monkeypatch.setitem(multiprocessing.current_process()._config, "daemon", True)
+
+    pids = run_isolated(_pool_pids, (), LIMITS)
+
+    assert len(pids) == 2
+    assert os.getpid() not in pids
+
+
+def test_pool_children_are_not_charged_for_the_memory_of_the_parent():
+    # Herdado pelo fork: no RSS contaria uma vez por processo do grupo
+    # (filho + 2 do pool), passando do limite de 512 MB.
+    ballast = bytearray(b"x" * (150 * 1024 * 1024))
+
+    pids = run_isolated(_pool_pids, (), LIMITS)
+
+    assert len(pids) == 2
+    assert len(ballast)
+
+
+def test_returns_the_child_result_and_keeps_its_output(tmp_path):
+    output = tmp_path / "out.txt"
+
+    result = run_isolated(_write, (str(output), "ok"), LIMITS)
+
+    assert result == str(output)
+    assert output.read_text() == "ok"
+
+
+def test_child_exception_becomes_a_conversion_error():
+    def fail():
+        raise ValueError("arquivo inválido")
+
+    with pytest.raises(ConverterProcessError, match="arquivo inválido"):
+        run_isolated(fail, (), LIMITS)
+
+
+def test_child_is_killed_after_the_wall_timeout():
+    limits = ConversionLimits(memory_mb=512, timeout_seconds=1, cpu_seconds=30)
+
+    started = time.monotonic()
+    with pytest.raises(ConversionLimitExceeded, match="Tempo limite"):
+        run_isolated(time.sleep, (30,), limits)
+
+    assert time.monotonic() - started < 5
+
+
+def test_child_is_killed_above_the_memory_ceiling():
+    limits = ConversionLimits(memory_mb=64, timeout_seconds=30, cpu_seconds=30)
+
+    def allocate():
+        data = bytearray(256 * 1024 * 1024)
+        time.sleep(5)
+        return len(data)
+
+    with pytest.raises(ConversionLimitExceeded, match="memória"):
+        run_isolated(allocate, (), limits)
+
+
+def test_child_temporary_files_are_removed():
+    def leak():
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        return path
+
+    path = run_isolated(leak, (), LIMITS)
+
+    assert not os.path.exists(path)
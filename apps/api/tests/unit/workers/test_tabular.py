@@ -0,0 +1,95 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.workers.converters import csv_to_columnar, tabular
+from app.workers.converters.sniffing import CsvDialect
+
+
+def _collect(input_path, **kwargs):
+    tables = []
+    tabular.read_csv_into(
+        input_path, lambda reader: tables.append(reader.read_all()), **kwargs
+    )
+    return tables[-1]
+
+
+def test_csv_to_parquet_and_arrow_keep_column_types(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("id,nome,valor\n1,Ana,2.5\n2,Bruno,\n", encoding="utf-8")
+
+    csv_to_columnar.convert_parquet(str(input_path), str(tmp_path / "out.parquet"))
+    csv_to_columnar.convert_arrow(str(input_path), str(tmp_path / "out.arrow"))
+
+    parquet = pq.read_table(tmp_path / "out.parquet")
+    with pa.memory_map(str(tmp_path / "out.arrow")) as source:
+        arrow = pa.ipc.open_file(source).read_all()
+
+    for table in (parquet, arrow):
+        assert table.schema.types == [pa.int64(), pa.string(), pa.float64()]
+        assert table.to_pylist()[1] == {"id": 2, "nome": "Bruno", "valor": None}
+
+
+def test_streaming_type_conflict_is_reread_as_text(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    rows = [f"{i},x" for i in range(2000)] + ["abc,y"]
+    input_path.write_text("codigo,nome\n" + "\n".join(rows), encoding="utf-8")
+
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(tabular, "BLOCK_SIZE", 1024)
+    table = _collect(input_path)
+
+    assert table.schema.field("codigo").type == pa.string()
+    assert table.num_rows == 2001
+    assert table.column("codigo")[-1].as_py() == "abc"
+
+
+def test_type_conflict_demotes_only_the_offending_columns(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    rows = [f"{i},{i},{i * 2},{i}.5" for i in range(2000)]
+    rows += ["2000,abc,4000,1.5", "2001,7,1.5,2.5"]
+    input_path.write_text("id,codigo,qtd,valor\n" + "\n".join(rows), encoding="utf-8")
+
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(tabular, "BLOCK_SIZE", 1024)
+    table = _collect(input_path)
+
+    assert table.schema.types == [pa.int64(), pa.string(), pa.float64(), pa.float64()]
+    assert table.to_pylist()[-2:] == [
+        {"id": 2000, "codigo": "abc", "qtd": 4000.0, "valor": 1.5},
+        {"id": 2001, "codigo": "7", "qtd": 1.5, "valor": 2.5},
+    ]
+
+
+def test_invalid_bytes_past_the_first_block_keep_the_types(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.csv"
+    rows = [f"{i},nome {i}".encode() for i in range(2000)] + [b"2000,S\xe3o"]
+    input_path.write_bytes(b"id,nome\n" + b"\n".join(rows))
+
+    monkeypatch.setattr(tabular, "WHOLE_FILE_THRESHOLD_BYTES", 0)
+    monkeypatch.setattr(tabular, "BLOCK_SIZE", 1024)
+    # Como o sniffer veria pela amostra do início do arquivo.
+    dialect = CsvDialect(encoding="utf-8", columns=("id", "nome"))
+    table = _collect(input_path, dialect=dialect)
+
+    assert table.schema.types == [pa.int64(), pa.string()]
+    assert table.to_pylist()[-1] == {"id": 2000, "nome": "S\ufffdo"}
+
+
+def test_non_utf8_input_is_transcoded(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_bytes("cidade;uf\nSão Paulo;SP\n".encode("cp1252"))
+
+    table = _collect(input_path, max_rows=1)
+
+    assert table.to_pylist() == [{"cidade": "São Paulo", "uf": "SP"}]
+
+
+def test_duplicate_header_names_are_renamed_like_pandas(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("a,b,a,a.1\n1,2,3,4\n", encoding="utf-8")
+
+    table = _collect(input_path)
+
+    assert table.column_names == ["a", "b", "a.2", "a.1"]
+    assert table.to_pylist() == [{"a": 1, "b": 2, "a.2": 3, "a.1": 4}]
+    assert tabular.dedup_column_names(["x", "x", "x"]) == ["x", "x.1", "x.2"]
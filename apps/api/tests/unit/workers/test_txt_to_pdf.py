@@ -0,0 +1,64 @@
+import pdfplumber
+
+from app.workers.converters import txt_to_pdf
+
+
+def _extract_text(path):
+    with pdfplumber.open(path) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+def test_convert_lays_out_every_line_in_order(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(
+        "\n".join(f"linha {n}" for n in range(120)) + "\n", encoding="utf-8"
+    )
+    output_path = tmp_path / "output.pdf"
+
+    txt_to_pdf.convert(input_path, output_path)
+
+    pages = _extract_text(output_path)
+    text = "\n".join(pages)
+    assert len(pages) > 1
+    assert "linha 0" in text
+    assert "linha 119" in text
+    assert text.index("linha 50") < text.index("linha 51")
+
+
+def test_wrap_breaks_long_lines_at_spaces():
+    widths = {ord(c): 1 for c in "abc "}
+
+    segments = list(txt_to_pdf._wrap("aaa bbb ccc", widths, max_width=7))
+
+    assert segments == ["aaa bbb", "ccc"]
+
+
+def test_wrap_hard_breaks_words_wider_than_the_line():
+    widths = {ord("x"): 1}
+
+    assert list(txt_to_pdf._wrap("x" * 10, widths, max_width=4)) == [
+        "xxxx",
+        "xxxx",
+        "xx",
+    ]
+
+
+def test_convert_falls_back_for_non_utf8_input(tmp_path):
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes("ação e emoção".encode("cp1252"))
+    output_path = tmp_path / "output.pdf"
+
+    txt_to_pdf.convert(input_path, output_path)
+
+    assert "ação e emoção" in _extract_text(output_path)[0]
+
+
+def test_cached_font_is_reusable_across_documents(tmp_path):
+    for index, content in enumerate(["primeiro documento", "segundo: ñ ü ç"]):
+        input_path = tmp_path / f"input_{index}.txt"
+        input_path.write_text(content, encoding="utf-8")
+        output_path = tmp_path / f"output_{index}.pdf"
+
+        txt_to_pdf.convert(input_path, output_path)
+
+        assert content in _extract_text(output_path)[0]
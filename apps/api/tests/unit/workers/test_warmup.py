@@ -0,0 +1,43 @@
+import json
+
+from app.domain.enums.conversion_type import ConversionType
+from app.workers.registry import ConverterRegistry
+from app.workers.warmup import (
+    default_warm_up_types,
+    report_readiness,
+    warm_up_converters,
+)
+
+
+def test_self_test_runs_every_in_process_converter():
+    types = default_warm_up_types()
+    assert ConversionType.DOCX_TO_PDF not in types
+    assert ConversionType.XLSX_TO_JSON not in types
+
+    results = warm_up_converters(ConverterRegistry(), types)
+
+    assert [r.conversion_type for r in results] == [t.value for t in types]
+    assert all(r.ok for r in results), [r for r in results if not r.ok]
+    assert all(r.first_run_seconds is not None for r in results)
+
+
+def test_failed_self_test_is_reported_and_readiness_still_written(tmp_path):
+    registry = ConverterRegistry()
+    registry.load()
+
+    def broken(input_path, output_path):
+        raise RuntimeError("dependência ausente")
+
+    registry._converters[ConversionType.CSV_TO_JSON] = broken
+    results = warm_up_converters(
+        registry, [ConversionType.CSV_TO_JSON, ConversionType.CSV_TO_NDJSON]
+    )
+
+    ready_file = tmp_path / "ready"
+    report_readiness(results, str(ready_file))
+
+    report = json.loads(ready_file.read_text())
+    assert [c["error"] for c in report["converters"]] == [
+        "dependência ausente",
+        None,
+    ]
@@ -0,0 +1,122 @@
+import csv
+import io
+import os
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from app.workers.converters import xlsx_to_csv
+
+
+def _build_workbook(path, sheets):
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for name, rows in sheets.items():
+        sheet = workbook.create_sheet(name)
+        for row in rows:
+            sheet.append(row)
+    workbook.save(path)
+
+
+def _read_csv(text):
+    return list(csv.reader(io.StringIO(text)))
+
+
+@pytest.mark.parametrize("engine", ["calamine", "openpyxl"])
+def test_single_sheet_is_written_to_output_path(tmp_path, monkeypatch, engine):
+    input_path = tmp_path / "input.xlsx"
+    _build_workbook(input_path, {"Dados": [["id", "valor"], [1, 2.5], [2, None]]})
+    output_path = tmp_path / "output.csv"
+
+    monkeypatch.setattr(xlsx_to_csv.config, "XLSX_READER_ENGINE", engine)
+    result = xlsx_to_csv.convert(str(input_path), str(output_path))
+
+    assert result == str(output_path)
+    assert _read_csv(output_path.read_text(encoding="utf-8")) == [
+        ["id", "valor"],
+        ["1", "2.5"],
+        ["2", ""],
+    ]
+
+
+def test_multiple_sheets_are_bundled_in_zip(tmp_path, monkeypatch):
+    input_path = tmp_path / "input.xlsx"
+    _build_workbook(
+        input_path,
+        {
+            "Vendas": [["produto", "qtd"], ["a", 3]],
+            "Clientes 2024": [["nome"], ["Ana"], ["Bruno"]],
+        },
+    )
+    output_path = tmp_path / "output.csv"
+
+    monkeypatch.setattr(xlsx_to_csv.config, "CONVERTER_MAX_WORKERS", 2)
+    result = xlsx_to_csv.convert(str(input_path), str(output_path))
+
+    assert Path(result) == tmp_path / "output.zip"
+    assert not output_path.exists()
+
+    with zipfile.ZipFile(result) as bundle:
+        assert bundle.namelist() == ["01_Vendas.csv", "02_Clientes_2024.csv"]
+        clientes = _read_csv(bundle.read("02_Clientes_2024.csv").decode("utf-8"))
+
+    assert clientes == [["nome"], ["Ana"], ["Bruno"]]
+
+
+_PEAK_GROWTH_SCRIPT = """
+import sys
+from app.config import config
+from app.workers.converters import xlsx_to_csv
+
+
+def status_kb(field):
+    with open("/proc/self/status") as f:
+        return next(int(l.split()[1]) for l in f if l.startswith(field))
+
+
+if sys.argv[3] != "default":
+    config.XLSX_READER_ENGINE = sys.argv[3]
+# Aquece imports e alocador com uma planilha mínima antes de medir.
+xlsx_to_csv.convert(sys.argv[4], sys.argv[2])
+base = status_kb("VmRSS")
+xlsx_to_csv.convert(sys.argv[1], sys.argv[2])
+# VmHWM e não ru_maxrss, que o execve herda do processo do pytest.
+print(status_kb("VmHWM") - base)
+"""
+
+
+def _peak_growth_kb(input_path, output_path, engine, warmup_path):
+    # Processo novo: o pico de RSS do pytest não diz nada sobre a conversão.
+    env = {**os.environ, "PYTHONPATH": str(Path(xlsx_to_csv.__file__).parents[3])}
+    args = [input_path, output_path, engine, warmup_path]
+    result = subprocess.run(
+        [sys.executable, "-c", _PEAK_GROWTH_SCRIPT, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout.split()[-1])
+
+
+@pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="requer /proc")
+def test_default_reader_does_not_load_the_whole_sheet(tmp_path):
+    warmup_path = tmp_path / "pequena.xlsx"
+    _build_workbook(warmup_path, {"Dados": [["id"], [1]]})
+    input_path = tmp_path / "grande.xlsx"
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("Dados")
+    for i in range(12_000):
+        sheet.append([i * column + 0.5 for column in range(16)])
+    workbook.save(input_path)
+    output_path = str(tmp_path / "output.csv")
+
+    args = (str(input_path), output_path)
+    default = _peak_growth_kb(*args, "default", str(warmup_path))
+    whole_sheet = _peak_growth_kb(*args, "calamine", str(warmup_path))
+
+    assert default * 3 < whole_sheet
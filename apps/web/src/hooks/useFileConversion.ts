@@ -6,30 +6,44 @@ import { ensureClientId } from '@/services/auth';
 
 export type ConversionType =
   | 'csv_to_json'
+  | 'csv_to_ndjson'
   | 'csv_to_xlsx'
+  | 'csv_to_parquet'
+  | 'csv_to_arrow'
   | 'xlsx_to_csv'
   | 'txt_to_pdf'
   | 'pdf_to_text'
   | 'docx_to_pdf'
-  | 'docx_to_markdown';
+  | 'docx_to_markdown'
+  | 'docx_to_text'
+  | 'xlsx_to_json'
+  | 'xlsx_to_parquet'
+  | 'xlsx_to_arrow';
 
 const CONVERSION_LABELS: Record<ConversionType, string> = {
   csv_to_json: 'CSV → JSON',
+  csv_to_ndjson: 'CSV → NDJSON',
   csv_to_xlsx: 'CSV → Excel (.xlsx)',
+  csv_to_parquet: 'CSV → Parquet',
+  csv_to_arrow: 'CSV → Arrow (.arrow)',
   xlsx_to_csv: 'Excel → CSV',
   txt_to_pdf: 'Texto → PDF',
   pdf_to_text: 'PDF → Texto',
   docx_to_pdf: 'Word → PDF',
   docx_to_markdown: 'Word → Markdown',
+  docx_to_text: 'Word → Texto',
+  xlsx_to_json: 'Excel → JSON',
+  xlsx_to_parquet: 'Excel → Parquet',
+  xlsx_to_arrow: 'Excel → Arrow (.arrow)',
 };
 
 const CONVERSIONS_BY_INPUT: Record<string, ConversionType[]> = {
-  csv: ['csv_to_json', 'csv_to_xlsx'],
-  xlsx: ['xlsx_to_csv'],
-  xls: ['xlsx_to_csv'],
+  csv: ['csv_to_json', 'csv_to_ndjson', 'csv_to_xlsx', 'csv_to_parquet', 'csv_to_arrow'],
+  xlsx: ['xlsx_to_csv', 'xlsx_to_json', 'xlsx_to_parquet', 'xlsx_to_arrow'],
+  xls: ['xlsx_to_csv', 'xlsx_to_json', 'xlsx_to_parquet', 'xlsx_to_arrow'],
   txt: ['txt_to_pdf'],
   pdf: ['pdf_to_text'],
-  docx: ['docx_to_pdf', 'docx_to_markdown'],
+  docx: ['docx_to_pdf', 'docx_to_markdown', 'docx_to_text'],
 };
 
 const FALLBACK: ConversionType[] = [];
@@ -34,6 +34,10 @@ export function useSocket() {
       window.dispatchEvent(new CustomEvent('conversion:completed', { detail: data }));
     });
 
+    socket.on('job_progress', data => {
+      window.dispatchEvent(new CustomEvent('conversion:progress', { detail: data }));
+    });
+
     socket.on('job_failed', data => {
       toast.error(`Falha no processamento do job ${data.job_id}`, {
         duration: 10000,
@@ -41,6 +45,15 @@ export function useSocket() {
       });
     });
 
+    socket.on('batch_completed', data => {
+      toast.success(`Lote concluído: ${data.completed} de ${data.total} arquivos convertidos`, {
+        duration: 10000,
+        description: data.failed ? `${data.failed} com falha` : undefined,
+      });
+
+      window.dispatchEvent(new CustomEvent('conversion:batch_completed', { detail: data }));
+    });
+
     socket.on('auth_error', data => {
       toast.error(data.message, { duration: 8000 });
       socket.disconnect();